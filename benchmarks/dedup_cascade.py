@@ -0,0 +1,82 @@
+import sys
+import time
+import random
+import difflib
+from typing import List
+
+from model.dedup import WindowDeduplicator
+from model.log_parser import LogEntry, parse_log_entries
+
+
+def plain_window_deduplicate(contents: List[str], threshold: float, window_size: int = 5) -> List[int]:
+    """逐对直接计算 SequenceMatcher.ratio 的滑动窗口去重（级联判定之前的实现），返回保留的下标"""
+    kept_indexes = []
+    recent: List[str] = []
+    for index, content in enumerate(contents):
+        if any(difflib.SequenceMatcher(None, content, kept).ratio() >= threshold
+               for kept in recent[-window_size:]):
+            continue
+        kept_indexes.append(index)
+        recent.append(content)
+    return kept_indexes
+
+
+def generate_chat_lines(count: int) -> List[str]:
+    """生成短句为主的聊天记录：常用短句、带少量改动的重复发言和骰子指令"""
+    rng = random.Random(0)
+    phrases = ["好的", "收到", "我们进去看看", "这里有什么", "等一下", "哈哈哈", "我同意", "先去图书馆",
+               "检查一下房间", "有人在吗", "KP我想侦查", "那走吧", "？", "嗯", "不太对劲", "我拿起手电筒"]
+    lines = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.1:
+            lines.append(f".r 1d{rng.choice([6, 20, 100])}")
+        elif roll < 0.25 and lines:
+            # 最近几条中的一条，加上或去掉一两个字
+            line = lines[-rng.randrange(1, min(6, len(lines)) + 1)]
+            lines.append(line + rng.choice(["", "啊", "吧", "！"]) if rng.random() < 0.7 else line[:-1] or line)
+        else:
+            lines.append(''.join(rng.choice(phrases) for _ in range(rng.randrange(1, 4))))
+    return lines
+
+
+def main():
+    """
+    滑动窗口去重的基准测试：python -m benchmarks.dedup_cascade [日志文件 | 行数] [阈值]
+    不给文件时生成指定行数（默认50000）的短句聊天记录；
+    检查级联判定与逐对计算 SequenceMatcher.ratio 保留的条目完全相同，输出耗时和每一级的判定次数。
+    """
+    args = sys.argv[1:]
+    if args and not args[0].isdigit():
+        with open(args[0], encoding='utf-8', errors='replace') as f:
+            contents = [entry.content for entry in parse_log_entries(f.read())]
+    else:
+        contents = generate_chat_lines(int(args[0]) if args else 50000)
+    threshold = float(args[1]) if len(args) > 1 else 0.8
+    print(f"{len(contents)} 条，阈值 {threshold}")
+
+    start = time.perf_counter()
+    expected = plain_window_deduplicate(contents, threshold)
+    plain = time.perf_counter() - start
+
+    entries = [LogEntry(id=index, player_name="", timestamp="", content=content)
+               for index, content in enumerate(contents)]
+    # deduplicate 会重新编号，按对象找回原来的下标
+    positions = {id(entry): index for index, entry in enumerate(entries)}
+    deduplicator = WindowDeduplicator(window_size=5)
+    start = time.perf_counter()
+    kept_entries = deduplicator.deduplicate(entries, threshold)
+    cascade = time.perf_counter() - start
+    kept = [positions[id(entry)] for entry in kept_entries]
+
+    print(f"逐对 SequenceMatcher: {plain:.2f} 秒；级联判定: {cascade:.2f} 秒（加速 {plain / cascade:.1f}x）")
+    print(deduplicator.cascade.summary())
+    print(f"counts: {deduplicator.cascade.counts}")
+    if kept != expected:
+        print(f"结果不一致：保留 {len(kept)} 条，逐对比较保留 {len(expected)} 条")
+        sys.exit(1)
+    print(f"结果一致，保留 {len(kept)} 条")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import sys
+import random
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, List, Tuple
+
+from model.log_parser import parse_log_entries
+from .log_parser_parity import reference_parse_log_entries
+
+
+@dataclass
+class BaselineLogEntry:
+    """改为 __slots__ 和驻留字符串之前的 LogEntry，仅用于内存对比"""
+    id: int
+    player_name: str
+    timestamp: str
+    content: str
+    entry_type: str = ""
+
+
+def generate_sample_log(entry_count: int) -> str:
+    """生成内存对比用的日志：少数几个玩家轮流发言，时间戳递增，部分条目带续行"""
+    rng = random.Random(0)
+    players = ["KP", "玩家A", "玩家B", "玩家C", "骰子", "旁观者"]
+    words = ["调查", "图书馆", "检定", "成功", "失败", "我们", "进去", "看看", "这里", "那个", "房间", ".r 1d100"]
+    lines = []
+    for index in range(entry_count):
+        seconds = index * 7
+        timestamp = f"2025-09-21 {seconds // 3600 % 24:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+        lines.append(f"{rng.choice(players)} {timestamp}")
+        lines.append(''.join(rng.choice(words) for _ in range(rng.randrange(3, 15))))
+        if rng.random() < 0.2:
+            lines.append(''.join(rng.choice(words) for _ in range(rng.randrange(3, 15))))
+        lines.append("")
+    return '\n'.join(lines)
+
+
+def traced_size(parse: Callable[[], List]) -> Tuple[int, int]:
+    """解析后仍被条目列表占用的内存（字节）和条目数"""
+    tracemalloc.start()
+    try:
+        entries = parse()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return size, len(entries)
+
+
+def compare_memory(text: str):
+    baseline, count = traced_size(lambda: reference_parse_log_entries(text, entry_class=BaselineLogEntry))
+    current, _ = traced_size(lambda: parse_log_entries(text))
+    if not count:
+        print("没有条目")
+        return
+    print(f"{count} 条")
+    print(f"改写前（dataclass）: {baseline / 2 ** 20:.1f} MB，每条 {baseline / count:.0f} B")
+    print(f"__slots__ + 驻留: {current / 2 ** 20:.1f} MB，每条 {current / count:.0f} B"
+          f"（减少 {(1 - current / baseline) * 100:.0f}%，已含 timestamp_value）")
+
+
+def main():
+    """
+    python -m benchmarks.log_entry_memory [日志文件 | 条目数]
+    用 tracemalloc 比较解析结果占用的内存：改写前的 dataclass 条目与 __slots__ + 驻留字符串的 LogEntry；
+    不给文件时生成指定条目数（默认200000）的日志。
+    """
+    args = sys.argv[1:]
+    if args and not args[0].isdigit():
+        with open(args[0], encoding='utf-8', errors='replace') as f:
+            text = f.read()
+    else:
+        text = generate_sample_log(int(args[0]) if args else 200000)
+    compare_memory(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+import re
+import sys
+import random
+from typing import Iterable, List, Optional, Tuple
+
+from model.log_parser import LogEntry, parse_log_entries
+
+
+def reference_parse_log_entries(text: str, use_timestamp_parsing: bool = True,
+                                entry_class=LogEntry) -> List[LogEntry]:
+    """改写前的解析实现（逐个格式按优先级 search），也用于内存对比（log_entry_memory）；entry_class 为条目的类型"""
+    lines = text.splitlines()
+    entries = []
+    entry_id = 0
+
+    if not use_timestamp_parsing:
+        for line in lines:
+            stripped = line.rstrip('\n')
+            if not stripped.strip():
+                continue
+            entry_id += 1
+            entries.append(entry_class(id=entry_id, player_name="", timestamp="", content=stripped.strip()))
+        return entries
+
+    time_patterns = [
+        r'\d{4}/\d{2}/\d{2}[:] \d{2}:\d{2}:\d{2}',
+        r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}',
+        r'\d{2}-\d{2} \d{2}:\d{2}:\d{2}',
+        r'\d{2}:\d{2}:\d{2}',
+    ]
+    compiled_time = [re.compile(p) for p in time_patterns]
+    player_pattern = re.compile(r'^<([^>]+)>[：:]\s*(.*)')
+
+    current_entry = None
+    for line in lines:
+        stripped = line.rstrip('\n')
+        if not stripped.strip():
+            continue
+
+        match_obj = None
+        for pattern in compiled_time:
+            match = pattern.search(stripped)
+            if match:
+                match_obj = match
+                break
+
+        if match_obj:
+            if current_entry:
+                entries.append(current_entry)
+            entry_id += 1
+            start, end = match_obj.start(), match_obj.end()
+            player_name = stripped[:start].strip().rstrip(' :：')
+            timestamp = re.sub(r'(\d{4}/\d{2}/\d{2}):\s*(\d{2}:\d{2}:\d{2})', r'\1 \2', match_obj.group())
+            current_entry = entry_class(id=entry_id, player_name=player_name, timestamp=timestamp,
+                                     content=stripped[end:].strip())
+        else:
+            player_match = player_pattern.match(stripped)
+            if player_match:
+                if current_entry:
+                    entries.append(current_entry)
+                entry_id += 1
+                current_entry = entry_class(id=entry_id, player_name=player_match.group(1).strip(), timestamp="",
+                                            content=player_match.group(2).strip())
+            elif current_entry:
+                line_content = stripped.strip()
+                if current_entry.content:
+                    current_entry.content += '\n' + line_content
+                else:
+                    current_entry.content = line_content
+
+    if current_entry:
+        entries.append(current_entry)
+
+    if not entries:
+        for line in lines:
+            stripped = line.rstrip('\n')
+            if not stripped.strip():
+                continue
+            entry_id += 1
+            entries.append(entry_class(id=entry_id, player_name="", timestamp="", content=stripped.strip()))
+    return entries
+
+
+# 一致性检查的固定语料：各种时间戳格式、尖括号玩家名、同一行内多个时间戳、全角冒号和无格式文本
+PARITY_CORPUS = [
+    "",
+    "\n\n  \n",
+    "只有正文\n没有任何格式\n\n第三行",
+    "KP 2025-09-21 21:33:30\n开场白\n  第二段  \n\n玩家A 2025-09-21 21:34:02\n好的",
+    "骰子 2026/02/26: 00:00:05\n.r 1d100\n骰子 2026/02/26 00:00:06 没有冒号的斜杠日期",
+    "PL 09-21 21:33:30 月日格式\nOB 21:33:31 只有时间\n续行 12:3\n时间 1:02:03 不足两位",
+    "<KP>: 尖括号格式\n<玩家 B>：全角冒号\n<>: 空名字\n< 空格 >:   正文  \n<未闭合: 续行",
+    "前言续行会被丢弃\nKP 21:00:00 第一条\n续行",
+    "A 21:00:00 正文里还有 2025-09-21 21:33:30\nB 09-21 21:33:30 与 2026/02/26: 00:00:05",
+    "<KP>: 提到 21:00:00 时\n<KP>: 时间 09-21 21:33:30 和 12:00:00\nC: 21:33:30",
+    "张三：: 2025-09-21 21:33:30：正文\n李四 ：2025-09-21 21:33:31:\n  \t  \n王五 2025-13-45 99:99:99 非法日期",
+    "2025-09-21 21:33:30\n没有玩家名\n12:00:00\n12-31 23:59:59",
+    "x 1234-56-78 12:34:56:78 多余的冒号\ny 123:45:67 三位数\nz 12:34:567",
+]
+
+_PARITY_FRAGMENTS = [
+    "KP", "玩家A", "<KP>:", "<B>：", "<x", ">:", ":", "：", " ", "  ", "\t", "正文", "text", ".r 1d100", "=",
+    "2025-09-21 21:33:30", "2026/02/26: 00:00:05", "2026/02/26 00:00:05", "09-21 21:33:30", "21:33:30",
+    "12:3", "1:02:03", "12-31", "2025-13-45 99:99:99", "123:45:67", "00:00:00:00", "<", ">",
+]
+
+
+def random_parity_document(rng) -> str:
+    lines = []
+    for _ in range(rng.randrange(0, 12)):
+        if rng.random() < 0.15:
+            lines.append(rng.choice(["", "   "]))
+            continue
+        lines.append(''.join(rng.choice(_PARITY_FRAGMENTS) for _ in range(rng.randrange(1, 6))))
+    return '\n'.join(lines)
+
+
+def _entry_fields(entries: List[LogEntry]) -> List[Tuple[int, str, str, str]]:
+    return [(entry.id, entry.player_name, entry.timestamp, entry.content) for entry in entries]
+
+
+def check_parity(documents: Iterable[str]) -> Tuple[int, Optional[str]]:
+    """
+    逐篇比较 parse_log_entries 与改写前的实现（开启和关闭时间戳解析两种情况），
+    返回 (比较的篇数, 第一篇结果不同的文本)；全部一致时后者为None。
+    """
+    count = 0
+    for text in documents:
+        for use_timestamp_parsing in (True, False):
+            if (_entry_fields(parse_log_entries(text, use_timestamp_parsing))
+                    != _entry_fields(reference_parse_log_entries(text, use_timestamp_parsing))):
+                return count, text
+        count += 1
+    return count, None
+
+
+# 局部重新解析的修改片段：与显示文本的形式相同（时间戳只显示时间部分），
+# 时间倒退时推断的日期加一天，修改会改变其后条目的日期
+_EDIT_FRAGMENTS = [
+    "KP 21:33:30", "A 23:59:00", "B 00:01:00", "C 12:00:00", "D 21:00:00", "06:00:00",
+    "快到零点", "过了零点", "续行", "正文 12:3", "",
+]
+
+
+def random_edit_document(rng) -> str:
+    lines = []
+    for _ in range(rng.randrange(1, 14)):
+        lines.append(rng.choice(_EDIT_FRAGMENTS))
+    return '\n'.join(lines)
+
+
+def _store_fields(entries) -> List[Tuple[str, str, str, Optional[int]]]:
+    return [(entry.player_name, entry.timestamp, entry.content, entry.timestamp_value) for entry in entries]
+
+
+def check_reparse_parity(rng, edit_count: int) -> Tuple[int, Optional[str]]:
+    """
+    随机修改显示文本中的几行，比较 DocumentModel.reparse_display_lines 局部重新解析后的条目
+    与 parse_log_entries 整体解析同一显示文本的结果（包括排序键 timestamp_value）。
+    返回 (局部处理的修改次数, 第一次结果不同时的说明)；全部一致时后者为None。
+    """
+    from model.document_model import DocumentModel
+
+    model = DocumentModel()
+    local = 0
+    try:
+        for _ in range(edit_count):
+            model.load_file_with_content("", random_edit_document(rng))
+            if not model.entries:
+                continue
+            # 先按显示文本重新载入一次，未修改的条目在显示与解析之间往返不变
+            model.load_file_with_content("", model.get_display_text())
+            if not model.entries:
+                continue
+            old_lines = model.get_display_window(0, len(model.entries)).split('\n')
+            first = rng.randrange(len(old_lines))
+            last = min(len(old_lines), first + rng.randrange(0, 3))
+            inserted = [rng.choice(_EDIT_FRAGMENTS) for _ in range(rng.randrange(0, 3))]
+            new_lines = old_lines[:first] + inserted + old_lines[last:]
+            if new_lines == old_lines:
+                continue
+            splice = model.reparse_display_lines(first, first + max(len(inserted) - 1, 0),
+                                                 len(inserted) - (last - first),
+                                                 lambda start, stop: '\n'.join(new_lines[start:stop]))
+            if splice is None:
+                continue
+            local += 1
+            display_text = model.get_display_text()
+            if _store_fields(model.entries) != _store_fields(parse_log_entries(display_text)):
+                return local, (f"修改前：{old_lines!r}\n修改后：{new_lines!r}\n"
+                               f"局部：{_store_fields(model.entries)!r}\n"
+                               f"整体：{_store_fields(parse_log_entries(display_text))!r}")
+    finally:
+        model.shutdown()
+    return local, None
+
+
+def main():
+    """
+    python -m benchmarks.log_parser_parity [日志文件 ...] [--random 篇数] [--edits 次数]
+    检查解析结果与改写前的实现一致：固定语料 PARITY_CORPUS、随机生成的文本（默认3000篇）及给出的日志文件；
+    再随机修改显示文本（默认3000次），检查局部重新解析与整体解析的结果（含排序键）一致。
+    """
+    files = sys.argv[1:]
+    random_count = 3000
+    edit_count = 3000
+    for option in ('--random', '--edits'):
+        if option in files:
+            index = files.index(option)
+            if option == '--random':
+                random_count = int(files[index + 1])
+            else:
+                edit_count = int(files[index + 1])
+            del files[index:index + 2]
+
+    rng = random.Random(0)
+    sources = [
+        ("固定语料", PARITY_CORPUS),
+        ("随机文本", (random_parity_document(rng) for _ in range(random_count))),
+    ]
+    for path in files:
+        with open(path, encoding='utf-8', errors='replace') as f:
+            sources.append((path, [f.read()]))
+
+    for name, documents in sources:
+        count, mismatch = check_parity(documents)
+        if mismatch is not None:
+            print(f"{name}: 第 {count + 1} 篇结果不一致：\n{mismatch!r}")
+            sys.exit(1)
+        print(f"{name}: {count} 篇，结果一致")
+
+    local, mismatch = check_reparse_parity(random.Random(0), edit_count)
+    if mismatch is not None:
+        print(f"局部重新解析: 第 {local} 次修改结果不一致：\n{mismatch}")
+        sys.exit(1)
+    print(f"局部重新解析: {local} 次修改，结果一致")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import sys
+import time
+
+from model.log_parser import parse_log_entries
+from model.parallel_parser import ParallelLogParser
+
+
+def main():
+    """
+    分段并行解析的基准测试：python -m benchmarks.parallel_parse 日志文件 [重复次数]
+    依次用 1/2/4/8 个工作进程解析，检查结果与顺序解析一致并输出耗时。
+    """
+    if len(sys.argv) < 2:
+        print(main.__doc__)
+        return
+    with open(sys.argv[1], encoding='utf-8', errors='replace') as f:
+        text = f.read()
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        expected = parse_log_entries(text)
+    sequential = (time.perf_counter() - start) / repeat
+    print(f"{len(text)} 字符，{len(expected)} 条；顺序解析: {sequential:.2f} 秒")
+
+    for workers in (1, 2, 4, 8):
+        parser = ParallelLogParser(max_workers=workers, min_chars=0)
+        try:
+            parser.parse(text[:1024])       # 启动进程池，不计入耗时
+            start = time.perf_counter()
+            for _ in range(repeat):
+                entries = parser.parse(text)
+            elapsed = (time.perf_counter() - start) / repeat
+        finally:
+            parser.shutdown()
+        status = "一致" if entries == expected else "不一致"
+        print(f"{workers} 个进程: {elapsed:.2f} 秒（加速 {sequential / elapsed:.2f}x，结果{status}）")
+
+
+if __name__ == "__main__":
+    main()
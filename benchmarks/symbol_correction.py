@@ -0,0 +1,135 @@
+import re
+import sys
+import time
+from typing import Dict
+
+from model.symbol_corrector import (QUOTE_PAIRS, DEFAULT_QUOTE_PAIRS, BRACKET_PAIRS, RIGHT_BRACKETS, SENTENCE_END,
+                                    CHINESE_SYMBOLS, ENGLISH_SYMBOLS, JAPANESE_SYMBOLS,
+                                    correct_chinese_symbols, correct_english_symbols, correct_japanese_symbols)
+
+
+def fix_quotes(text: str, lang: str) -> str:
+    """修正引号：平衡左右引号，动态调整顺序错误，补齐缺失"""
+    configs = QUOTE_PAIRS.get(lang, DEFAULT_QUOTE_PAIRS)
+
+    for left, right in configs:
+        if left == right:
+            # 相同字符引号
+            count = 0
+            result_chars = []
+            for ch in text:
+                if ch == left:
+                    if count == 0:
+                        count = 1
+                    else:
+                        count -= 1
+                    result_chars.append(ch)
+                else:
+                    result_chars.append(ch)
+            if count > 0:
+                result_chars.append(right * count)
+            text = ''.join(result_chars)
+        else:
+            # 不同字符引号，栈匹配
+            stack = []
+            result_chars = []
+            for ch in text:
+                if ch == left:
+                    stack.append(left)
+                    result_chars.append(ch)
+                elif ch == right:
+                    if stack:
+                        stack.pop()
+                        result_chars.append(ch)
+                    else:
+                        result_chars.append(left)
+                        stack.append(left)
+                else:
+                    result_chars.append(ch)
+            for _ in stack:
+                result_chars.append(right)
+            text = ''.join(result_chars)
+    return text
+
+
+def add_period_if_needed(text: str, lang: str) -> str:
+    if not text:
+        return text
+    if len(text) < 10:
+        return text
+    last_char = text[-1]
+    if last_char not in SENTENCE_END:
+        if lang.startswith('zh') or lang == 'ja':
+            text += '。'
+        elif lang == 'en':
+            text += '.'
+        else:
+            text += '.'
+    return text
+
+
+def fix_brackets(text: str) -> str:
+    stack = []
+    result = []
+    left_brackets = set(BRACKET_PAIRS.keys())
+
+    for ch in text:
+        if ch in left_brackets:
+            stack.append(ch)
+        elif ch in RIGHT_BRACKETS:
+            if stack:
+                last = stack[-1]
+                if BRACKET_PAIRS.get(last) == ch:
+                    stack.pop()
+        result.append(ch)
+
+    for left in reversed(stack):
+        result.append(BRACKET_PAIRS[left])
+    return ''.join(result)
+
+
+def correct_step_by_step(text: str, symbols: Dict[str, str], lang: str) -> str:
+    """逐个符号 re.sub 替换后依次修正引号、句号、括号（基准测试中对照用）"""
+    for source, target in symbols.items():
+        text = re.sub(re.escape(source), target, text)
+    text = fix_quotes(text, lang)
+    text = add_period_if_needed(text, lang)
+    return fix_brackets(text)
+
+
+def main():
+    """
+    符号修正的基准测试：python -m benchmarks.symbol_correction 日志文件 [重复次数]
+    对文件的每个非空行分别按中文（简/繁）、英文、日文修正，检查结果与逐步修正一致并输出耗时。
+    """
+    if len(sys.argv) < 2:
+        print(main.__doc__)
+        return
+    with open(sys.argv[1], encoding='utf-8', errors='replace') as f:
+        lines = [line.rstrip('\n') for line in f if line.strip()]
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    print(f"{len(lines)} 行")
+
+    cases = [
+        ('zh_CN', CHINESE_SYMBOLS, lambda text: correct_chinese_symbols(text, 'zh_CN')),
+        ('zh_TW', CHINESE_SYMBOLS, lambda text: correct_chinese_symbols(text, 'zh_TW')),
+        ('en', ENGLISH_SYMBOLS, correct_english_symbols),
+        ('ja', JAPANESE_SYMBOLS, correct_japanese_symbols),
+    ]
+    for lang, symbols, correct in cases:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            expected = [correct_step_by_step(line, symbols, lang) for line in lines]
+        step_by_step = (time.perf_counter() - start) / repeat
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            results = [correct(line) for line in lines]
+        elapsed = (time.perf_counter() - start) / repeat
+        status = "一致" if results == expected else "不一致"
+        print(f"{lang}: 逐步修正 {step_by_step:.3f} 秒，单次扫描 {elapsed:.3f} 秒"
+              f"（加速 {step_by_step / elapsed:.1f}x，结果{status}）")
+
+
+if __name__ == "__main__":
+    main()
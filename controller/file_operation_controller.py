@@ -1,12 +1,9 @@
 import os
-import tkinter as tk
 from tkinter import filedialog
-from typing import Optional
-import threading
-import time
+from typing import Tuple
 
+from controller.task_executor import ModelTask
 from utils.file_manager import FileManager
-from view.progress_window import ProgressWindow
 
 
 class FileOperationController:
@@ -15,7 +12,6 @@ class FileOperationController:
     def __init__(self, main_controller):
         self.main_controller = main_controller
         self.file_manager = None
-        self.progress_window = None
         self._update_file_manager()
 
     def _update_file_manager(self):
@@ -24,6 +20,8 @@ class FileOperationController:
 
     def select_file(self):
         """选择文件"""
+        if self.main_controller.task_executor.busy:
+            return
         self._update_file_manager()
 
         file_path = filedialog.askopenfilename(
@@ -38,84 +36,55 @@ class FileOperationController:
                 )
                 return
 
-            thread = threading.Thread(target=self._load_file_with_progress, args=(file_path,))
-            thread.daemon = True
-            thread.start()
-
-    def _load_file_with_progress(self, file_path: str):
-        """带进度条的文件读取"""
-        self.main_controller.root.after(0, self._create_progress_window, file_path)
-        time.sleep(0.1)
-
-        def progress_callback(current, total, status):
-            if self.progress_window and self.progress_window.window.winfo_exists():
-                self.main_controller.root.after(
-                    0, self.progress_window.update_progress, current, total, status
-                )
+            file_name = os.path.basename(file_path)
+            title = f"{self.main_controller.language_manager.get_text('reading_file')} - {file_name}"
+            self.main_controller.task_executor.submit(
+                title, lambda task: self._load_file(file_path, task), self._finish_file_load
+            )
 
+    def _load_file(self, file_path: str, task: ModelTask) -> Tuple[bool, str]:
+        """在后台线程中读取并解析文件（带进度），返回 (是否成功, 完成或错误信息)；关闭进度窗口时取消，模型保持不变"""
+        language_manager = self.main_controller.language_manager
+        model = self.main_controller.model
         try:
             self._update_file_manager()
-            content, error = self.file_manager.read_file(file_path, progress_callback)
-            self.main_controller.root.after(
-                0, self._handle_file_load_result, file_path, content, error
-            )
-        except Exception as e:
-            self.main_controller.root.after(
-                0, self._handle_file_load_result, file_path, None, str(e)
-            )
-
-    def _create_progress_window(self, file_path: str):
-        """创建进度窗口"""
-        file_name = os.path.basename(file_path)
-        title = f"{self.main_controller.language_manager.get_text('reading_file')} - {file_name}"
-
-        self.progress_window = ProgressWindow(
-            self.main_controller.root,
-            self.main_controller.language_manager,
-            title,
-            100
-        )
-
-    def _handle_file_load_result(self, file_path: str, content: Optional[str], error: Optional[str]):
-        """处理文件读取结果"""
-        if self.progress_window and self.progress_window.window.winfo_exists():
-            if content and not error:
-                complete_message = self.main_controller.language_manager.get_text("file_read_complete")
-                self.progress_window.complete(complete_message)
-                self.main_controller.root.after(
-                    600, lambda: self._finalize_file_load(file_path, content, error)
-                )
+            if os.path.splitext(file_path)[1].lower() == '.txt':
+                # txt文件在映射的缓冲区上按段解码、逐行解析为条目，不经过整段文本
+                status = language_manager.get_text('reading_file_progress')
+                mapped, error = self.file_manager.read_file(file_path, task.report, mmap_mode=True)
+                if error:
+                    return False, error
+                with mapped:
+                    success, message_key = model.load_mapped_file(file_path, mapped, task.report, status,
+                                                                  task.cancelled)
             else:
-                self.progress_window.close()
+                content, error = self.file_manager.read_file(file_path, task.report)
                 if error:
-                    self.main_controller.view.show_error(error)
-        else:
-            self._finalize_file_load(file_path, content, error)
-
-    def _finalize_file_load(self, file_path: str, content: Optional[str], error: Optional[str]):
-        """最终处理文件加载"""
-        if error:
-            self.main_controller.view.show_error(error)
-            return
-
-        if not content:
-            self.main_controller.view.show_error("文件内容为空")
-            return
-
-        success, message_key = self.main_controller.model.load_file_with_content(file_path, content)
-        if not success:
-            self.main_controller.view.show_error(
-                self.main_controller.language_manager.get_text(message_key)
-            )
+                    return False, error
+                if task.cancelled():
+                    return True, language_manager.get_text("process_cancelled")
+                if not content:
+                    return False, language_manager.get_text("file_content_empty")
+                success, message_key = model.load_file_with_content(file_path, content, task.cancelled)
+            if success and message_key != "process_cancelled":
+                message_key = "file_read_complete"
+            return success, language_manager.get_text(message_key)
+        except Exception as e:
+            return False, str(e)
 
-        if self.progress_window and self.progress_window.window.winfo_exists():
-            self.progress_window.close()
-        self.progress_window = None
+    def _finish_file_load(self, task: ModelTask, result: Tuple[bool, str]):
+        """处理文件加载结果（模型已在后台线程中更新，显示由模型的 file_loaded 通知完成）"""
+        success, message = result
+        if success:
+            task.close_progress(message)
+        else:
+            task.close_progress()
+            self.main_controller.view.show_error(message)
 
     def export_file(self):
         """导出文件 - 直接保存视图编辑器中的内容"""
         # 获取编辑器内容
-        editor_content = self.main_controller.view.text_display.get(1.0, tk.END).strip()
+        editor_content = self.main_controller.get_document_text().strip()
         if not editor_content:
             self.main_controller.view.show_error(
                 self.main_controller.language_manager.get_text("no_content_to_export")
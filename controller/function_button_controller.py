@@ -1,9 +1,8 @@
-import threading
-import tkinter as tk
+from typing import Callable, Tuple
+from controller.task_executor import ModelTask
 from view.analysis_window import AnalysisWindow
 from view.help_window import HelpWindow
 from view.support_window import SupportWindow
-from view.progress_window import ProgressWindow
 
 
 class FunctionButtonController:
@@ -11,81 +10,40 @@ class FunctionButtonController:
 
     def __init__(self, main_controller):
         self.main_controller = main_controller
-        self.progress_window = None
-        self._cancel_event = None  # 用于取消长时间操作
 
     def deduplicate(self):
         """去重功能"""
-        self.main_controller.sync_model_with_editor_if_needed()
-        success, message_key = self.main_controller.model.process_text('deduplicate')
-        if not success:
-            self.main_controller.view.show_error(
-                self.main_controller.language_manager.get_text(message_key)
-            )
-        else:
-            self.main_controller.view.display_file_content(
-                self.main_controller.model.get_display_text()
-            )
+        self._run_model_task(
+            "deduplicate",
+            lambda task: self.main_controller.model.process_text('deduplicate', task.report, task.cancelled)
+        )
 
     def spell_check(self):
         """错别字修正（带进度条）"""
-        self.main_controller.sync_model_with_editor_if_needed()
-        if not self.main_controller.model.entries:
-            self.main_controller.view.show_error(
-                self.main_controller.language_manager.get_text("please_load_file_first")
-            )
-            return
-
-        # 创建取消事件
-        self._cancel_event = threading.Event()
-
-        # 创建进度窗口
-        self.progress_window = ProgressWindow(
-            self.main_controller.root,
-            self.main_controller.language_manager,
-            self.main_controller.language_manager.get_text("spell_check") + "...",
-            100
+        self._run_model_task(
+            "spell_check",
+            lambda task: self.main_controller.model.process_text('spell_check', task.report, task.cancelled)
         )
-        # 绑定关闭事件到取消方法
-        self.progress_window.set_cancel_callback(self._cancel_processing)
-
-        def run():
-            def progress_cb(current, total, status):
-                # 检查窗口是否仍然有效，如果无效则设置取消事件
-                if self.progress_window is None or not self.progress_window.window.winfo_exists():
-                    self._cancel_event.set()
-                    return
-                # 更新进度
-                self.main_controller.root.after(
-                    0, self.progress_window.update_progress, current, total, status
-                )
-
-            # 定义停止检查函数
-            def stop_check():
-                return self._cancel_event.is_set()
-
-            success, message_key = self.main_controller.model.process_text(
-                'spell_check', progress_cb, stop_check
-            )
-            self.main_controller.root.after(0, self._finish_processing, success, message_key)
-
-        threading.Thread(target=run, daemon=True).start()
 
     def correct_symbols(self):
         """符号修正"""
-        self.main_controller.sync_model_with_editor_if_needed()
-        success, message_key = self.main_controller.model.process_text('correct_symbols')
-        if not success:
-            self.main_controller.view.show_error(
-                self.main_controller.language_manager.get_text(message_key)
-            )
-        else:
-            self.main_controller.view.display_file_content(
-                self.main_controller.model.get_display_text()
-            )
+        self._run_model_task(
+            "correct_symbols",
+            lambda task: self.main_controller.model.process_text('correct_symbols', task.report, task.cancelled)
+        )
 
     def smart_auto_process(self):
         """智能自动处理（带进度条）"""
+        self._run_model_task(
+            "smart_auto_process",
+            lambda task: self.main_controller.model.smart_auto_process(task.report, task.cancelled)
+        )
+
+    def _run_model_task(self, title_key: str, operation: Callable[[ModelTask], Tuple[bool, str]]):
+        """先同步编辑器内容，再在后台执行修改模型的操作（关闭进度窗口即取消），完成后刷新视图"""
+        executor = self.main_controller.task_executor
+        if executor.busy:
+            return
         self.main_controller.sync_model_with_editor_if_needed()
         if not self.main_controller.model.entries:
             self.main_controller.view.show_error(
@@ -93,67 +51,22 @@ class FunctionButtonController:
             )
             return
 
-        self._cancel_event = threading.Event()
-
-        self.progress_window = ProgressWindow(
-            self.main_controller.root,
-            self.main_controller.language_manager,
-            self.main_controller.language_manager.get_text("smart_auto_process") + "...",
-            100
-        )
-        self.progress_window.set_cancel_callback(self._cancel_processing)
-
-        def run():
-            def progress_cb(current, total, status):
-                if self.progress_window is None or not self.progress_window.window.winfo_exists():
-                    self._cancel_event.set()
-                    return
-                self.main_controller.root.after(
-                    0, self.progress_window.update_progress, current, total, status
-                )
+        title = self.main_controller.language_manager.get_text(title_key) + "..."
+        executor.submit(title, operation, self._finish_processing, title)
 
-            def stop_check():
-                return self._cancel_event.is_set()
-
-            success, message_key = self.main_controller.model.smart_auto_process(progress_cb, stop_check)
-            self.main_controller.root.after(0, self._finish_processing, success, message_key)
-
-        threading.Thread(target=run, daemon=True).start()
-
-    def _cancel_processing(self):
-        """取消处理（由进度窗口关闭时调用）"""
-        if self._cancel_event:
-            self._cancel_event.set()
-
-    def _finish_processing(self, success, message_key):
+    def _finish_processing(self, task: ModelTask, result: Tuple[bool, str]):
         """处理完成后的回调（在主线程中执行）"""
-        # 清理取消事件
-        self._cancel_event = None
-
-        # 如果进度窗口还存在，则更新或关闭它
-        if self.progress_window is not None:
-            try:
-                if self.progress_window.window.winfo_exists():
-                    if success:
-                        self.progress_window.complete(
-                            self.main_controller.language_manager.get_text("process_completed")
-                        )
-                    else:
-                        self.progress_window.close()
-                        self.main_controller.view.show_error(
-                            self.main_controller.language_manager.get_text(message_key)
-                        )
-                else:
-                    self.progress_window = None
-            except tk.TclError:
-                self.progress_window = None
-
-        self.progress_window = None
+        success, message_key = result
+        if success:
+            task.close_progress(self.main_controller.language_manager.get_text(message_key))
+        else:
+            task.close_progress()
+            self.main_controller.view.show_error(
+                self.main_controller.language_manager.get_text(message_key)
+            )
 
-        # 无论窗口是否存在，都要刷新视图（模型已更新）
-        self.main_controller.view.display_file_content(
-            self.main_controller.model.get_display_text()
-        )
+        # 无论是否成功都刷新视图（取消时模型可能已部分更新）
+        self.main_controller.view.show_model_text(self.main_controller.model)
         self.main_controller.update_button_states()
 
     def show_analysis(self):
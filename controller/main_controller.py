@@ -7,6 +7,7 @@ from languages.language_factory import LanguageFactory
 from controller.text_edit_controller import TextEditController
 from controller.file_operation_controller import FileOperationController
 from controller.function_button_controller import FunctionButtonController
+from controller.task_executor import TaskExecutor
 
 
 class MainController:
@@ -18,6 +19,8 @@ class MainController:
 
         self.command_manager = CommandManager()
         self.model.add_observer(self.view)
+        # 修改模型的操作都在后台线程中依次执行
+        self.task_executor = TaskExecutor(self)
 
         self.text_edit_controller = TextEditController(self)
         self.file_operation_controller = FileOperationController(self)
@@ -74,16 +77,31 @@ class MainController:
         self.function_button_controller.show_support()
 
     def sort_by_timestamp(self):
-        """按时间戳排序"""
+        """按时间戳排序（在后台执行）"""
+        if self.task_executor.busy:
+            return
         # 先同步编辑器内容（如果修改过则重新解析）
         self.sync_model_with_editor_if_needed()
-        if self.model.sort_by_timestamp():
-            self.view.display_file_content(self.model.get_display_text())
-            self.update_button_states()
-        else:
+        title = self.language_manager.get_text("sort_by_timestamp") + "..."
+        self.task_executor.submit(title, lambda task: self.model.sort_by_timestamp(task.cancelled),
+                                  self._finish_sort, title)
+
+    def _finish_sort(self, task, sorted_ok: bool):
+        # 排序后的刷新由模型的 entries_updated 通知完成
+        if not sorted_ok:
+            task.close_progress()
             self.view.show_error(
                 self.language_manager.get_text("no_timestamp_to_sort")
             )
+        elif task.cancelled():
+            task.close_progress(self.language_manager.get_text("process_cancelled"))
+        else:
+            task.close_progress(self.language_manager.get_text("process_completed"))
+
+    def shutdown(self):
+        """取消后台任务，关闭解析和错别字修正的工作进程"""
+        self.task_executor.shutdown()
+        self.model.shutdown()
 
     def reparse_from_editor(self):
         """使用编辑器中的文本重新解析为 LogEntry（保留，供内部同步使用）"""
@@ -94,11 +112,80 @@ class MainController:
         self.model.reparse_entries(editor_content)
 
     def sync_model_with_editor_if_needed(self):
-        """如果编辑器内容与模型显示文本不一致，则重新解析编辑器内容"""
+        """
+        如果编辑器内容在上次显示模型文本后被修改过，则将修改同步到模型。
+        能跟踪修改范围时只重新解析修改过的条目，并只刷新编辑器中对应的几行；否则整体重新解析。
+        虚拟显示时编辑器中的行号从显示文本的第 base_line 行开始。
+        """
+        dirty_lines = self.text_edit_controller.dirty_lines
+        virtual_display = self.view.virtual_display
+        if self.text_edit_controller.tracking_edits:
+            if not dirty_lines.dirty:
+                return
+            if not dirty_lines.invalid:
+                base = virtual_display.base_line
+                splice = self.model.reparse_display_lines(
+                    dirty_lines.first + base, dirty_lines.last + base, dirty_lines.line_delta,
+                    self._read_editor_lines
+                )
+                if splice is not None:
+                    self.view.replace_display_lines(*splice)
+                    dirty_lines.reset()
+                    return
+        if virtual_display.active:
+            self._sync_display_window()
+            return
+
         editor_content = self.view.text_display.get(1.0, tk.END).strip()
         model_display = self.model.get_display_text().strip()
         if editor_content != model_display:
             self.reparse_from_editor()
+        else:
+            dirty_lines.reset()
+
+    def _sync_display_window(self):
+        """
+        虚拟显示时编辑器中只有一段条目，无法按行跟踪修改时把这一段与模型比较，不同则重新解析这一段；
+        无法局部处理时与非虚拟显示一样整体重新解析（这一段之前和之后的文本由模型生成）。
+        """
+        virtual_display = self.view.virtual_display
+        base = virtual_display.base_line
+        editor_lines = int(self.view.text_display.index("end-1c").split('.')[0])
+        editor_content = self._read_editor_lines(base, base + editor_lines)
+        if editor_content == self.model.get_display_range(virtual_display.start, virtual_display.stop):
+            self.text_edit_controller.dirty_lines.reset()
+            return
+        splice = self.model.reparse_display_lines(
+            base, base + editor_lines - 1, editor_lines - virtual_display.line_count, self._read_editor_lines
+        )
+        if splice is not None:
+            self.view.replace_display_lines(*splice)
+            self.text_edit_controller.dirty_lines.reset()
+            return
+        parts = (self.model.get_display_range(0, virtual_display.start), editor_content,
+                 self.model.get_display_range(virtual_display.stop, len(self.model.entries)))
+        document = '\n'.join(part for part in parts if part).strip()
+        if not document:
+            self.view.show_error(self.language_manager.get_text("no_content_to_reparse"))
+            return
+        self.model.reparse_entries(document)
+
+    def _read_editor_lines(self, start: int, stop: int) -> str:
+        """显示文本 [start, stop) 行（从0开始）在编辑器中的文本，末尾不带换行符"""
+        base = self.view.virtual_display.base_line
+        text = self.view.text_display.get(f"{start - base + 1}.0", f"{stop - base + 1}.0")
+        return text[:-1] if text.endswith('\n') else text
+
+    def get_document_text(self) -> str:
+        """编辑器中的全文；虚拟显示时编辑器只有一段条目，先把修改同步到模型，再由模型生成全文"""
+        if self.view.virtual_display.active:
+            self.sync_model_with_editor_if_needed()
+            return self.model.get_display_text()
+        return self.view.text_display.get(1.0, tk.END)
+
+    def on_display_refreshed(self):
+        """编辑器内容被替换为模型的显示文本后调用，此后的修改重新开始记录"""
+        self.text_edit_controller.dirty_lines.reset()
 
     def update_button_states(self):
         # 所有按钮保持启用，无需特殊处理
@@ -0,0 +1,107 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from view.progress_window import ProgressWindow, ProgressReporter
+
+
+class ModelTask:
+    """
+    提交给 TaskExecutor 的一个任务。
+    后台函数通过 report 汇报进度（可直接作为 progress_callback）、通过 cancelled 检查是否被取消（可作为 stop_check）；
+    完成回调通过 close_progress 结束进度窗口。
+    """
+
+    def __init__(self, reporter: ProgressReporter):
+        self.reporter = reporter
+        self.future: Optional[Future] = None
+        self.progress_window: Optional[ProgressWindow] = None
+        self._cancel_event = threading.Event()
+        self._progress_closed = False
+
+    def report(self, current: int, total: int, status: str = ""):
+        self.reporter.report(current, total, status)
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def close_progress(self, message: Optional[str] = None):
+        """结束进度窗口（在主线程中调用）：给出 message 时显示完成信息后关闭，否则直接关闭；重复调用无效"""
+        if self._progress_closed:
+            return
+        self._progress_closed = True
+        self.reporter.stop()
+        window = self.progress_window
+        if window is None or not window.running or not window.window.winfo_exists():
+            return
+        if message is not None:
+            window.complete(message)
+        else:
+            window.close()
+
+
+class TaskExecutor:
+    """
+    模型操作的后台执行器。
+    修改模型的操作（加载文件、去重、修正、排序等）都提交到同一个后台线程依次执行，
+    模型不是线程安全的，不能同时有两个操作在修改它；界面线程在此期间保持响应。
+    任务运行时显示模态的进度窗口，关闭窗口即取消任务，窗口在任务停止后才关闭；结果在 Tk 主线程中交给完成回调。
+    """
+
+    def __init__(self, main_controller):
+        self.main_controller = main_controller
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model-task")
+        self.current: Optional[ModelTask] = None
+
+    @property
+    def busy(self) -> bool:
+        """是否有任务正在运行"""
+        return self.current is not None
+
+    def submit(self, title: str, func: Callable[[ModelTask], Any],
+               on_done: Callable[[ModelTask, Any], None], status: str = "") -> Optional[ModelTask]:
+        """
+        在后台线程中执行 func(task)，完成后在主线程中调用 on_done(task, 结果)。
+        title 和 status 为进度窗口的标题和初始状态；已有任务在运行时不提交，返回None。
+        func 抛出异常时不调用 on_done，直接显示处理失败。on_done 没有结束进度窗口时随后直接关闭。
+        """
+        if self.current is not None:
+            return None
+        root = self.main_controller.root
+        task = ModelTask(ProgressReporter(root))
+        self.current = task
+
+        task.progress_window = ProgressWindow(root, self.main_controller.language_manager, title, 100, status)
+        # 任务真正结束前窗口保持模态，避免取消后的任务仍在修改模型时用户编辑界面
+        task.progress_window.set_cancel_callback(task.cancel, wait_for_task=True)
+        task.reporter.attach(task.progress_window)
+
+        task.future = self._pool.submit(func, task)
+        # 完成回调在后台线程中执行，结果转交给Tk主线程
+        task.future.add_done_callback(lambda future: root.after(0, self._finish, task, on_done))
+        return task
+
+    def _finish(self, task: ModelTask, on_done: Callable[[ModelTask, Any], None]):
+        self.current = None
+        try:
+            result = task.future.result()
+        except Exception as e:
+            print(f"后台任务失败: {e}")
+            task.close_progress()
+            self.main_controller.view.show_error(
+                self.main_controller.language_manager.get_text("process_failed")
+            )
+            return
+        try:
+            on_done(task, result)
+        finally:
+            task.close_progress()
+
+    def shutdown(self):
+        """取消正在运行的任务并关闭后台线程（不等待任务结束）"""
+        if self.current is not None:
+            self.current.cancel()
+        self._pool.shutdown(wait=False, cancel_futures=True)
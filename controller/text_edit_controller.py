@@ -1,13 +1,118 @@
 import tkinter as tk
+from typing import Optional
 from controller.base_controller import BaseController
 
 
+class DirtyLines:
+    """
+    记录上次与模型同步以来文本框中修改过的行范围（从0开始，按修改后的行号）以及总行数的变化。
+    插入和删除会使后面的行移动，已记录的范围随之调整。
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.first: Optional[int] = None
+        self.last: Optional[int] = None
+        self.line_delta = 0
+        self.invalid = False        # 遇到无法跟踪的修改，只能整体重新解析
+
+    @property
+    def dirty(self) -> bool:
+        return self.first is not None or self.invalid
+
+    def inserted(self, line: int, newline_count: int):
+        """在第 line 行插入了含 newline_count 个换行符的文本"""
+        if self.first is None:
+            self.first, self.last = line, line + newline_count
+        else:
+            if self.last > line:
+                self.last += newline_count
+            self.first = min(self.first, line)
+            self.last = max(self.last, line + newline_count)
+        self.line_delta += newline_count
+
+    def deleted(self, first_line: int, last_line: int):
+        """删除了从第 first_line 行到第 last_line 行之间的文本（两行合并为一行）"""
+        removed = last_line - first_line
+        if self.first is None:
+            self.first, self.last = first_line, first_line
+        else:
+            if self.last > last_line:
+                self.last -= removed
+            else:
+                self.last = first_line
+            self.first = min(self.first, first_line)
+        self.line_delta -= removed
+
+    def invalidate(self):
+        self.invalid = True
+
+
 class TextEditController(BaseController):
     """文本编辑控制器 - 负责处理用户键盘输入和命令管理"""
 
     def __init__(self, main_controller):
         super().__init__(main_controller)
+        self.dirty_lines = DirtyLines()
+        self.tracking_edits = False
+        self._original_text_command: Optional[str] = None
         self._bind_keyboard_events()
+        self._install_edit_tracking()
+
+    def _install_edit_tracking(self):
+        """
+        把文本框的 Tcl 命令替换为代理：键盘输入、粘贴、撤销重做以及程序中的修改
+        最终都经过 insert / delete / replace 子命令，代理据此记录修改过的行范围。
+        """
+        if not hasattr(self.view, 'text_display'):
+            return
+        text_widget = self.view.text_display
+        widget_command = str(text_widget)
+        self._original_text_command = widget_command + "_original"
+        try:
+            text_widget.tk.call("rename", widget_command, self._original_text_command)
+            text_widget.tk.createcommand(widget_command, self._dispatch_text_command)
+        except tk.TclError as e:
+            print(f"无法跟踪文本修改，同步时将整体重新解析: {e}")
+            return
+        self.tracking_edits = True
+
+    def _line_of(self, index) -> int:
+        """索引所在的行号（从0开始），超出末尾时按最后一行计算"""
+        tk_call = self.view.text_display.tk.call
+        line = int(str(tk_call(self._original_text_command, "index", index)).split('.')[0])
+        last = int(str(tk_call(self._original_text_command, "index", "end-1c")).split('.')[0])
+        return min(line, last) - 1
+
+    def _dispatch_text_command(self, *args):
+        tk_call = self.view.text_display.tk.call
+        command = args[0] if args else ""
+        if command == "insert" and len(args) >= 3:
+            line = self._line_of(args[1])
+            result = tk_call((self._original_text_command,) + args)
+            self.dirty_lines.inserted(line, sum(str(chars).count('\n') for chars in args[2::2]))
+            return result
+        if command == "delete" and len(args) in (2, 3):
+            first = self._line_of(args[1])
+            last = self._line_of(args[2] if len(args) == 3 else f"{args[1]}+1c")
+            result = tk_call((self._original_text_command,) + args)
+            if last >= first:
+                self.dirty_lines.deleted(first, last)
+            return result
+        if command == "replace" and len(args) >= 4:
+            first = self._line_of(args[1])
+            last = self._line_of(args[2])
+            result = tk_call((self._original_text_command,) + args)
+            if last >= first:
+                self.dirty_lines.deleted(first, last)
+            self.dirty_lines.inserted(first, sum(str(chars).count('\n') for chars in args[3::2]))
+            return result
+        if command in ("insert", "delete", "replace"):
+            # 一次删除多个范围等少见用法，不逐一计算
+            self.dirty_lines.invalidate()
+        return tk_call((self._original_text_command,) + args)
 
     def _bind_keyboard_events(self):
         """绑定键盘事件"""
@@ -48,6 +48,7 @@ class ChineseSimplified(BaseLanguage):
             "process_completed": "处理完成",
             "process_failed": "处理失败",
             "process_cancelled": "处理已取消",
+            "cancelling": "正在取消...",
             "smart_process_completed": "智能自动处理完成",
             "smart_process_failed": "智能自动处理失败",
             "smart_process_cancelled": "智能处理已取消",
@@ -231,6 +232,7 @@ class ChineseSimplified(BaseLanguage):
             "unsupported_format": "不支持的文件格式",
             "read_file_error": "读取文件时发生错误",
             "decode_error": "无法解码文件编码",
+            "file_content_empty": "文件内容为空",
             "reading_file_progress": "读取文件中",
             "parsing_docx": "解析Word文档...",
             "converting_doc": "正在转换DOC格式...",
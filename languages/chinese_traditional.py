@@ -48,6 +48,7 @@ class ChineseTraditional(BaseLanguage):
             "process_completed": "處理完成",
             "process_failed": "處理失敗",
             "process_cancelled": "處理已取消",
+            "cancelling": "正在取消...",
             "smart_process_completed": "智能自動處理完成",
             "smart_process_failed": "智能自動處理失敗",
             "smart_process_cancelled": "智能處理已取消",
@@ -231,6 +232,7 @@ class ChineseTraditional(BaseLanguage):
             "unsupported_format": "不支持的文件格式",
             "read_file_error": "讀取文件時發生錯誤",
             "decode_error": "無法解碼文件編碼",
+            "file_content_empty": "文件內容為空",
             "reading_file_progress": "讀取文件中",
             "parsing_docx": "解析Word文檔...",
             "converting_doc": "正在轉換DOC格式...",
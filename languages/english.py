@@ -48,6 +48,7 @@ class English(BaseLanguage):
             "process_completed": "Process completed",
             "process_failed": "Process failed",
             "process_cancelled": "Process cancelled",
+            "cancelling": "Cancelling...",
             "smart_process_completed": "Smart auto process completed",
             "smart_process_failed": "Smart auto process failed",
             "smart_process_cancelled": "Smart process cancelled",
@@ -231,6 +232,7 @@ Project URL: https://github.com/Sam-ie/TPRG-Tool
             "unsupported_format": "Unsupported file format",
             "read_file_error": "Error occurred while reading file",
             "decode_error": "Unable to decode file encoding",
+            "file_content_empty": "File content is empty",
             "reading_file_progress": "Reading file",
             "parsing_docx": "Parsing Word document...",
             "converting_doc": "Converting DOC format...",
@@ -48,6 +48,7 @@ class Japanese(BaseLanguage):
             "process_completed": "処理が完了しました",
             "process_failed": "処理に失敗しました",
             "process_cancelled": "処理がキャンセルされました",
+            "cancelling": "キャンセル中...",
             "smart_process_completed": "スマート自動処理が完了しました",
             "smart_process_failed": "スマート自動処理に失敗しました",
             "smart_process_cancelled": "スマート処理がキャンセルされました",
@@ -231,6 +232,7 @@ RPGログの最適化に特化したテキスト処理ソフトウェア。
             "unsupported_format": "サポートされていないファイル形式",
             "read_file_error": "ファイルの読み取り中にエラーが発生しました",
             "decode_error": "ファイルのエンコーディングをデコードできません",
+            "file_content_empty": "ファイルの内容が空です",
             "reading_file_progress": "ファイルを読み込み中",
             "parsing_docx": "Word文書を解析中...",
             "converting_doc": "DOC形式を変換中...",
@@ -1,16 +1,43 @@
+import time
+
+# 启动计时从导入其他模块之前开始
+_START_TIME = time.perf_counter()
+
+import sys
+import multiprocessing
 import tkinter as tk
 from controller.main_controller import MainController
+from model.text_processor import warm_up_libraries
+from utils.config import Config
+
+
+def _on_first_window(root, app, benchmark: bool):
+    """主窗口第一次显示后调用：记录启动耗时，并在后台导入各语言处理库"""
+    app.startup_time = time.perf_counter() - _START_TIME
+    if benchmark:
+        print(f"启动耗时（到主窗口显示）: {app.startup_time:.3f} 秒")
+        root.destroy()
+        return
+    if Config.WARM_UP_LIBRARIES:
+        warm_up_libraries()
 
 
-def main():
+def main(benchmark: bool = False):
     root = tk.Tk()
 
     # 可以从配置中读取相似度阈值
     similarity_threshold = 0.8  # 可配置参数
 
     app = MainController(root, similarity_threshold)
+    # 等窗口绘制完成、进入空闲后再执行
+    root.after_idle(root.after, 0, _on_first_window, root, app, benchmark)
     root.mainloop()
+    # 取消后台任务，关闭解析和错别字修正的工作进程
+    app.shutdown()
 
 
 if __name__ == "__main__":
-    main()
+    # 打包为可执行文件后，解析和错别字修正的工作进程需要
+    multiprocessing.freeze_support()
+    # python main.py --startup-benchmark：窗口显示后打印启动耗时并退出
+    main(benchmark="--startup-benchmark" in sys.argv[1:])
@@ -0,0 +1,108 @@
+import os
+import pickle
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+# 缓存文件格式版本，格式变化时旧文件直接忽略
+_CACHE_FORMAT = 1
+
+CacheKey = Tuple[str, str, bytes]
+
+
+class CorrectionCache:
+    """
+    错别字修正结果的 LRU 缓存。
+    键为 (语言, 词典版本, 段落哈希)：词典或纠错库变化后版本不同，旧结果自然不会命中。
+    只保存段落的 blake2b 摘要而不保存原文，值为修正后的段落。
+    可保存到磁盘，下次处理同一份（或编辑过的）日志时只需修正变化的段落；dirty 表示有未保存的新结果。
+    """
+
+    def __init__(self, max_entries: int = 100000):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False
+        self._items: "OrderedDict[CacheKey, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(language: str, version: str, paragraph: str) -> CacheKey:
+        digest = hashlib.blake2b(paragraph.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        return language, version, digest
+
+    def get(self, key: CacheKey) -> Optional[str]:
+        with self._lock:
+            value = self._items.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: CacheKey, value: str):
+        with self._lock:
+            if self._items.get(key) != value:
+                self.dirty = True
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def stats(self) -> Dict[str, float]:
+        """命中统计：hits / misses / hit_rate / size"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'size': len(self._items),
+        }
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+            self.dirty = False
+
+    def save(self, path: str) -> bool:
+        """保存到文件（先写临时文件再替换，避免写到一半的文件）"""
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with self._lock:
+                data = (_CACHE_FORMAT, list(self._items.items()))
+                self.dirty = False
+            temp_path = path + ".tmp"
+            with open(temp_path, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+            return True
+        except Exception as e:
+            print(f"保存修正缓存失败 {path}: {e}")
+            self.dirty = True
+            return False
+
+    def load(self, path: str) -> bool:
+        """从文件加载，文件不存在或格式不符时保持为空"""
+        if not os.path.exists(path):
+            return False
+        try:
+            with open(path, 'rb') as f:
+                version, items = pickle.load(f)
+            if version != _CACHE_FORMAT:
+                return False
+            with self._lock:
+                self._items = OrderedDict(items[-self.max_entries:])
+                self.dirty = False
+            return True
+        except Exception as e:
+            print(f"读取修正缓存失败 {path}: {e}")
+            return False
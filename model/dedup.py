@@ -0,0 +1,373 @@
+import difflib
+from collections import deque
+from typing import List, Any, Callable, Dict, Optional, Set, Tuple
+
+# 去重引擎名称
+DEDUP_ENGINES = ('window', 'minhash')
+
+_HASH_MASK = (1 << 61) - 1
+
+
+def content_similarity(a: str, b: str) -> float:
+    """两段正文的相似度（与 difflib.SequenceMatcher.ratio 相同）"""
+    return difflib.SequenceMatcher(None, a, b).ratio()
+
+
+def length_bound(a: str, b: str) -> float:
+    """仅由长度得到的相似度上限，不低于 content_similarity(a, b)（与 real_quick_ratio 相同）"""
+    total = len(a) + len(b)
+    return 2.0 * min(len(a), len(b)) / total if total else 1.0
+
+
+class KeptText:
+    """已保留的正文及其时间戳排序键，附带按需创建并缓存的 SequenceMatcher（seq2 为该正文）"""
+    __slots__ = ('text', 'timestamp_value', '_matcher')
+
+    def __init__(self, text: str, timestamp_value: Optional[int] = None):
+        self.text = text
+        self.timestamp_value = timestamp_value
+        self._matcher: Optional[difflib.SequenceMatcher] = None
+
+    @property
+    def matcher(self) -> difflib.SequenceMatcher:
+        if self._matcher is None:
+            # seq2 的索引和字符计数只建一次，之后与多条新正文比较都复用
+            self._matcher = difflib.SequenceMatcher(None, "", self.text)
+        return self._matcher
+
+    def release(self):
+        """释放缓存的 SequenceMatcher"""
+        self._matcher = None
+
+
+class SimilarityCascade:
+    """
+    判断 ratio(content, kept) >= threshold，按代价从低到高逐级检查：
+      1. exact：正文完全相同，直接判定相似
+      2. length：长度上限（即 real_quick_ratio）不足阈值，排除
+      3. quick：quick_ratio（字符计数上限）不足阈值，排除
+      4. full：完整的 SequenceMatcher.ratio
+    前几级都是 ratio 的上限且计算公式相同，结果与直接比较 ratio 完全一致。
+    counts 记录每一级判定的比较次数。
+    """
+
+    STAGES = ('exact', 'length', 'quick', 'full_match', 'full_reject')
+
+    def __init__(self):
+        self.counts: Dict[str, int] = dict.fromkeys(self.STAGES, 0)
+
+    def reset(self):
+        self.counts = dict.fromkeys(self.STAGES, 0)
+
+    def is_similar(self, content: str, kept: KeptText, threshold: float) -> bool:
+        counts = self.counts
+        text = kept.text
+        if content == text and threshold <= 1:
+            counts['exact'] += 1
+            return True
+        if length_bound(content, text) < threshold:
+            counts['length'] += 1
+            return False
+        matcher = kept.matcher
+        matcher.set_seq1(content)
+        if matcher.quick_ratio() < threshold:
+            counts['quick'] += 1
+            return False
+        if matcher.ratio() >= threshold:
+            counts['full_match'] += 1
+            return True
+        counts['full_reject'] += 1
+        return False
+
+    def summary(self) -> str:
+        total = sum(self.counts.values())
+        return f"比较 {total} 次：" + "，".join(f"{stage} {self.counts[stage]}" for stage in self.STAGES)
+
+
+# ========== 基类 ==========
+class BaseDeduplicator:
+    """
+    去重引擎基类。按顺序遍历条目，与窗口内保留的条目比较，相似度达到阈值的视为重复并丢弃。
+    窗口由固定容量的环形缓冲区（deque）加正文计数字典组成：
+      - window_size：最多保留最近多少条参与比较，None 表示不限
+      - time_window：只与时间戳在当前条目之前 time_window 秒以内的条目比较，None 表示不限；
+        没有时间戳的条目不会因时间而移出窗口
+      - 完全相同的正文通过计数字典以 O(1) 判定，长会话的内存占用也只与窗口大小有关
+    子类实现 is_duplicate / add，需要在条目移出窗口时清理自身状态的子类重写 _forget。
+    两两比较统一经过 cascade，统计保存在 cascade.counts 中。
+    """
+
+    def __init__(self, window_size: Optional[int] = None, time_window: Optional[int] = None):
+        self.window_size = window_size
+        self.time_window = time_window
+        self.cascade = SimilarityCascade()
+        self._window: deque = deque()                  # KeptText，按保留顺序
+        self._exact: Dict[str, int] = {}               # 正文 -> 在窗口中的条数
+
+    def reset(self):
+        """开始一次新的去重前清空状态"""
+        self.cascade.reset()
+        self._window = deque()
+        self._exact = {}
+
+    def is_duplicate(self, content: str, threshold: float) -> bool:
+        """判断正文是否与窗口内保留的条目重复"""
+        raise NotImplementedError
+
+    def add(self, content: str, timestamp_value: Optional[int] = None):
+        """记录一条保留的正文"""
+        raise NotImplementedError
+
+    def expire(self, timestamp_value: Optional[int]):
+        """将时间早于 timestamp_value - time_window 的条目移出窗口"""
+        if self.time_window is None or timestamp_value is None:
+            return
+        limit = timestamp_value - self.time_window
+        window = self._window
+        while window and window[0].timestamp_value is not None and window[0].timestamp_value < limit:
+            self._evict()
+
+    def _is_exact_repeat(self, content: str, threshold: float) -> bool:
+        if threshold <= 1 and content in self._exact:
+            self.cascade.counts['exact'] += 1
+            return True
+        return False
+
+    def _remember(self, kept: KeptText):
+        self._window.append(kept)
+        self._exact[kept.text] = self._exact.get(kept.text, 0) + 1
+        if self.window_size is not None and len(self._window) > self.window_size:
+            self._evict()
+
+    def _evict(self):
+        kept = self._window.popleft()
+        count = self._exact[kept.text] - 1
+        if count:
+            self._exact[kept.text] = count
+        else:
+            del self._exact[kept.text]
+        self._forget(kept)
+
+    def _forget(self, kept: KeptText):
+        """条目移出窗口时调用"""
+        pass
+
+    def deduplicate(self, entries: List[Any], threshold: float,
+                    skip_condition: Callable[[Any], bool] = None,
+                    progress_callback: Optional[Callable[[int, int, str], None]] = None,
+                    stop_check: Optional[Callable[[], bool]] = None) -> Optional[List[Any]]:
+        """
+        :param entries: 条目列表
+        :param threshold: 相似度阈值
+        :param skip_condition: 函数，接受一个条目，返回 True 表示该条目无条件保留（不参与去重）
+        :param progress_callback: 每处理一个条目汇报一次进度 (已处理数, 总数, "")
+        :param stop_check: 每个条目处理前检查，返回 True 时停止
+        :return: 去重后的条目列表（已重新编号）；被取消时返回None，条目编号保持不变
+        """
+        if skip_condition is None:
+            skip_condition = lambda e: False
+
+        self.reset()
+        result = []
+        total = len(entries)
+        for done, entry in enumerate(entries, 1):
+            if stop_check and stop_check():
+                return None
+            if progress_callback:
+                progress_callback(done, total, "")
+            if skip_condition(entry):
+                result.append(entry)
+                continue
+            content = entry.content
+            timestamp_value = getattr(entry, 'timestamp_value', None)
+            self.expire(timestamp_value)
+            if not self.is_duplicate(content, threshold):
+                result.append(entry)
+                self.add(content, timestamp_value)
+
+        # 重新编号
+        for idx, entry in enumerate(result, start=1):
+            entry.id = idx
+        return result
+
+
+# ========== 滑动窗口（原有算法） ==========
+class WindowDeduplicator(BaseDeduplicator):
+    """与窗口内保留的条目（默认最近5条）逐一比较相似度"""
+
+    def __init__(self, window_size: Optional[int] = 5, time_window: Optional[int] = None):
+        super().__init__(window_size, time_window)
+
+    def is_duplicate(self, content: str, threshold: float) -> bool:
+        if self._is_exact_repeat(content, threshold):
+            return True
+        is_similar = self.cascade.is_similar
+        for kept in self._window:
+            if is_similar(content, kept, threshold):
+                return True
+        return False
+
+    def add(self, content: str, timestamp_value: Optional[int] = None):
+        self._remember(KeptText(content, timestamp_value))
+
+
+# ========== MinHash / LSH ==========
+class MinHashDeduplicator(BaseDeduplicator):
+    """
+    基于字符 shingle 的 MinHash 签名 + LSH 分段，在任意大的窗口（或整个日志）内查找近似重复。
+      - 签名：单次哈希分桶（one permutation hashing），空桶从右侧最近的非空桶借值，
+        每条正文只需对每个 shingle 计算一次哈希
+      - LSH：签名切成 bands 段，任意一段完全相同的已保留条目成为候选
+      - 候选再用 SequenceMatcher 复核，结果不会出现误判（只可能漏掉极少数相似但签名差异大的条目）
+    相似度阈值 t 按 Dice 与 Jaccard 的关系换算为 Jaccard 阈值 t / (2 - t)，
+    分段方式选择在该 Jaccard 值下仍能以 recall 的概率成为候选的最粗分段。
+    :param window_size: 参与比较的最近保留条目数，None 表示整个日志
+    """
+
+    def __init__(self, window_size: Optional[int] = None, time_window: Optional[int] = None,
+                 num_perm: int = 64, shingle_size: int = 3, recall: float = 0.95):
+        super().__init__(window_size, time_window)
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.recall = recall
+        self._bands = 0
+        self._rows = 0
+        self._threshold: Optional[float] = None
+        self._serial = 0
+        self._contents: Dict[int, _SignedText] = {}          # 序号 -> 保留的正文
+        self._buckets: Dict[Tuple, Set[int]] = {}            # (段号, 段内签名) -> 序号集合
+        self._pending_keys: Optional[List[Tuple]] = None
+
+    def reset(self):
+        super().reset()
+        self._threshold = None
+        self._serial = 0
+        self._contents = {}
+        self._buckets = {}
+        self._pending_keys = None
+
+    @staticmethod
+    def choose_bands(num_perm: int, jaccard: float, recall: float) -> Tuple[int, int]:
+        """选择 (bands, rows)：Jaccard 为 jaccard 时成为候选的概率不低于 recall，且每段行数尽量多"""
+        best = (num_perm, 1)
+        for rows in range(1, num_perm + 1):
+            if num_perm % rows:
+                continue
+            bands = num_perm // rows
+            if 1 - (1 - jaccard ** rows) ** bands >= recall:
+                best = (bands, rows)
+        return best
+
+    def _configure(self, threshold: float):
+        jaccard = threshold / (2 - threshold) if threshold < 2 else 1.0
+        jaccard = min(max(jaccard, 0.0), 1.0)
+        self._bands, self._rows = self.choose_bands(self.num_perm, jaccard, self.recall)
+        self._threshold = threshold
+
+    def _shingles(self, content: str) -> Set[str]:
+        size = self.shingle_size
+        if len(content) <= size:
+            return {content}
+        return {content[i:i + size] for i in range(len(content) - size + 1)}
+
+    def signature(self, content: str) -> List[int]:
+        num_perm = self.num_perm
+        empty = _HASH_MASK + 1
+        bins = [empty] * num_perm
+        for shingle in self._shingles(content):
+            h = hash(shingle) & _HASH_MASK
+            slot = h % num_perm
+            value = h // num_perm
+            if value < bins[slot]:
+                bins[slot] = value
+        if empty in bins:
+            # 空桶按环形顺序借用右侧最近的非空桶，并加上距离偏移以区分来源
+            filled = [i for i, v in enumerate(bins) if v != empty]
+            if not filled:
+                return bins
+            densified = list(bins)
+            next_filled = filled[0] + num_perm
+            for i in range(num_perm - 1, -1, -1):
+                if bins[i] != empty:
+                    next_filled = i
+                else:
+                    distance = next_filled - i
+                    densified[i] = bins[next_filled % num_perm] + distance * (_HASH_MASK + 1)
+            bins = densified
+        return bins
+
+    def _band_keys(self, content: str) -> List[Tuple]:
+        sig = self.signature(content)
+        bands = self._bands
+        # 每段按步长取签名位置而不是取连续位置，避免一段里都是从同一个非空桶借来的值
+        return [(band, tuple(sig[band:bands * self._rows:bands])) for band in range(bands)]
+
+    def is_duplicate(self, content: str, threshold: float) -> bool:
+        if threshold != self._threshold:
+            if self._contents:
+                raise ValueError("同一次去重中不能修改相似度阈值")
+            self._configure(threshold)
+        self._pending_keys = None
+        if self._is_exact_repeat(content, threshold):
+            return True
+
+        keys = self._band_keys(content)
+        candidates = set()
+        buckets = self._buckets
+        for key in keys:
+            serials = buckets.get(key)
+            if serials:
+                candidates |= serials
+        contents = self._contents
+        is_similar = self.cascade.is_similar
+        for serial in sorted(candidates, reverse=True):
+            kept = contents[serial]
+            similar = is_similar(content, kept, threshold)
+            # 整个日志范围内保留的正文很多，不长期缓存 SequenceMatcher
+            kept.release()
+            if similar:
+                return True
+        self._pending_keys = keys
+        return False
+
+    def add(self, content: str, timestamp_value: Optional[int] = None):
+        keys = self._pending_keys if self._pending_keys is not None else self._band_keys(content)
+        self._pending_keys = None
+        self._serial += 1
+        kept = _SignedText(content, timestamp_value, self._serial, keys)
+        self._contents[kept.serial] = kept
+        for key in keys:
+            self._buckets.setdefault(key, set()).add(kept.serial)
+        self._remember(kept)
+
+    def _forget(self, kept: "_SignedText"):
+        del self._contents[kept.serial]
+        for key in kept.keys:
+            serials = self._buckets[key]
+            serials.discard(kept.serial)
+            if not serials:
+                del self._buckets[key]
+
+
+class _SignedText(KeptText):
+    """MinHashDeduplicator 中保留的正文，附带序号和 LSH 桶键"""
+    __slots__ = ('serial', 'keys')
+
+    def __init__(self, text: str, timestamp_value: Optional[int], serial: int, keys: List[Tuple]):
+        super().__init__(text, timestamp_value)
+        self.serial = serial
+        self.keys = keys
+
+
+# ========== 工厂 ==========
+class DeduplicatorFactory:
+    @staticmethod
+    def create(engine: str = 'window', **options) -> BaseDeduplicator:
+        engines = {
+            'window': WindowDeduplicator,
+            'minhash': MinHashDeduplicator,
+        }
+        engine_class = engines.get(engine)
+        if engine_class is None:
+            raise ValueError(f"不支持的去重引擎: {engine}")
+        return engine_class(**options)
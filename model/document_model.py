@@ -1,155 +1,60 @@
-import re
-from typing import List, Tuple, Optional, Any, Callable
-from dataclasses import dataclass
+import time
+from array import array
+from bisect import bisect_right
+from itertools import accumulate, repeat
+from typing import List, Dict, Tuple, Optional, Any, Callable, Iterable, Iterator, Union
 from .language_detector import LanguageDetector
+from .log_parser import (LogEntry, LogParser, TimestampKeyBuilder, SECONDS_PER_DAY, is_entry_head,
+                         iter_log_entries)
+from .parallel_parser import ParallelLogParser
+from .entry_store import EntryStore, EntryView
 from .text_processor import TextProcessorManager
-
-
-@dataclass
-class LogEntry:
-    """表示一条日志记录"""
-    id: int                     # 条目序号（从1开始）
-    player_name: str            # 玩家名（可能为空）
-    timestamp: str              # 时间戳字符串（可能为空）
-    content: str                # 正文内容（可能跨行，用换行符分隔）
-    entry_type: str = ""        # 类型：KP, PL, OB, BOT（由_classify_entry_types设置）
-
-
-def parse_log_entries(text: str, use_timestamp_parsing: bool = True) -> List[LogEntry]:
-    """
-    将原始文本解析为 LogEntry 列表。
-    支持标准时间戳格式和尖括号玩家名格式（无时间戳）。
-    时间戳格式（按优先级）：
-      - YYYY-MM-DD HH:MM:SS
-      - YYYY/MM/DD: HH:MM:SS 或 YYYY/MM/DD HH:MM:SS
-      - MM-DD HH:MM:SS
-      - HH:MM:SS
-    尖括号格式：<player_name>: content 或 <player_name>：content
-    """
-    lines = text.splitlines()
-    entries = []
-    entry_id = 0
-
-    if not use_timestamp_parsing:
-        for line in lines:
-            stripped = line.rstrip('\n')
-            if not stripped.strip():
-                continue
-            entry_id += 1
-            entries.append(LogEntry(
-                id=entry_id,
-                player_name="",
-                timestamp="",
-                content=stripped.strip()
-            ))
-        return entries
-
-    # 时间戳匹配模式
-    time_patterns = [
-        r'\d{4}/\d{2}/\d{2}[:] \d{2}:\d{2}:\d{2}',     # 2026/02/26: 00:00:05 或 2026/02/26 00:00:05
-        r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}',        # 2025-09-21 21:33:30
-        r'\d{2}-\d{2} \d{2}:\d{2}:\d{2}',              # 09-21 21:33:30
-        r'\d{2}:\d{2}:\d{2}',                          # 21:33:30
-    ]
-    compiled_time = [re.compile(p) for p in time_patterns]
-
-    # 尖括号玩家名模式（无时间戳）
-    player_pattern = re.compile(r'^<([^>]+)>[：:]\s*(.*)')
-
-    current_entry: Optional[LogEntry] = None
-
-    for line in lines:
-        stripped = line.rstrip('\n')
-        if not stripped.strip():
-            continue
-
-        # 1. 尝试匹配时间戳
-        match_obj = None
-        for pattern in compiled_time:
-            match = pattern.search(stripped)
-            if match:
-                match_obj = match
-                break
-
-        if match_obj:
-            # 有时间戳，开始新条目
-            if current_entry:
-                entries.append(current_entry)
-
-            entry_id += 1
-            start, end = match_obj.start(), match_obj.end()
-            player_name = stripped[:start].strip()
-            player_name = player_name.rstrip(' :：')
-            timestamp = match_obj.group()
-            # 标准化时间戳：将日期和时间之间的冒号（如果有）替换为空格
-            timestamp = re.sub(r'(\d{4}/\d{2}/\d{2}):\s*(\d{2}:\d{2}:\d{2})', r'\1 \2', timestamp)
-            rest = stripped[end:].strip()
-            current_entry = LogEntry(
-                id=entry_id,
-                player_name=player_name,
-                timestamp=timestamp,
-                content=rest
-            )
-        else:
-            # 2. 无时间戳，尝试匹配尖括号玩家名
-            player_match = player_pattern.match(stripped)
-            if player_match:
-                # 新条目（无时间戳）
-                if current_entry:
-                    entries.append(current_entry)
-
-                entry_id += 1
-                player_name = player_match.group(1).strip()
-                content = player_match.group(2).strip()
-                current_entry = LogEntry(
-                    id=entry_id,
-                    player_name=player_name,
-                    timestamp="",
-                    content=content
-                )
-            else:
-                # 3. 既无时间戳也无玩家名，作为当前条目的续行
-                if current_entry:
-                    line_content = stripped.strip()
-                    if line_content:
-                        if current_entry.content:
-                            current_entry.content += '\n' + line_content
-                        else:
-                            current_entry.content = line_content
-
-    if current_entry:
-        entries.append(current_entry)
-
-    # 如果最终没有任何条目（全空行），则将非空行作为无格式条目处理
-    if not entries:
-        entry_id = 0
-        for line in lines:
-            stripped = line.rstrip('\n')
-            if not stripped.strip():
-                continue
-            entry_id += 1
-            entries.append(LogEntry(
-                id=entry_id,
-                player_name="",
-                timestamp="",
-                content=stripped.strip()
-            ))
-
-    return entries
+from utils.text_reader import TextFileReader, MappedTextFile
+from utils.config import Config
 
 
 class DocumentModel:
-    def __init__(self, similarity_threshold: float = 0.8):
+    def __init__(self, similarity_threshold: float = 0.8, dedup_engine: str = Config.DEDUP_ENGINE):
         self.file_path: str = ""
-        self.entries: List[LogEntry] = []
+        self._entries: EntryStore = EntryStore()
+        # 显示文本的缓存：各条目占用的行数（含条目后的空行）、行号前缀和与整段文本，
+        # 对应 _display_state 记录的条目集合及其版本；_shown_state 为编辑器当前显示的版本
+        self._display_state: Optional[Tuple[EntryStore, int]] = None
+        self._display_line_counts = array('i')
+        self._display_line_starts: Optional[List[int]] = None
+        self._display_text: Optional[str] = None
+        self._shown_state: Optional[Tuple[EntryStore, int]] = None
+        # 最近一次分类时的玩家统计和类型，局部重新解析时增量更新；条目集合替换或正文被批量修改时失效
+        self._player_stats: Optional[Dict[str, List[int]]] = None
+        self._player_types: Optional[Dict[str, str]] = None
         self.detected_language: str = "zh_CN"
         self.similarity_threshold = similarity_threshold
         self.processor_manager = TextProcessorManager(similarity_threshold)
+        self.processor_manager.set_dedup_engine(dedup_engine, **Config.DEDUP_ENGINE_OPTIONS.get(dedup_engine, {}))
+        self.processor_manager.configure_spell_check(Config.SPELL_CHECK_WORKERS, Config.SPELL_CHECK_BATCH_SIZE)
+        self.processor_manager.load_correction_cache(Config.CORRECTION_CACHE_FILE, Config.CORRECTION_CACHE_SIZE)
+        # 超大文本分段交给多个进程解析
+        self.log_parser = ParallelLogParser(Config.PARSE_WORKERS, Config.PARALLEL_PARSE_MIN_CHARS)
         self._observers: List[Any] = []
 
         self.use_timestamp_parsing: bool = True
         self.operation_stack: List[Any] = []
 
+    @property
+    def entries(self) -> EntryStore:
+        """条目集合（按列存储，逐条访问时得到 EntryView）"""
+        return self._entries
+
+    @entries.setter
+    def entries(self, entries: Iterable[Union[LogEntry, EntryView]]):
+        self._entries = entries if isinstance(entries, EntryStore) else EntryStore.from_entries(entries)
+        self._player_stats = None
+
+    def shutdown(self):
+        """关闭解析和错别字修正的工作进程"""
+        self.log_parser.shutdown()
+        self.processor_manager.shutdown()
+
     def add_observer(self, observer):
         if observer not in self._observers:
             self._observers.append(observer)
@@ -166,109 +71,399 @@ class DocumentModel:
     def set_timestamp_parsing_enabled(self, enabled: bool):
         self.use_timestamp_parsing = enabled
 
-    def load_file_with_content(self, file_path: str, content: str) -> Tuple[bool, str]:
+    def set_dedup_engine(self, engine: str, **options):
+        """切换去重引擎（'window' 或 'minhash'），未给出参数时使用 Config 中的默认参数"""
+        if not options:
+            options = Config.DEDUP_ENGINE_OPTIONS.get(engine, {})
+        self.processor_manager.set_dedup_engine(engine, **options)
+
+    def set_dedup_window(self, window_size: Optional[int], time_window: Optional[int] = None):
+        """设置去重窗口：最多与最近 window_size 条比较，且只与 time_window 秒以内的条目比较（None 表示不限）"""
+        self.processor_manager.set_dedup_window(window_size, time_window)
+
+    def load_file_with_content(self, file_path: str, content: str,
+                               stop_check: Optional[Callable[[], bool]] = None) -> Tuple[bool, str]:
+        entries = self.log_parser.parse(content, self.use_timestamp_parsing)
+        if stop_check and stop_check():
+            return True, "process_cancelled"
         self.file_path = file_path
-        self.entries = parse_log_entries(content, self.use_timestamp_parsing)
+        self.entries = entries
         self.detected_language = LanguageDetector.detect_language(content)
         self.processor_manager.set_language(self.detected_language)
         self._classify_entry_types()
         self.notify_observers("file_loaded")
         return True, "file_load_success"
 
+    def load_file_streaming(self, file_path: str,
+                            progress_callback: Callable[[int, int, str], None] = None,
+                            status: str = "",
+                            stop_check: Optional[Callable[[], bool]] = None) -> Tuple[bool, str]:
+        """
+        流式加载txt文件：按块读取并逐行解析，不会在内存中保留整个文件的文本。
+        编码根据文件开头自动检测，检测结果在文件后部解码失败时再依次尝试其余候选编码。
+        进度以已读取的字节数汇报；stop_check 在每块读取前检查，取消时不替换模型内容。
+        """
+        encoding = None
+        candidates = []
+        tried = []
+        while True:
+            reader = TextFileReader(file_path, encoding)
+            try:
+                entries = EntryStore.from_entries(iter_log_entries(
+                    self._prewarm_on_first_line(reader.iter_lines(progress_callback, status, stop_check), reader),
+                    self.use_timestamp_parsing
+                ))
+                break
+            except UnicodeError:
+                candidates = candidates or reader.candidates
+                tried.append(reader.encoding)
+                encoding = next((e for e in candidates if e not in tried), None)
+                if encoding is None:
+                    return False, "decode_error"
+
+        if stop_check and stop_check():
+            return True, "process_cancelled"
+        return self._apply_loaded_entries(file_path, entries, reader.sample)
+
+    def load_mapped_file(self, file_path: str, mapped: MappedTextFile,
+                         progress_callback: Callable[[int, int, str], None] = None,
+                         status: str = "",
+                         stop_check: Optional[Callable[[], bool]] = None) -> Tuple[bool, str]:
+        """
+        从内存映射的文件加载：在映射缓冲区上按行偏移扫描，逐行解码后解析（整个文件仍会全部解析为条目）。
+        编码不支持按字节扫描换行（如utf-16）时退回流式加载。stop_check 在每段解码前检查，取消时不替换模型内容。
+        """
+        for encoding in mapped.candidates:
+            if encoding not in MappedTextFile.LINE_SCAN_ENCODINGS:
+                return self.load_file_streaming(file_path, progress_callback, status, stop_check)
+            self.prewarm_processor(mapped.sample)
+            try:
+                entries = EntryStore.from_entries(iter_log_entries(
+                    mapped.iter_lines(progress_callback, status, encoding, stop_check=stop_check),
+                    self.use_timestamp_parsing
+                ))
+            except UnicodeError:
+                continue
+            if stop_check and stop_check():
+                return True, "process_cancelled"
+            return self._apply_loaded_entries(file_path, entries, mapped.sample)
+        return False, "decode_error"
+
+    def prewarm_processor(self, sample: str):
+        """根据文件开头的样本检测语言，在后台提前创建对应的文本处理器"""
+        if Config.PREWARM_PROCESSOR and sample:
+            self.processor_manager.prewarm(LanguageDetector.detect_language(sample))
+
+    def _prewarm_on_first_line(self, lines: Iterable[str], reader: TextFileReader) -> Iterator[str]:
+        """读到第一块（已有语言检测样本）时开始预热处理器，之后原样产出剩余的行"""
+        lines = iter(lines)
+        for line in lines:
+            self.prewarm_processor(reader.sample)
+            yield line
+            break
+        yield from lines
+
+    def _apply_loaded_entries(self, file_path: str, entries: EntryStore, sample: str) -> Tuple[bool, str]:
+        """用新加载的条目替换模型内容"""
+        if not entries:
+            return False, "file_content_empty"
+        self.file_path = file_path
+        self.entries = entries
+        self.detected_language = LanguageDetector.detect_language(sample)
+        self.processor_manager.set_language(self.detected_language)
+        self._classify_entry_types()
+        self.notify_observers("file_loaded")
+        return True, "file_load_success"
+
     def reparse_entries(self, content: str) -> None:
-        self.entries = parse_log_entries(content, self.use_timestamp_parsing)
+        self.entries = self.log_parser.parse(content, self.use_timestamp_parsing)
         self.detected_language = LanguageDetector.detect_language(content)
         self.processor_manager.set_language(self.detected_language)
         self._classify_entry_types()
         self.notify_observers("entries_updated")
 
-    def get_display_text(self) -> str:
-        """生成显示文本，时间戳只显示时间部分"""
+    @staticmethod
+    def _entry_display_lines(entry) -> List[str]:
+        """一个条目在显示文本中的各行（不含条目之间的空行），时间戳只显示时间部分"""
+        player_name = entry.player_name
+        timestamp = entry.timestamp
         lines = []
-        for i, entry in enumerate(self.entries):
-            display_time = ""
+        if timestamp:
+            parts = timestamp.split()
+            display_time = parts[-1] if len(parts) > 1 else timestamp
+            lines.append(f"{player_name} {display_time}" if player_name else display_time)
+        elif player_name:
+            # 无时间戳但玩家名存在（尖括号格式），只显示玩家名
+            lines.append(player_name)
+
+        content = entry.content
+        if content:
+            lines.extend(part for part in content.split('\n') if part.strip())
+        return lines
+
+    @classmethod
+    def _render_entry(cls, entry) -> str:
+        """一个条目的显示文本：各行均以换行符结尾，之后是条目之间的空行"""
+        lines = cls._entry_display_lines(entry)
+        return '\n'.join(lines) + '\n\n' if lines else '\n'
+
+    def _rendered_blocks(self, rows: range) -> List[str]:
+        """rows 中各条目的显示文本（见 _render_entry），没有缓存的条目渲染后存入 EntryStore"""
+        entries = self.entries
+        blocks = entries.rendered_column()[rows.start:rows.stop]
+        if None in blocks:
+            render = self._render_entry
+            blocks = [render(entries[row]) if block is None else block for row, block in zip(rows, blocks)]
+            entries.set_rendered(rows.start, blocks)
+        return blocks
+
+    def _current_display_state(self) -> Tuple[EntryStore, int]:
+        return self.entries, self.entries.version
+
+    def _refresh_display_index(self):
+        """条目或其显示字段变化后重新统计各条目的行数，只有修改过的条目需要重新渲染"""
+        state = self._current_display_state()
+        if self._display_state == state:
+            return
+        blocks = self._rendered_blocks(range(len(self.entries)))
+        self._display_line_counts = array('i', map(str.count, blocks, repeat('\n')))
+        self._display_line_starts = None
+        self._display_text = None
+        self._display_state = state
+
+    def _line_starts(self) -> List[int]:
+        """各条目在显示文本中的起始行号（从0开始），最后一项为总行数+1（最后一个条目之后没有空行）"""
+        self._refresh_display_index()
+        if self._display_line_starts is None:
+            self._display_line_starts = list(accumulate(self._display_line_counts, initial=0))
+        return self._display_line_starts
+
+    def display_line_offset(self, row: int) -> int:
+        """第 row 个条目在显示文本中的起始行号（从0开始）"""
+        return self._line_starts()[row]
+
+    def display_line_count(self) -> int:
+        """显示文本的总行数"""
+        return max(self._line_starts()[-1] - 1, 0)
+
+    def entry_at_display_line(self, line: int) -> int:
+        """显示文本第 line 行（从0开始）所属的条目下标，条目之后的空行属于该条目"""
+        starts = self._line_starts()
+        return min(max(bisect_right(starts, line) - 1, 0), len(self.entries) - 1)
+
+    def get_display_text(self) -> str:
+        """
+        生成显示文本，时间戳只显示时间部分，条目之间以空行分隔。
+        各条目的显示文本缓存在 EntryStore 中，只有修改过的条目需要重新渲染；整段文本缓存到下次修改为止。
+        返回的文本视为编辑器当前的内容，reparse_display_lines 据此定位修改的条目。
+        """
+        self._refresh_display_index()
+        if self._display_text is None:
+            self._display_text = ''.join(self._rendered_blocks(range(len(self.entries))))[:-2]
+        self._shown_state = self._display_state
+        return self._display_text
+
+    def get_display_range(self, start: int, stop: int) -> str:
+        """
+        条目 [start, stop) 的显示文本，即显示文本中 display_line_offset(start) 行起的这些条目的行
+        （含条目之间的空行），末尾不带换行符。
+        """
+        if start >= stop:
+            return ""
+        text = ''.join(self._rendered_blocks(range(start, stop)))
+        return text[:-2] if stop >= len(self.entries) else text[:-1]
+
+    def get_display_window(self, start: int, stop: int) -> str:
+        """
+        与 get_display_range 相同，但返回的文本视为编辑器当前的内容：编辑器只显示条目 [start, stop) 时使用，
+        之后 reparse_display_lines 按显示文本中的行号处理编辑器里这段文本的修改。
+        """
+        self._refresh_display_index()
+        self._shown_state = self._display_state
+        return self.get_display_range(start, stop)
+
+    def reparse_display_lines(self, first_line: int, last_line: int, line_delta: int,
+                              read_lines: Callable[[int, int], str]) -> Optional[Tuple[int, int, List[str]]]:
+        """
+        局部重新解析编辑器中修改过的行，只替换这些行所在的条目，其余条目保持不变。
+        first_line ~ last_line 为修改过的行（从0开始，按修改后的行号），line_delta 为修改使总行数增加的行数；
+        read_lines(start, stop) 返回编辑器中 [start, stop) 行的文本（以换行符连接，末尾不带换行符）。
+        返回 (start, stop, lines)：将编辑器中 [start, stop) 行替换为 lines 后即与 get_display_text() 一致。
+        无法局部处理时返回None（编辑器显示的不是当前模型的文本、修改了第一个条目之前的文本、删除了全部条目、
+        条目是全文无格式时逐行得到的、新增或删除了全文第一个条目起始行等），调用方应整体重新解析。
+        """
+        entry_count = len(self.entries)
+        if not entry_count or self._shown_state != self._current_display_state():
+            return None
+        # 显示文本中只有带时间戳的条目以起始行开头；没有这样的条目时整体解析会逐行作为无格式条目，
+        # 插入第一个起始行后其前面的行又会被丢弃，都无法局部处理
+        first_head = self.entries.first_timestamped_row() if self.use_timestamp_parsing else None
+        if self.use_timestamp_parsing and first_head is None:
+            return None
+        starts = self._line_starts()
+        total_lines = starts[-1] - 1
+        first_line = min(max(first_line, 0), total_lines - 1)
+        old_last_line = min(max(last_line - line_delta, first_line), total_lines - 1)
+
+        # 修改所在的条目 [start, stop)，以及这些条目在编辑器中的行范围 [line_start, line_stop)
+        start = bisect_right(starts, first_line) - 1
+        stop = bisect_right(starts, old_last_line)
+        line_start = starts[start]
+        line_stop = (starts[stop] if stop < entry_count else total_lines) + line_delta
+        text = read_lines(line_start, line_stop)
+
+        if text == self.get_display_range(start, stop):
+            # 改动后又恢复原样
+            return line_start, line_start, []
+
+        # 第一个条目起始行之前的行是上一个条目的续行
+        lines = text.splitlines()
+        leading = []
+        position = 0
+        if self.use_timestamp_parsing:
+            while position < len(lines) and not is_entry_head(lines[position]):
+                if lines[position].strip():
+                    leading.append(lines[position].strip())
+                position += 1
+        if leading and start == 0:
+            return None
+        parser = LogParser(self.use_timestamp_parsing, timestamp_keys=False)
+        new_entries = []
+        for line in lines[position:]:
+            entry = parser.feed(line)
+            if entry is not None:
+                new_entries.append(entry)
+        new_entries.extend(parser.finish())
+        if not new_entries and stop - start == entry_count:
+            return None
+        if first_head is not None and start <= first_head:
+            # 修改涉及全文第一个起始行：其前面的行在整体解析时被丢弃，而不是并入上一个条目；
+            # 删除了全部时间戳时整体解析改为逐行处理
+            if leading or (not any(entry.timestamp for entry in new_entries)
+                           and self.entries.first_timestamped_row(stop) is None):
+                return None
+
+        # 时间戳排序键接着前面最近一个带时间戳的条目推断
+        timestamp_keys = TimestampKeyBuilder()
+        for row in range(start - 1, -1, -1):
+            value = self.entries[row].timestamp_value
+            if value is not None:
+                timestamp_keys.set_state((time.gmtime(value).tm_year, value - value % SECONDS_PER_DAY, value))
+                break
+        for entry in new_entries:
             if entry.timestamp:
-                parts = entry.timestamp.split()
-                if len(parts) > 1:
-                    display_time = parts[-1]
-                else:
-                    display_time = entry.timestamp
-
-            if entry.player_name and entry.timestamp:
-                lines.append(f"{entry.player_name} {display_time}")
-            elif entry.timestamp:
-                lines.append(display_time)
-            elif entry.player_name:
-                # 无时间戳但玩家名存在（尖括号格式），只显示玩家名
-                lines.append(f"{entry.player_name}")
-
-            content_parts = entry.content.split('\n') if entry.content else [""]
-            for part in content_parts:
-                if part.strip():
-                    lines.append(part)
-
-            if i < len(self.entries) - 1:
-                lines.append("")
-
-        return '\n'.join(lines)
-
-    def sort_by_timestamp(self) -> bool:
-        """按时间戳排序（简单字符串排序，保持原有逻辑）"""
+                entry.timestamp_value = timestamp_keys.key(entry.timestamp)
+
+        first_changed = start - 1 if leading else start
+        player_stats = self._player_stats
+        if player_stats is not None:
+            self._update_player_stats(range(first_changed, stop), -1)
+        if leading:
+            previous = self.entries[first_changed]
+            previous.content = '\n'.join(([previous.content] if previous.content else []) + leading)
+        self.entries.splice(start, stop, new_entries)
+        self.entries.renumber()
+        # 修改可能改变了只有时间的时间戳所推断的日期，之后的排序键接着重新推断，直到与原来的一致
+        self.entries.rekey_timestamps(start + len(new_entries), timestamp_keys)
+        if self.entries.edited_count >= Config.COMPACT_EDITED_ROWS:
+            self.entries.compact()
+        changed_rows = range(first_changed, start + len(new_entries))
+        if player_stats is not None:
+            self._update_player_stats(changed_rows, 1)
+        self._classify_entry_types(player_stats, changed_rows)
+
+        # 编辑器只替换这些条目的行，行数统计也只更新这些条目
+        blocks = self._rendered_blocks(changed_rows)
+        self._display_line_counts[first_changed:stop] = array('i', map(str.count, blocks, repeat('\n')))
+        self._display_line_starts = None
+        self._display_text = None
+        self._display_state = self._shown_state = self._current_display_state()
+        new_lines = ''.join(blocks).split('\n')[:-1]
+        replace_start = starts[first_changed]
+        if stop == entry_count:
+            if new_lines:
+                new_lines.pop()
+            else:
+                # 删除了末尾的条目：前一个条目成为最后一个，去掉它后面的空行
+                replace_start -= 1
+        return replace_start, line_stop, new_lines
+
+    def sort_by_timestamp(self, stop_check: Optional[Callable[[], bool]] = None) -> bool:
+        """
+        按解析时计算的时间戳排序键稳定排序；日期超出范围、无法换算排序键的条目随后按时间戳字符串排序，
+        无时间戳的条目排在最后。
+        已经有序或排序期间被 stop_check 取消时不做任何改动，也不通知观察者。
+        """
         if not self.entries:
             return False
-        if all(not entry.timestamp for entry in self.entries):
+        if not self.entries.has_timestamps():
             return False
-        self.entries.sort(key=lambda e: (e.timestamp == "", e.timestamp))
-        for idx, entry in enumerate(self.entries, start=1):
-            entry.id = idx
+        order = self.entries.timestamp_sort_order()
+        if order is None or (stop_check and stop_check()):
+            return True
+        self.entries = self.entries.take(order)
+        self.entries.renumber()
         self.notify_observers("entries_updated")
         return True
 
-    def _classify_entry_types(self):
-        """根据统计给每个 entry 分配类型：KP, PL, OB, BOT"""
+    def _classify_entry_types(self, player_stats: Optional[Dict[str, List[int]]] = None,
+                              changed_rows: Optional[range] = None):
+        """
+        根据统计给每个 entry 分配类型：KP, PL, OB, BOT。
+        player_stats 为已经更新好的各玩家统计（None 时重新统计全部条目）；
+        changed_rows 为只有这些行变化过，各玩家的类型不变时只需设置这些行。
+        """
         if not self.entries:
+            self._player_stats = None
+            self._player_types = None
             return
 
-        player_stats = {}
-        total_content_chars = 0
-        for entry in self.entries:
-            name = entry.player_name
-            if name not in player_stats:
-                player_stats[name] = {
-                    'count': 0,
-                    'has_eq_count': 0,
-                    'char_count': 0,
-                }
-            player_stats[name]['count'] += 1
-            if '=' in entry.content:
-                player_stats[name]['has_eq_count'] += 1
-            chars = len(entry.content)
-            player_stats[name]['char_count'] += chars
-            total_content_chars += chars
-
-        if not player_stats:
-            return
+        # 玩家名 -> [发言条数, 含'='的条数, 正文字符数]
+        if player_stats is None:
+            player_stats = {name: list(stats) for name, stats in self.entries.player_statistics().items()}
+            changed_rows = None
+        total_content_chars = sum(stats[2] for stats in player_stats.values())
 
-        # 找出发言次数最多的玩家（排除空名）
+        # 找出发言次数最多的玩家（排除空名），次数相同时取最先发言的
         valid_names = [name for name in player_stats if name]
         if not valid_names:
             # 所有玩家名都为空，则没有KP
             kp_name = None
         else:
-            kp_name = max(valid_names, key=lambda n: player_stats[n]['count'])
-
-        for entry in self.entries:
-            name = entry.player_name
-            stats = player_stats[name]
+            most = max(player_stats[name][0] for name in valid_names)
+            candidates = [name for name in valid_names if player_stats[name][0] == most]
+            kp_name = candidates[0] if len(candidates) == 1 else min(candidates, key=self.entries.first_row_of_player)
 
+        types = {}
+        for name, (count, has_eq_count, char_count) in player_stats.items():
             if name == kp_name:
-                entry.entry_type = 'KP'
-            elif stats['has_eq_count'] / stats['count'] > 0.4:
-                entry.entry_type = 'BOT'
-            elif stats['char_count'] / total_content_chars < 0.01:
-                entry.entry_type = 'OB'
+                types[name] = 'KP'
+            elif has_eq_count / count > 0.4:
+                types[name] = 'BOT'
+            elif total_content_chars and char_count / total_content_chars < 0.01:
+                types[name] = 'OB'
             else:
-                entry.entry_type = 'PL'
+                types[name] = 'PL'
+        if changed_rows is not None and types == self._player_types:
+            self.entries.set_types_by_player(types, changed_rows)
+        else:
+            self.entries.set_types_by_player(types)
+        self._player_stats = player_stats
+        self._player_types = types
+
+    def _update_player_stats(self, rows: range, sign: int):
+        """将 rows 中各条目计入（sign=1）或移出（sign=-1）缓存的玩家统计"""
+        player_stats = self._player_stats
+        for row in rows:
+            entry = self.entries[row]
+            content = entry.content
+            stats = player_stats.setdefault(entry.player_name, [0, 0, 0])
+            stats[0] += sign
+            if '=' in content:
+                stats[1] += sign
+            stats[2] += sign * len(content)
+            if not stats[0]:
+                del player_stats[entry.player_name]
 
     def process_text(self, operation: str,
                      progress_callback: Callable[[int, int, str], None] = None,
@@ -276,6 +471,8 @@ class DocumentModel:
         """处理文本"""
         if not self.entries:
             return False, "please_load_file_first"
+        # 正文会被原地修改，缓存的玩家统计不再可靠
+        self._player_stats = None
 
         try:
             if operation == 'deduplicate':
@@ -292,9 +489,12 @@ class DocumentModel:
                         return True
                     return False
 
-                self.entries = self.processor_manager.deduplicate_entries(
-                    self.entries, self.similarity_threshold, skip_cond
+                entries = self.processor_manager.deduplicate_entries(
+                    self.entries, self.similarity_threshold, skip_cond, progress_callback, stop_check
                 )
+                if entries is None:
+                    return True, "process_cancelled"
+                self.entries = entries
             elif operation == 'spell_check':
                 # 收集所有需要处理的段落
                 paragraph_tasks = []
@@ -307,19 +507,19 @@ class DocumentModel:
                 if total == 0:
                     return True, "process_completed"
 
-                for i, (entry, p_idx, para) in enumerate(paragraph_tasks):
+                texts = [para for _, _, para in paragraph_tasks]
+                if not self._spell_check_paragraphs(paragraph_tasks, texts, progress_callback, stop_check,
+                                                    "处理段落 {}/{}"):
+                    return True, "process_cancelled"
+            elif operation == 'correct_symbols':
+                total = len(self.entries)
+                for done, entry in enumerate(self.entries, 1):
                     if stop_check and stop_check():
                         return True, "process_cancelled"
-                    result, _ = self.processor_manager.process_text('spell_check', para)
-                    paras = entry.content.split('\n')
-                    paras[p_idx] = result
-                    entry.content = '\n'.join(paras)
-                    if progress_callback:
-                        progress_callback(i + 1, total, f"处理段落 {i+1}/{total}")
-            elif operation == 'correct_symbols':
-                for entry in self.entries:
                     result, _ = self.processor_manager.process_text('correct_symbols', entry.content)
                     entry.content = result
+                    if progress_callback:
+                        progress_callback(done, total, "")
             else:
                 return False, "unsupported_operation"
 
@@ -327,6 +527,34 @@ class DocumentModel:
         except Exception as e:
             print(f"处理失败: {e}")
             return False, "process_failed"
+        finally:
+            # 批量修改过的正文（包括取消前已完成的部分）合并回缓冲区，原文随之释放
+            self.entries.compact()
+
+    def _spell_check_paragraphs(self, paragraph_tasks: List[Tuple[Any, int, str]], texts: List[str],
+                                progress_callback: Optional[Callable[[int, int, str], None]],
+                                stop_check: Optional[Callable[[], bool]], status_format: str) -> bool:
+        """
+        对 texts（与 paragraph_tasks 一一对应）做错别字修正，并把结果写回对应条目的段落。
+        重复的段落只修正一次，段落较多时交给多进程执行器；返回 False 表示被取消。
+        """
+        total = len(paragraph_tasks)
+        done = 0
+        try:
+            for batch in self.processor_manager.spell_check_batches(
+                    texts, stop_check, Config.SPELL_CHECK_PARALLEL_MIN_PARAGRAPHS):
+                for index, result in batch:
+                    entry, p_idx, _ = paragraph_tasks[index]
+                    paras = entry.content.split('\n')
+                    paras[p_idx] = result
+                    entry.content = '\n'.join(paras)
+                done += len(batch)
+                if progress_callback:
+                    progress_callback(done, total, status_format.format(done, total))
+        finally:
+            # 已修正的结果即使被取消也保留在缓存中，下次处理时直接使用
+            self.processor_manager.save_correction_cache(Config.CORRECTION_CACHE_FILE)
+        return done == total
 
     def smart_auto_process(self,
                            progress_callback: Callable[[int, int, str], None] = None,
@@ -334,6 +562,7 @@ class DocumentModel:
         """智能自动处理：先去重，再符号修正，最后错别字修正"""
         if not self.entries:
             return False, "please_load_file_first"
+        self._player_stats = None
 
         try:
             # 先去重
@@ -349,9 +578,12 @@ class DocumentModel:
                     return True
                 return False
 
-            self.entries = self.processor_manager.deduplicate_entries(
-                self.entries, self.similarity_threshold, skip_cond
+            entries = self.processor_manager.deduplicate_entries(
+                self.entries, self.similarity_threshold, skip_cond, progress_callback, stop_check
             )
+            if entries is None:
+                return True, "smart_process_cancelled"
+            self.entries = entries
 
             # 收集段落
             paragraph_tasks = []
@@ -364,17 +596,16 @@ class DocumentModel:
             if total == 0:
                 return True, "smart_process_completed"
 
-            for i, (entry, p_idx, para) in enumerate(paragraph_tasks):
-                if stop_check and stop_check():
-                    return True, "smart_process_cancelled"
-                corrected, _ = self.processor_manager.process_text('correct_symbols', para)
-                final, _ = self.processor_manager.process_text('spell_check', corrected)
-                paras = entry.content.split('\n')
-                paras[p_idx] = final
-                entry.content = '\n'.join(paras)
-                if progress_callback:
-                    progress_callback(i + 1, total, f"智能处理段落 {i+1}/{total}")
+            # 符号修正代价很低，先在当前进程完成，再统一做错别字修正；
+            # 结果在该段落的错别字修正完成后才写回，取消时未完成的段落保持原样
+            texts = [self.processor_manager.process_text('correct_symbols', para)[0]
+                     for _, _, para in paragraph_tasks]
+            if not self._spell_check_paragraphs(paragraph_tasks, texts, progress_callback, stop_check,
+                                                "智能处理段落 {}/{}"):
+                return True, "smart_process_cancelled"
 
             return True, "smart_process_completed"
         except Exception as e:
             return False, "smart_process_failed"
+        finally:
+            self.entries.compact()
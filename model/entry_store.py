@@ -0,0 +1,386 @@
+import sys
+from array import array
+from collections import Counter
+from typing import List, Dict, Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+from .log_parser import LogEntry, TimestampKeyBuilder
+
+# 条目类型与类型码的对应关系（类型码存放在字节数组中）
+ENTRY_TYPES = ('', 'KP', 'PL', 'OB', 'BOT')
+_TYPE_CODES = {entry_type: code for code, entry_type in enumerate(ENTRY_TYPES)}
+
+# timestamp_value 为 None 时在列中存放的值
+NO_TIMESTAMP_VALUE = -(1 << 63)
+
+
+class EntryView:
+    """
+    EntryStore 中一行的视图，属性与 LogEntry 相同，读写直接映射到对应的列。
+    视图绑定的是行号，重排或去重会生成新的 EntryStore，旧视图仍指向旧的存储。
+    """
+    __slots__ = ('_store', '_row')
+
+    def __init__(self, store: "EntryStore", row: int):
+        self._store = store
+        self._row = row
+
+    @property
+    def id(self) -> int:
+        return self._store._ids[self._row]
+
+    @id.setter
+    def id(self, value: int):
+        self._store._ids[self._row] = value
+
+    @property
+    def player_name(self) -> str:
+        store = self._store
+        return store.player_names[store._player_ids[self._row]]
+
+    @player_name.setter
+    def player_name(self, value: str):
+        store = self._store
+        store._player_ids[self._row] = store._player_id(value)
+        store._touch(self._row)
+
+    @property
+    def timestamp(self) -> str:
+        return self._store._timestamps[self._row]
+
+    @timestamp.setter
+    def timestamp(self, value: str):
+        self._store._timestamps[self._row] = value
+        self._store._touch(self._row)
+
+    @property
+    def timestamp_value(self) -> Optional[int]:
+        value = self._store._timestamp_values[self._row]
+        return None if value == NO_TIMESTAMP_VALUE else value
+
+    @timestamp_value.setter
+    def timestamp_value(self, value: Optional[int]):
+        self._store._timestamp_values[self._row] = NO_TIMESTAMP_VALUE if value is None else value
+
+    @property
+    def content(self) -> str:
+        return self._store.get_content(self._row)
+
+    @content.setter
+    def content(self, value: str):
+        self._store.set_content(self._row, value)
+
+    @property
+    def entry_type(self) -> str:
+        return ENTRY_TYPES[self._store._type_codes[self._row]]
+
+    @entry_type.setter
+    def entry_type(self, value: str):
+        self._store._type_codes[self._row] = _TYPE_CODES[value]
+
+    def to_entry(self) -> LogEntry:
+        """复制为独立的 LogEntry"""
+        return LogEntry(id=self.id, player_name=self.player_name, timestamp=self.timestamp,
+                        content=self.content, entry_type=self.entry_type,
+                        timestamp_value=self.timestamp_value)
+
+    def __repr__(self) -> str:
+        return f"EntryView(row={self._row}, {self.to_entry()!r})"
+
+
+class EntryStore:
+    """
+    按列存放的条目集合，对外表现为 EntryView 组成的只读列表。
+      - 玩家名：int 数组存放玩家编号，玩家名只保存一份
+      - 时间戳：显示用字符串列表 + int64 数组（timestamp_value）
+      - 类型：字节数组存放类型码
+      - 正文：所有正文拼接成一个字符串，每行记录起止偏移；修改过的正文单独保存，compact 时合并回缓冲区
+      - 显示缓存：每行渲染好的显示文本（由 DocumentModel 填充），玩家名、时间戳或正文修改时清除该行
+    排序、去重等改变行集合的操作通过 take 生成新的 EntryStore，显示缓存随行一起取出。
+    version 在玩家名、时间戳、正文或行集合每次变化时加一，用于判断依赖这些字段的缓存是否过期。
+    """
+
+    def __init__(self):
+        self._ids = array('q')
+        self._player_ids = array('i')
+        self.player_names: List[str] = []
+        self._player_index: Dict[str, int] = {}
+        self._timestamps: List[str] = []
+        self._timestamp_values = array('q')
+        self._type_codes = array('b')
+        self._text = ""
+        self._starts = array('q')
+        self._ends = array('q')
+        self._edited: Dict[int, str] = {}   # 行号 -> 修改后的正文
+        self._rendered: List[Optional[str]] = []
+        self.version = 0
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[Union[LogEntry, EntryView]]) -> "EntryStore":
+        """由 LogEntry（或其他存储的视图）构建，可直接接收解析器产出的生成器"""
+        if isinstance(entries, EntryStore):
+            return entries.take(range(len(entries)))
+        if isinstance(entries, list) and entries and all(isinstance(e, EntryView) for e in entries):
+            source = entries[0]._store
+            if all(e._store is source for e in entries):
+                return source.take([e._row for e in entries])
+
+        store = cls()
+        parts = []
+        position = 0
+        for entry in entries:
+            content = entry.content
+            parts.append(content)
+            store._starts.append(position)
+            position += len(content)
+            store._ends.append(position)
+            store._append_fields(entry.id, entry.player_name, entry.timestamp,
+                                 entry.timestamp_value, entry.entry_type)
+        store._text = ''.join(parts)
+        store._rendered = [None] * len(store)
+        return store
+
+    def _append_fields(self, entry_id: int, player_name: str, timestamp: str,
+                       timestamp_value: Optional[int], entry_type: str):
+        self._ids.append(entry_id)
+        self._player_ids.append(self._player_id(player_name))
+        self._timestamps.append(timestamp)
+        self._timestamp_values.append(NO_TIMESTAMP_VALUE if timestamp_value is None else timestamp_value)
+        self._type_codes.append(_TYPE_CODES[entry_type])
+
+    def _player_id(self, player_name: str) -> int:
+        player_id = self._player_index.get(player_name)
+        if player_id is None:
+            player_id = len(self.player_names)
+            player_name = sys.intern(player_name)
+            self.player_names.append(player_name)
+            self._player_index[player_name] = player_id
+        return player_id
+
+    # ---------- 列表接口 ----------
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [EntryView(self, row) for row in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("EntryStore index out of range")
+        return EntryView(self, index)
+
+    def __iter__(self) -> Iterator[EntryView]:
+        for row in range(len(self)):
+            yield EntryView(self, row)
+
+    def __repr__(self) -> str:
+        return f"EntryStore({len(self)} entries, {len(self.player_names)} players)"
+
+    # ---------- 正文 ----------
+    def get_content(self, row: int) -> str:
+        edited = self._edited.get(row)
+        if edited is not None:
+            return edited
+        return self._text[self._starts[row]:self._ends[row]]
+
+    def set_content(self, row: int, content: str):
+        self._edited[row] = content
+        self._touch(row)
+
+    def _touch(self, row: int):
+        """该行的显示相关字段被修改"""
+        self._rendered[row] = None
+        self.version += 1
+
+    # ---------- 显示缓存 ----------
+    def set_rendered(self, start: int, texts: List[str]):
+        """从 start 行起依次设置各行的显示缓存"""
+        self._rendered[start:start + len(texts)] = texts
+
+    def rendered_column(self) -> List[Optional[str]]:
+        """各行的显示缓存（未缓存的为None），调用方只读"""
+        return self._rendered
+
+    def iter_contents(self, entry_types: Optional[Sequence[str]] = None) -> Iterator[str]:
+        """按顺序产出正文，可只取指定类型的条目"""
+        codes = None if entry_types is None else {_TYPE_CODES[t] for t in entry_types}
+        type_codes = self._type_codes
+        for row in range(len(self)):
+            if codes is None or type_codes[row] in codes:
+                yield self.get_content(row)
+
+    @property
+    def edited_count(self) -> int:
+        """修改过、尚未合并回文本缓冲区的正文行数"""
+        return len(self._edited)
+
+    def compact(self):
+        """
+        将修改过的正文合并回文本缓冲区；缓冲区中有不再属于任何行的文本时（如去重后从原存储共享来的缓冲区）同样重建，
+        被替换的原文随旧缓冲区一起释放。
+        """
+        if not self._edited and sum(self._ends) - sum(self._starts) == len(self._text):
+            return
+        parts = []
+        position = 0
+        starts = array('q')
+        ends = array('q')
+        for row in range(len(self)):
+            content = self.get_content(row)
+            parts.append(content)
+            starts.append(position)
+            position += len(content)
+            ends.append(position)
+        self._text = ''.join(parts)
+        self._starts, self._ends = starts, ends
+        self._edited = {}
+
+    # ---------- 批量操作 ----------
+    def take(self, rows: Iterable[int]) -> "EntryStore":
+        """按给定行号顺序取出若干行，生成新的 EntryStore（玩家表和文本缓冲区共享）"""
+        rows = list(rows)
+        store = EntryStore()
+        store.player_names = list(self.player_names)
+        store._player_index = dict(self._player_index)
+        store._text = self._text
+        store._ids = array('q', map(self._ids.__getitem__, rows))
+        store._player_ids = array('i', map(self._player_ids.__getitem__, rows))
+        store._timestamps = list(map(self._timestamps.__getitem__, rows))
+        store._timestamp_values = array('q', map(self._timestamp_values.__getitem__, rows))
+        store._type_codes = array('b', map(self._type_codes.__getitem__, rows))
+        store._starts = array('q', map(self._starts.__getitem__, rows))
+        store._ends = array('q', map(self._ends.__getitem__, rows))
+        store._rendered = list(map(self._rendered.__getitem__, rows))
+        if self._edited:
+            edited = self._edited
+            store._edited = {new_row: edited[row] for new_row, row in enumerate(rows) if row in edited}
+        return store
+
+    def splice(self, start: int, stop: int, entries: Iterable[Union[LogEntry, EntryView]]):
+        """
+        用 entries 原地替换 [start, stop) 行（用于局部重新解析）。
+        新行的正文保存在修改表中，compact 时合并回文本缓冲区；之后的行号整体移动，已有的视图不再对应原来的条目。
+        """
+        entries = list(entries)
+        delta = len(entries) - (stop - start)
+        if self._edited:
+            self._edited = {
+                (row if row < start else row + delta): content
+                for row, content in self._edited.items() if row < start or row >= stop
+            }
+        self._ids[start:stop] = array('q', [entry.id for entry in entries])
+        self._player_ids[start:stop] = array('i', [self._player_id(entry.player_name) for entry in entries])
+        self._timestamps[start:stop] = [entry.timestamp for entry in entries]
+        self._timestamp_values[start:stop] = array('q', [
+            NO_TIMESTAMP_VALUE if entry.timestamp_value is None else entry.timestamp_value for entry in entries
+        ])
+        self._type_codes[start:stop] = array('b', [_TYPE_CODES[entry.entry_type] for entry in entries])
+        self._starts[start:stop] = array('q', bytes(8 * len(entries)))
+        self._ends[start:stop] = array('q', bytes(8 * len(entries)))
+        self._rendered[start:stop] = [None] * len(entries)
+        for offset, entry in enumerate(entries):
+            self._edited[start + offset] = entry.content
+        self.version += 1
+
+    def renumber(self):
+        """按当前顺序将 id 重新编号为 1..n"""
+        self._ids = array('q', range(1, len(self) + 1))
+
+    def timestamp_sort_order(self) -> Optional[List[int]]:
+        """
+        按时间戳排序键（timestamp_value）排序后的行号顺序，排序稳定。
+        有时间戳字符串但无法换算为排序键的条目（如月份为13）排在有排序键的条目之后，按时间戳字符串排序；
+        无时间戳的排在最后。
+        先单次扫描检查是否已经有序，已有序时返回None；基本有序的日志由 timsort 以接近线性的代价完成。
+        """
+        values = self._timestamp_values
+        timestamps = self._timestamps
+        dated = []
+        unkeyed = []
+        undated = []
+        previous = NO_TIMESTAMP_VALUE
+        previous_unkeyed = ""
+        in_order = True
+        for row, value in enumerate(values):
+            if value == NO_TIMESTAMP_VALUE:
+                timestamp = timestamps[row]
+                if not timestamp:
+                    undated.append(row)
+                    continue
+                if undated or timestamp < previous_unkeyed:
+                    in_order = False
+                previous_unkeyed = timestamp
+                unkeyed.append(row)
+                continue
+            if undated or unkeyed or value < previous:
+                in_order = False
+            previous = value
+            dated.append(row)
+        if in_order:
+            return None
+        dated.sort(key=values.__getitem__)
+        unkeyed.sort(key=timestamps.__getitem__)
+        return dated + unkeyed + undated
+
+    def rekey_timestamps(self, start: int, timestamp_keys: TimestampKeyBuilder):
+        """
+        从 start 行起用 timestamp_keys（已处于 start 之前的推断上下文）依次重新计算排序键并写回，
+        直到某个条目重新计算的排序键与原来的相同，此后的推断上下文不变。
+        """
+        timestamps = self._timestamps
+        values = self._timestamp_values
+        for row in range(start, len(timestamps)):
+            timestamp = timestamps[row]
+            if not timestamp:
+                continue
+            value = timestamp_keys.key(timestamp)
+            if value is None:
+                values[row] = NO_TIMESTAMP_VALUE
+            elif value == values[row]:
+                break
+            else:
+                values[row] = value
+
+    def has_timestamps(self) -> bool:
+        return any(self._timestamps)
+
+    def first_timestamped_row(self, start: int = 0) -> Optional[int]:
+        """从 start 行起第一个带时间戳的条目的行号，没有时返回None"""
+        timestamps = self._timestamps
+        return next((row for row in range(start, len(timestamps)) if timestamps[row]), None)
+
+    def player_statistics(self) -> Dict[str, Tuple[int, int, int]]:
+        """按玩家统计 (发言条数, 含'='的条数, 正文字符数)"""
+        counts = Counter(self._player_ids)
+        eq_counts = Counter()
+        char_counts = Counter()
+        text, starts, ends, edited = self._text, self._starts, self._ends, self._edited
+        for row, player_id in enumerate(self._player_ids):
+            content = edited.get(row)
+            if content is None:
+                start, end = starts[row], ends[row]
+                char_counts[player_id] += end - start
+                if text.find('=', start, end) >= 0:
+                    eq_counts[player_id] += 1
+            else:
+                char_counts[player_id] += len(content)
+                if '=' in content:
+                    eq_counts[player_id] += 1
+        return {
+            self.player_names[player_id]: (count, eq_counts[player_id], char_counts[player_id])
+            for player_id, count in counts.items()
+        }
+
+    def first_row_of_player(self, player_name: str) -> int:
+        """该玩家第一条发言的行号"""
+        return self._player_ids.index(self._player_index[player_name])
+
+    def set_types_by_player(self, types: Dict[str, str], rows: Optional[range] = None):
+        """按玩家名批量设置条目类型；给出 rows 时只设置这些行"""
+        code_by_player = {self._player_index[name]: _TYPE_CODES[t] for name, t in types.items()
+                          if name in self._player_index}
+        if rows is None:
+            self._type_codes = array('b', [code_by_player.get(p, 0) for p in self._player_ids])
+            return
+        player_ids = self._player_ids
+        self._type_codes[rows.start:rows.stop] = array('b', [code_by_player.get(player_ids[row], 0) for row in rows])
@@ -0,0 +1,93 @@
+import difflib
+import heapq
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List
+
+
+class FuzzyWordIndex:
+    """
+    词典的模糊查找索引，查找结果与 difflib.get_close_matches(word, words, n, cutoff) 完全相同。
+    get_close_matches 对每个词依次检查 real_quick_ratio、quick_ratio、ratio 三个上限，
+    前两个只与长度和字符计数有关，可以用索引一次性求出：
+      - 按词长分桶：real_quick_ratio = 2*min(la,lb)/(la+lb)，只需查看长度落在范围内的桶
+      - 桶内建 字符 -> 词编号 倒排表；quick_ratio 达到阈值需要至少 m 个公共字符，
+        因此候选词必然含有查询词中最少见的 (len(word) - m + 1) 个字符之一，只遍历这些字符的倒排表
+    通过两级上限的少量候选词再用 SequenceMatcher.ratio 复核（seq1/seq2 的角色与 get_close_matches 一致）。
+    """
+
+    def __init__(self, words: Iterable[str]):
+        self.words: List[str] = sorted(set(words))
+        # 词长 -> 字符 -> 含该字符的词编号
+        self._postings: Dict[int, Dict[str, List[int]]] = defaultdict(lambda: defaultdict(list))
+        for word_id, word in enumerate(self.words):
+            bucket = self._postings[len(word)]
+            for char in set(word):
+                bucket[char].append(word_id)
+        self._postings = {length: dict(bucket) for length, bucket in self._postings.items()}
+        self._max_length = max(self._postings, default=0)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def get_close_matches(self, word: str, n: int = 3, cutoff: float = 0.6) -> List[str]:
+        if not n > 0:
+            raise ValueError("n must be > 0: %r" % (n,))
+        if not 0.0 <= cutoff <= 1.0:
+            raise ValueError("cutoff must be in [0.0, 1.0]: %r" % (cutoff,))
+        query_length = len(word)
+        if cutoff <= 0.0:
+            # 阈值为0时所有词都满足上限，直接退回逐个比较
+            return difflib.get_close_matches(word, self.words, n, cutoff)
+
+        query_counts = Counter(word)
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(word)
+        words = self.words
+        result = []
+        for length in self._candidate_lengths(query_length, cutoff):
+            bucket = self._postings.get(length)
+            if not bucket:
+                continue
+            total = length + query_length
+            required = self._required_matches(total, cutoff)
+            if required > min(length, query_length):
+                continue
+            # 前缀过滤：若候选词不含查询词中最少见的若干字符（合计出现 query_length - required + 1 次），
+            # 其公共字符数至多为 required - 1，必然达不到阈值，所以只需遍历这些字符的倒排表
+            prefix = query_length - required + 1
+            candidates = set()
+            for char in sorted(query_counts, key=lambda c: len(bucket.get(c, ()))):
+                candidates.update(bucket.get(char, ()))
+                prefix -= query_counts[char]
+                if prefix <= 0:
+                    break
+            for word_id in candidates:
+                candidate = words[word_id]
+                # quick_ratio 上限：公共字符数（按多重集合计算）
+                common = 0
+                for char, query_count in query_counts.items():
+                    count = candidate.count(char)
+                    common += count if count < query_count else query_count
+                if 2.0 * common / total < cutoff:
+                    continue
+                matcher.set_seq1(candidate)
+                score = matcher.ratio()
+                if score >= cutoff:
+                    result.append((score, candidate))
+        result = heapq.nlargest(n, result)
+        return [candidate for score, candidate in result]
+
+    @staticmethod
+    def _required_matches(total: int, cutoff: float) -> int:
+        """满足 2.0 * m / total >= cutoff 的最小整数 m（与 difflib 相同的浮点比较）"""
+        m = max(0, int(cutoff * total / 2) - 1)
+        while 2.0 * m / total < cutoff:
+            m += 1
+        return m
+
+    def _candidate_lengths(self, query_length: int, cutoff: float) -> Iterable[int]:
+        """real_quick_ratio 不低于 cutoff 的所有词长（按相同的浮点公式判断）"""
+        for length in range(1, self._max_length + 1):
+            total = length + query_length
+            if 2.0 * min(length, query_length) / total >= cutoff:
+                yield length
@@ -0,0 +1,289 @@
+import re
+import sys
+import calendar
+from typing import List, Optional, Iterable, Iterator, Tuple
+
+
+class LogEntry:
+    """
+    表示一条日志记录。
+    使用 __slots__ 去掉每个实例的 __dict__；玩家名和类型经过驻留，同名条目共享同一个字符串对象。
+    """
+    __slots__ = ('id', 'player_name', 'timestamp', 'content', 'entry_type', 'timestamp_value')
+
+    def __init__(self, id: int, player_name: str, timestamp: str, content: str,
+                 entry_type: str = "", timestamp_value: Optional[int] = None):
+        self.id = id                                        # 条目序号（从1开始）
+        self.player_name = sys.intern(player_name)          # 玩家名（可能为空）
+        self.timestamp = timestamp                          # 时间戳字符串（可能为空）
+        self.content = content                              # 正文内容（可能跨行，用换行符分隔）
+        self.entry_type = sys.intern(entry_type)            # 类型：KP, PL, OB, BOT（由_classify_entry_types设置）
+        self.timestamp_value = timestamp_value              # 时间戳的排序键（秒数，缺少的日期部分已推断；无时间戳为None）
+
+    def __repr__(self) -> str:
+        return (f"LogEntry(id={self.id!r}, player_name={self.player_name!r}, timestamp={self.timestamp!r}, "
+                f"content={self.content!r}, entry_type={self.entry_type!r}, "
+                f"timestamp_value={self.timestamp_value!r})")
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None
+
+
+def pack_timestamp(timestamp: str) -> Optional[int]:
+    """将带完整日期的时间戳（YYYY-MM-DD HH:MM:SS 或 YYYY/MM/DD HH:MM:SS）转换为秒数（按UTC计），其他格式返回None"""
+    if len(timestamp) != 19:
+        return None
+    try:
+        return calendar.timegm((
+            int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]),
+            int(timestamp[11:13]), int(timestamp[14:16]), int(timestamp[17:19])
+        ))
+    except ValueError:
+        return None
+
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+# 只有时间的日志，时间倒退超过该秒数视为跨过了零点（小幅倒退视为消息乱序）
+DAY_ROLLOVER_TOLERANCE = 60 * 60
+
+# 只有月日的日志，日期倒退超过该秒数视为跨年
+YEAR_ROLLOVER_TOLERANCE = 180 * SECONDS_PER_DAY
+
+# 没有任何日期上下文时使用的年份
+DEFAULT_YEAR = 1970
+
+
+class TimestampKeyBuilder:
+    """
+    将各种格式的时间戳依次转换为统一的整数排序键（按UTC计的秒数）。
+    缺少的日期部分从之前的时间戳推断：
+      - MM-DD HH:MM:SS 使用最近一个完整日期的年份，日期大幅倒退时年份加一
+      - HH:MM:SS 使用最近一个日期，时间倒退超过 DAY_ROLLOVER_TOLERANCE 时日期加一天
+    时间戳必须按日志中出现的顺序依次传入。
+    """
+
+    def __init__(self):
+        self._year = DEFAULT_YEAR
+        self._day_start = 0             # 当前日期零点对应的秒数
+        self._last_value: Optional[int] = None
+
+    def key(self, timestamp: str) -> Optional[int]:
+        """
+        返回时间戳的排序键；timestamp 须为 _TIME_PATTERNS 之一（ts0 已标准化为 YYYY/MM/DD HH:MM:SS）。
+        月份等超出范围无法换算时返回None，且不影响后续推断。
+        """
+        length = len(timestamp)
+        if length == 19:
+            value = pack_timestamp(timestamp)
+            if value is None:
+                return None
+            self._year = int(timestamp[0:4])
+        elif length == 14:
+            try:
+                value = self._month_day_key(timestamp)
+            except ValueError:
+                return None
+        else:
+            value = self._day_start + self._time_of_day(timestamp[0:8])
+            if self._last_value is not None and value < self._last_value - DAY_ROLLOVER_TOLERANCE:
+                self._day_start += SECONDS_PER_DAY
+                value += SECONDS_PER_DAY
+        self._day_start = value - value % SECONDS_PER_DAY
+        self._last_value = value
+        return value
+
+    def get_state(self) -> Tuple[int, int, Optional[int]]:
+        """推断所用的上下文；完整日期的时间戳之后，上下文只由该时间戳决定"""
+        return self._year, self._day_start, self._last_value
+
+    def set_state(self, state: Tuple[int, int, Optional[int]]):
+        self._year, self._day_start, self._last_value = state
+
+    def _month_day_key(self, timestamp: str) -> int:
+        month, day = int(timestamp[0:2]), int(timestamp[3:5])
+        seconds = self._time_of_day(timestamp[6:14])
+        value = calendar.timegm((self._year, month, day, 0, 0, 0)) + seconds
+        if self._last_value is not None and value < self._last_value - YEAR_ROLLOVER_TOLERANCE:
+            self._year += 1
+            value = calendar.timegm((self._year, month, day, 0, 0, 0)) + seconds
+        return value
+
+    @staticmethod
+    def _time_of_day(text: str) -> int:
+        return int(text[0:2]) * 3600 + int(text[3:5]) * 60 + int(text[6:8])
+
+
+# 时间戳匹配模式（按优先级）
+_TIME_PATTERNS = [
+    r'(?P<slash_date>\d{4}/\d{2}/\d{2})[:] (?P<slash_time>\d{2}:\d{2}:\d{2})',  # 2026/02/26: 00:00:05
+    r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}',        # 2025-09-21 21:33:30
+    r'\d{2}-\d{2} \d{2}:\d{2}:\d{2}',              # 09-21 21:33:30
+    r'\d{2}:\d{2}:\d{2}',                          # 21:33:30
+]
+
+# 逐个格式单独编译，仅用于少数需要按优先级复核的行
+_PRIORITY_TIME_RES = [re.compile(r'(?P<ts%d>%s)' % (i, p)) for i, p in enumerate(_TIME_PATTERNS)]
+
+# 合并后的行首识别模式：所有时间戳格式与尖括号玩家名放进同一个交替式，每行只 search 一次。
+# search 返回的是行内最靠左的命中；原有规则是"高优先级格式优先，不论位置"，
+# 两者只在行内还有另一个时间戳时才可能不同（时间戳都含两个半角冒号），这种行再按优先级复核。
+_ENTRY_HEAD_RE = re.compile(
+    '|'.join(
+        [r'(?P<ts%d>%s)' % (i, p) for i, p in enumerate(_TIME_PATTERNS)]
+        + [r'(?P<angle>\A<(?P<angle_name>[^>]+)>[：:]\s*(?P<angle_rest>.*))']
+    )
+)
+
+
+def _match_entry_head(line: str):
+    """识别条目起始行，返回 (match, 分组名)，分组名为 ts0~ts3 或 angle；不是起始行返回 (None, None)"""
+    if ':' not in line and '：' not in line:
+        return None, None
+    match = _ENTRY_HEAD_RE.search(line)
+    if match is None:
+        return None, None
+    group = match.lastgroup
+    colons = line.count(':')
+    if (group == 'angle' and colons >= 2) or (group != 'ts0' and group != 'angle' and colons >= 4):
+        for pattern in _PRIORITY_TIME_RES:
+            ts_match = pattern.search(line)
+            if ts_match:
+                return ts_match, ts_match.lastgroup
+    return match, group
+
+
+def is_entry_head(line: str) -> bool:
+    """该行是否开始一个新条目（时间戳或尖括号玩家名），用于分段解析时选择切分位置"""
+    if not line.strip():
+        return False
+    return _match_entry_head(line.rstrip('\n'))[0] is not None
+
+
+class LogParser:
+    """
+    逐行日志解析器。
+    每次 feed 一行文本，条目完整时返回该条目；输入结束后调用 finish 取出剩余条目。
+    解析规则与 parse_log_entries 相同：
+      - 行内出现时间戳则开始新条目，时间戳之前的部分为玩家名
+      - 否则行首为 <player_name>: 时开始新条目（无时间戳）
+      - 其余非空行作为当前条目的续行；第一个条目之前的续行丢弃
+      - 若整个输入都没有识别出条目，则将所有非空行作为无格式条目
+    timestamp_keys 为 False 时不计算 timestamp_value（分段并行解析时由调用方按全文顺序补算）。
+    """
+
+    def __init__(self, use_timestamp_parsing: bool = True, timestamp_keys: bool = True):
+        self.use_timestamp_parsing = use_timestamp_parsing
+        self.entry_count = 0
+        self._current: Optional[LogEntry] = None
+        self._timestamp_keys = TimestampKeyBuilder() if timestamp_keys else None
+        self._content_parts: List[str] = []
+        # 在出现第一个条目之前暂存的非空行，用于全文无格式时的回退
+        self._orphan_lines: Optional[List[str]] = []
+
+    def feed(self, line: str) -> Optional[LogEntry]:
+        """输入一行文本，如果因此结束了一个条目则返回该条目"""
+        stripped = line.rstrip('\n')
+        line_content = stripped.strip()
+        if not line_content:
+            return None
+
+        if not self.use_timestamp_parsing:
+            self.entry_count += 1
+            return LogEntry(id=self.entry_count, player_name="", timestamp="", content=line_content)
+
+        match, group = _match_entry_head(stripped)
+        if match is None:
+            # 既无时间戳也无玩家名，作为当前条目的续行
+            if self._current is not None:
+                self._content_parts.append(line_content)
+            elif self._orphan_lines is not None:
+                self._orphan_lines.append(line_content)
+            return None
+
+        finished = self._flush()
+        self._orphan_lines = None
+        self.entry_count += 1
+
+        timestamp_value = None
+        if group == 'angle':
+            # 无时间戳，尖括号玩家名
+            player_name = match.group('angle_name').strip()
+            timestamp = ""
+            rest = match.group('angle_rest').strip()
+        else:
+            start, end = match.span(group)
+            player_name = stripped[:start].strip().rstrip(' :：')
+            if group == 'ts0':
+                # 标准化时间戳：将日期和时间之间的冒号替换为空格
+                timestamp = match.group('slash_date') + ' ' + match.group('slash_time')
+            else:
+                timestamp = stripped[start:end]
+            if self._timestamp_keys is not None:
+                timestamp_value = self._timestamp_keys.key(timestamp)
+            rest = stripped[end:].strip()
+
+        self._current = LogEntry(
+            id=self.entry_count,
+            player_name=player_name,
+            timestamp=timestamp,
+            content=rest,
+            timestamp_value=timestamp_value
+        )
+        if rest:
+            self._content_parts.append(rest)
+        return finished
+
+    def finish(self) -> List[LogEntry]:
+        """输入结束，返回剩余的条目"""
+        finished = self._flush()
+        if finished is not None:
+            return [finished]
+        if self.entry_count == 0 and self._orphan_lines:
+            # 没有任何条目，则将非空行作为无格式条目处理
+            entries = []
+            for line_content in self._orphan_lines:
+                self.entry_count += 1
+                entries.append(LogEntry(id=self.entry_count, player_name="", timestamp="",
+                                        content=line_content))
+            self._orphan_lines = None
+            return entries
+        return []
+
+    def _flush(self) -> Optional[LogEntry]:
+        entry = self._current
+        if entry is None:
+            return None
+        if self._content_parts:
+            entry.content = '\n'.join(self._content_parts)
+        self._current = None
+        self._content_parts = []
+        return entry
+
+
+def iter_log_entries(lines: Iterable[str], use_timestamp_parsing: bool = True) -> Iterator[LogEntry]:
+    """逐行解析，依次产出 LogEntry"""
+    parser = LogParser(use_timestamp_parsing)
+    for line in lines:
+        entry = parser.feed(line)
+        if entry is not None:
+            yield entry
+    yield from parser.finish()
+
+
+def parse_log_entries(text: str, use_timestamp_parsing: bool = True) -> List[LogEntry]:
+    """
+    将原始文本解析为 LogEntry 列表。
+    支持标准时间戳格式和尖括号玩家名格式（无时间戳）。
+    时间戳格式（按优先级）：
+      - YYYY/MM/DD: HH:MM:SS
+      - YYYY-MM-DD HH:MM:SS
+      - MM-DD HH:MM:SS
+      - HH:MM:SS
+    尖括号格式：<player_name>: content 或 <player_name>：content
+    """
+    return list(iter_log_entries(text.splitlines(), use_timestamp_parsing))
@@ -0,0 +1,131 @@
+import os
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from .log_parser import LogEntry, LogParser, TimestampKeyBuilder, is_entry_head, parse_log_entries
+
+
+def _next_entry_head(text: str, position: int) -> Optional[int]:
+    """从 position（行首）开始向后查找第一个条目起始行，返回其行首位置；没有则返回None"""
+    length = len(text)
+    while position < length:
+        newline = text.find('\n', position)
+        line_end = length if newline < 0 else newline + 1
+        lines = text[position:line_end].splitlines()
+        if lines and is_entry_head(lines[0]):
+            return position
+        position = line_end
+    return None
+
+
+def split_at_entry_heads(text: str, chunk_count: int, use_timestamp_parsing: bool = True) -> List[int]:
+    """
+    将文本切分为约 chunk_count 段，返回各段的起止位置 [0, b1, ..., len(text)]。
+    只在 '\\n' 之后切分（不会拆开 \\r\\n），且（按时间戳解析时）除第一段外每段都从条目起始行开始，
+    因此续行总与其所属条目在同一段，各段独立解析的结果依次相连即为全文的解析结果。
+    找不到合适的切分位置时只返回一段。
+    """
+    bounds = [0]
+    length = len(text)
+    for i in range(1, chunk_count):
+        target = max(length * i // chunk_count, bounds[-1] + 1)
+        newline = text.find('\n', target)
+        if newline < 0:
+            break
+        position = newline + 1
+        if use_timestamp_parsing:
+            position = _next_entry_head(text, position)
+            if position is None:
+                break
+        bounds.append(position)
+    bounds.append(length)
+    return bounds
+
+
+# 工作进程返回的一段解析结果：玩家名、时间戳、正文、时间戳排序键四列，
+# 段内第一个完整日期时间戳的下标（没有则为None），以及段尾的时间戳推断上下文
+ChunkResult = Tuple[List[str], List[str], List[str], List[Optional[int]], Optional[int], Tuple]
+
+
+def _parse_chunk(chunk: str, use_timestamp_parsing: bool) -> ChunkResult:
+    """
+    在工作进程中解析一段文本，结果按列返回，序号由主进程统一编号。
+    时间戳排序键在段内按全新的上下文计算：从段内第一个完整日期的时间戳（锚点）起，
+    上下文只由时间戳本身决定，结果与顺序解析相同；锚点之前的排序键由主进程按全文顺序重新计算。
+    分段时全文至少有两段、后面的段都以条目开始，所以第一段里首个条目之前的行
+    与顺序解析一样直接丢弃，不作为无格式条目。
+    """
+    parser = LogParser(use_timestamp_parsing, timestamp_keys=False)
+    entries = []
+    for line in chunk.splitlines():
+        entry = parser.feed(line)
+        if entry is not None:
+            entries.append(entry)
+    if parser.entry_count:
+        entries.extend(parser.finish())
+
+    timestamp_keys = TimestampKeyBuilder()
+    values = []
+    anchor = None
+    for index, entry in enumerate(entries):
+        timestamp = entry.timestamp
+        value = timestamp_keys.key(timestamp) if timestamp else None
+        if anchor is None and value is not None and len(timestamp) == 19:
+            anchor = index
+        values.append(value)
+    return ([entry.player_name for entry in entries], [entry.timestamp for entry in entries],
+            [entry.content for entry in entries], values, anchor, timestamp_keys.get_state())
+
+
+def default_parse_workers() -> int:
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+class ParallelLogParser:
+    """
+    多进程分段解析大日志，结果与 parse_log_entries 完全相同。
+    文本在条目起始行处切分（见 split_at_entry_heads），各段交给进程池解析；
+    主进程按顺序合并，统一重新编号；缺少日期的时间戳要从之前的时间戳推断，
+    各段开头到第一个完整日期之前的排序键由主进程接着上一段的上下文重新计算。
+    文本短于 min_chars 或只有一个工作进程时直接顺序解析。进程池在多次解析之间保持。
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, min_chars: int = 8 * 1024 * 1024,
+                 chunks_per_worker: int = 4):
+        self.max_workers = max_workers or default_parse_workers()
+        self.min_chars = min_chars
+        self.chunks_per_worker = chunks_per_worker
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def parse(self, text: str, use_timestamp_parsing: bool = True) -> List[LogEntry]:
+        if self.max_workers <= 1 or len(text) < self.min_chars:
+            return parse_log_entries(text, use_timestamp_parsing)
+        bounds = split_at_entry_heads(text, self.max_workers * self.chunks_per_worker, use_timestamp_parsing)
+        if len(bounds) <= 2:
+            return parse_log_entries(text, use_timestamp_parsing)
+
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        chunks = [text[start:end] for start, end in zip(bounds, bounds[1:])]
+        results = self._pool.map(_parse_chunk, chunks, [use_timestamp_parsing] * len(chunks))
+
+        timestamp_keys = TimestampKeyBuilder()
+        entries = []
+        for player_names, timestamps, contents, values, anchor, state in results:
+            # 锚点之前的排序键依赖上一段的上下文，按全文顺序重新计算
+            recompute = len(values) if anchor is None else anchor
+            for index in range(recompute):
+                timestamp = timestamps[index]
+                values[index] = timestamp_keys.key(timestamp) if timestamp else None
+            if anchor is not None:
+                timestamp_keys.set_state(state)
+            first_id = len(entries) + 1
+            entries.extend(map(LogEntry, range(first_id, first_id + len(values)), player_names, timestamps,
+                               contents, repeat("", len(values)), values))
+        return entries
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
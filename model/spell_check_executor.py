@@ -0,0 +1,82 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import List, Iterator, Optional, Callable, Tuple
+
+# 工作进程中的文本处理器（由 _init_worker 创建，进程内复用）
+_worker_processor = None
+
+
+def _init_worker(language: str, similarity_threshold: float):
+    """工作进程初始化：创建并预热该语言的处理器（如加载 pycorrector 的 Corrector）"""
+    global _worker_processor
+    from .text_processor import TextProcessorFactory
+    _worker_processor = TextProcessorFactory.create_processor(language, similarity_threshold)
+
+
+def _spell_check_batch(paragraphs: List[str]) -> List[str]:
+    """在工作进程中修正一批段落"""
+    return [_worker_processor.spell_check(paragraph)[0] for paragraph in paragraphs]
+
+
+def default_worker_count() -> int:
+    """
+    默认工作进程数：保留一个核心给界面线程，最多4个（每个进程都要加载一份纠错模型）。
+    只能分出一个进程时返回0：单个工作进程要另外加载纠错模型并传递每批段落，比在当前进程中逐段修正更慢。
+    """
+    workers = min(4, (os.cpu_count() or 1) - 1)
+    return workers if workers > 1 else 0
+
+
+class SpellCheckExecutor:
+    """
+    多进程错别字修正。
+    段落按批分发给工作进程，每个进程持有自己预热好的处理器；进程池在多次修正之间保持，
+    语言不变时不需要重新加载纠错模型。
+    结果按批返回 (起始下标, 修正结果列表)，调用方按下标放回原位置，顺序与输入一致。
+    """
+
+    def __init__(self, language: str, similarity_threshold: float = 0.8,
+                 max_workers: Optional[int] = None, batch_size: int = 32):
+        self.language = language
+        self.similarity_threshold = similarity_threshold
+        self.max_workers = max_workers or max(1, default_worker_count())
+        self.batch_size = batch_size
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(self.language, self.similarity_threshold)
+            )
+        return self._pool
+
+    def map_batches(self, paragraphs: List[str],
+                    stop_check: Optional[Callable[[], bool]] = None) -> Iterator[Tuple[int, List[str]]]:
+        """
+        按完成顺序产出 (起始下标, 修正结果列表)。
+        stop_check 返回 True 时取消尚未开始的批次并结束（正在处理的批次结果被丢弃）。
+        """
+        pool = self._ensure_pool()
+        futures = {
+            pool.submit(_spell_check_batch, paragraphs[start:start + self.batch_size]): start
+            for start in range(0, len(paragraphs), self.batch_size)
+        }
+        pending = set(futures)
+        try:
+            while pending:
+                if stop_check and stop_check():
+                    return
+                # 定时醒来检查取消，不必等到下一批完成
+                done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield futures[future], future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
@@ -0,0 +1,116 @@
+import re
+from typing import Dict, List, Tuple
+
+# 各语言的引号对 (左, 右)；左右相同的引号按出现次数的奇偶配对
+QUOTE_PAIRS: Dict[str, List[Tuple[str, str]]] = {
+    'zh_CN': [('“', '”'), ('‘', '’')],
+    'zh_TW': [('「', '」'), ('『', '』')],
+    'en': [('"', '"'), ("'", "'")],
+    'ja': [('「', '」'), ('『', '』')],
+}
+DEFAULT_QUOTE_PAIRS = [('"', '"')]
+
+BRACKET_PAIRS = {
+    '(': ')', '[': ']', '{': '}',
+    '（': '）', '【': '】', '《': '》'
+}
+RIGHT_BRACKETS = frozenset(BRACKET_PAIRS.values())
+
+SENTENCE_END = frozenset({'。', '！', '？', '!', '?', '.', '…'})
+
+# 各语言逐字符替换的符号
+CHINESE_SYMBOLS = {',': '，', '!': '！', '?': '？', ':': '：', ';': '；',
+                   '(': '（', ')': '）', '[': '【', ']': '】'}
+ENGLISH_SYMBOLS = {'，': ',', '。': '.', '！': '!', '？': '?', '：': ':', '；': ';',
+                   '（': '(', '）': ')', '【': '[', '】': ']'}
+JAPANESE_SYMBOLS = {',': '、'}
+
+_CHINESE_TABLE = str.maketrans(CHINESE_SYMBOLS)
+_ENGLISH_TABLE = str.maketrans(ENGLISH_SYMBOLS)
+_JAPANESE_TABLE = str.maketrans(JAPANESE_SYMBOLS)
+
+# 引号在扫描中的作用
+_SAME, _LEFT, _RIGHT = 0, 1, 2
+
+# 语言 -> (引号对, 引号字符 -> (引号对下标, 作用), 匹配引号和括号的正则)
+_BALANCE_RULES: Dict[str, Tuple[List[Tuple[str, str]], Dict[str, Tuple[int, int]], "re.Pattern"]] = {}
+
+
+def _balance_rules(lang: str):
+    rules = _BALANCE_RULES.get(lang)
+    if rules is None:
+        pairs = QUOTE_PAIRS.get(lang, DEFAULT_QUOTE_PAIRS)
+        roles = {}
+        for index, (left, right) in enumerate(pairs):
+            if left == right:
+                roles[left] = (index, _SAME)
+            else:
+                roles[left] = (index, _LEFT)
+                roles[right] = (index, _RIGHT)
+        symbols = ''.join(roles) + ''.join(BRACKET_PAIRS) + ''.join(BRACKET_PAIRS.values())
+        pattern = re.compile('[' + ''.join(re.escape(ch) for ch in symbols) + ']')
+        rules = _BALANCE_RULES[lang] = (pairs, roles, pattern)
+    return rules
+
+
+def balance_symbols(text: str, lang: str) -> str:
+    """
+    结果与依次修正引号、补句号、补括号的逐步实现（benchmarks/symbol_correction.py）相同，但只扫描一遍：
+    各引号对只与自己的字符有关，补齐的引号和句号都不是括号，因此引号和括号的配对可以在同一次扫描中完成；
+    扫描由正则只找出引号和括号，其余字符不经过 Python 循环。
+    """
+    pairs, roles, pattern = _balance_rules(lang)
+    open_counts = [0] * len(pairs)
+    brackets = []
+    # 没有配对的右引号改为左引号
+    unmatched_rights = []
+
+    for match in pattern.finditer(text):
+        ch = match.group()
+        role = roles.get(ch)
+        if role is None:
+            if ch in RIGHT_BRACKETS:
+                if brackets and BRACKET_PAIRS[brackets[-1]] == ch:
+                    brackets.pop()
+            else:
+                brackets.append(ch)
+            continue
+        index, kind = role
+        if kind == _SAME:
+            open_counts[index] ^= 1
+        elif kind == _LEFT:
+            open_counts[index] += 1
+        elif open_counts[index]:
+            open_counts[index] -= 1
+        else:
+            open_counts[index] += 1
+            unmatched_rights.append(match.start())
+
+    if unmatched_rights:
+        parts = []
+        previous = 0
+        for position in unmatched_rights:
+            parts.append(text[previous:position])
+            parts.append(pairs[roles[text[position]][0]][0])
+            previous = position + 1
+        parts.append(text[previous:])
+        text = ''.join(parts)
+
+    text += ''.join(right * count for (_, right), count in zip(pairs, open_counts))
+    if len(text) >= 10 and text[-1] not in SENTENCE_END:
+        text += '。' if lang.startswith('zh') or lang == 'ja' else '.'
+    if brackets:
+        text += ''.join(BRACKET_PAIRS[left] for left in reversed(brackets))
+    return text
+
+
+def correct_chinese_symbols(text: str, lang='zh_CN') -> str:
+    return balance_symbols(text.translate(_CHINESE_TABLE), lang)
+
+
+def correct_english_symbols(text: str) -> str:
+    return balance_symbols(text.translate(_ENGLISH_TABLE), 'en')
+
+
+def correct_japanese_symbols(text: str) -> str:
+    return balance_symbols(text.translate(_JAPANESE_TABLE), 'ja')
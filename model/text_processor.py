@@ -1,28 +1,27 @@
 import re
 import os
-from typing import List, Tuple, Any, Set, Optional, Callable
-import difflib
-
-# 尝试导入各语言处理库
-try:
-    import pycorrector
-except ImportError:
-    pycorrector = None
-    print("警告: pycorrector 未安装，中文错别字修正功能将不可用")
-
-try:
-    import symspellpy
-    from symspellpy import SymSpell
-except ImportError:
-    symspellpy = None
-    SymSpell = None
-    print("警告: symspellpy 未安装，英文错别字修正功能将不可用")
-
-try:
-    import jieba
-except ImportError:
-    jieba = None
-    print("警告: jieba 未安装，中文/日文分词将不可用")
+import threading
+from typing import List, Tuple, Any, Set, Dict, Optional, Callable, Iterator
+
+from .dedup import BaseDeduplicator, WindowDeduplicator, DeduplicatorFactory
+from .spell_check_executor import SpellCheckExecutor, default_worker_count
+from .correction_cache import CorrectionCache
+from .fuzzy_index import FuzzyWordIndex
+from .symbol_corrector import correct_chinese_symbols, correct_english_symbols, correct_japanese_symbols
+from utils.dictionary_compiler import load_word_set_snapshot, load_symspell_snapshot
+from utils.lazy_import import LazyModule, warm_up
+
+# 各语言处理库较重，延迟到第一次使用时才导入（也可由 warm_up_libraries 在后台提前导入）
+pycorrector = LazyModule('pycorrector', "警告: pycorrector 未安装，中文错别字修正功能将不可用")
+symspellpy = LazyModule('symspellpy', "警告: symspellpy 未安装，英文错别字修正功能将不可用")
+jieba = LazyModule('jieba', "警告: jieba 未安装，中文/日文分词将不可用")
+LANGUAGE_LIBRARIES = (pycorrector, symspellpy, jieba)
+
+
+def warm_up_libraries():
+    """在后台线程中导入各语言处理库，返回该线程"""
+    return warm_up(LANGUAGE_LIBRARIES)
+
 
 # 词典文件路径
 DICTIONARY_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "dictionary")
@@ -36,171 +35,28 @@ JA_DICT = os.path.join(DICTIONARY_DIR, "Japanese_dictionary.txt")
 JA_STOP = os.path.join(DICTIONARY_DIR, "Japanese_stopwords.txt")
 
 
-def load_word_set(filepath: str) -> Set[str]:
-    """从文件加载每行一个词的集合（跳过空行和注释）"""
-    words = set()
-    if not os.path.exists(filepath):
-        print(f"警告: 词典文件不存在 {filepath}")
-        return words
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    words.add(line)
-    except Exception as e:
-        print(f"读取词典文件失败 {filepath}: {e}")
-    return words
-
-
-# ========== 引号修正核心函数 ==========
-def fix_quotes(text: str, lang: str) -> str:
-    """修正引号：平衡左右引号，动态调整顺序错误，补齐缺失"""
-    quote_configs = {
-        'zh_CN': [('“', '”'), ('‘', '’')],
-        'zh_TW': [('「', '」'), ('『', '』')],
-        'en': [('"', '"'), ("'", "'")],
-        'ja': [('「', '」'), ('『', '』')],
-    }
-    configs = quote_configs.get(lang, [('"', '"')])
-
-    for left, right in configs:
-        if left == right:
-            # 相同字符引号
-            count = 0
-            result_chars = []
-            for ch in text:
-                if ch == left:
-                    if count == 0:
-                        count = 1
-                    else:
-                        count -= 1
-                    result_chars.append(ch)
-                else:
-                    result_chars.append(ch)
-            if count > 0:
-                result_chars.append(right * count)
-            text = ''.join(result_chars)
-        else:
-            # 不同字符引号，栈匹配
-            stack = []
-            result_chars = []
-            for ch in text:
-                if ch == left:
-                    stack.append(left)
-                    result_chars.append(ch)
-                elif ch == right:
-                    if stack:
-                        stack.pop()
-                        result_chars.append(ch)
-                    else:
-                        result_chars.append(left)
-                        stack.append(left)
-                else:
-                    result_chars.append(ch)
-            for _ in stack:
-                result_chars.append(right)
-            text = ''.join(result_chars)
-    return text
-
-
-def add_period_if_needed(text: str, lang: str) -> str:
-    if not text:
-        return text
-    if len(text) < 10:
-        return text
-    sentence_end = {'。', '！', '？', '!', '?', '.', '…'}
-    last_char = text[-1]
-    if last_char not in sentence_end:
-        if lang.startswith('zh') or lang == 'ja':
-            text += '。'
-        elif lang == 'en':
-            text += '.'
-        else:
-            text += '.'
-    return text
-
-
-def fix_brackets(text: str) -> str:
-    stack = []
-    result = []
-    bracket_pairs = {
-        '(': ')', '[': ']', '{': '}',
-        '（': '）', '【': '】', '《': '》'
-    }
-    left_brackets = set(bracket_pairs.keys())
-    right_brackets = set(bracket_pairs.values())
-
-    for ch in text:
-        if ch in left_brackets:
-            stack.append(ch)
-        elif ch in right_brackets:
-            if stack:
-                last = stack[-1]
-                if bracket_pairs.get(last) == ch:
-                    stack.pop()
-        result.append(ch)
-
-    for left in reversed(stack):
-        result.append(bracket_pairs[left])
-    return ''.join(result)
-
-
-def correct_chinese_symbols(text: str, lang='zh_CN') -> str:
-    text = re.sub(r',', '，', text)
-    text = re.sub(r'!', '！', text)
-    text = re.sub(r'\?', '？', text)
-    text = re.sub(r':', '：', text)
-    text = re.sub(r';', '；', text)
-    text = re.sub(r'\(', '（', text)
-    text = re.sub(r'\)', '）', text)
-    text = re.sub(r'\[', '【', text)
-    text = re.sub(r'\]', '】', text)
-
-    text = fix_quotes(text, lang)
-    text = add_period_if_needed(text, lang)
-    text = fix_brackets(text)
-    return text
-
-
-def correct_english_symbols(text: str) -> str:
-    text = re.sub(r'，', ',', text)
-    text = re.sub(r'。', '.', text)
-    text = re.sub(r'！', '!', text)
-    text = re.sub(r'？', '?', text)
-    text = re.sub(r'：', ':', text)
-    text = re.sub(r'；', ';', text)
-    text = re.sub(r'（', '(', text)
-    text = re.sub(r'）', ')', text)
-    text = re.sub(r'【', '[', text)
-    text = re.sub(r'】', ']', text)
-
-    text = fix_quotes(text, 'en')
-    text = add_period_if_needed(text, 'en')
-    text = fix_brackets(text)
-    return text
-
-
-def correct_japanese_symbols(text: str) -> str:
-    text = re.sub(r',', '、', text)
-    text = fix_quotes(text, 'ja')
-    text = add_period_if_needed(text, 'ja')
-    text = fix_brackets(text)
-    return text
-
-
 # ========== 基类 ==========
 class BaseTextProcessor:
+    language = ""
+    # 修正算法的版本，算法改变时递增，使修正缓存中的旧结果失效
+    algorithm_version = 1
+
+    # 所有处理器共享的修正缓存（键中包含语言和词典版本，不同处理器之间不会混用）
+    correction_cache = CorrectionCache()
+
     def __init__(self, similarity_threshold: float = 0.8):
         self.similarity_threshold = similarity_threshold
         self.dictionary: Set[str] = set()       # 纠错词典
         self.stopwords: Set[str] = set()        # 停用词
+        self.dictionary_files: List[str] = []   # 影响修正结果的词典文件
+        self._dictionary_version: Optional[str] = None
 
     def load_dictionary(self, filepath: str):
-        self.dictionary = load_word_set(filepath)
+        # 从预编译的快照加载，源文件变化时自动重新编译
+        self.dictionary = load_word_set_snapshot(filepath)
 
     def load_stopwords(self, filepath: str):
-        self.stopwords = load_word_set(filepath)
+        self.stopwords = load_word_set_snapshot(filepath)
 
     def deduplicate(self, text: str) -> Tuple[str, List[dict]]:
         return text, []
@@ -211,47 +67,62 @@ class BaseTextProcessor:
     def correct_symbols(self, text: str) -> Tuple[str, List[dict]]:
         raise NotImplementedError
 
+    def engine_signature(self) -> str:
+        """所用纠错引擎的标识（引擎是否可用会影响修正结果）"""
+        return ""
+
+    def dictionary_version(self) -> str:
+        """处理器、纠错引擎和词典文件（大小、修改时间）共同决定的版本，作为修正缓存键的一部分"""
+        if self._dictionary_version is None:
+            parts = [type(self).__name__, str(self.algorithm_version), self.engine_signature()]
+            for path in self.dictionary_files:
+                try:
+                    stat = os.stat(path)
+                    parts.append(f"{os.path.basename(path)}:{stat.st_size}:{stat.st_mtime_ns}")
+                except OSError:
+                    parts.append(f"{os.path.basename(path)}:missing")
+            self._dictionary_version = "|".join(parts)
+        return self._dictionary_version
+
+    def cache_key(self, text: str):
+        return CorrectionCache.make_key(self.language, self.dictionary_version(), text)
+
+    def spell_check_cached(self, text: str) -> Tuple[str, List[dict]]:
+        """带缓存的错别字修正：相同的段落只修正一次"""
+        key = self.cache_key(text)
+        corrected = self.correction_cache.get(key)
+        if corrected is None:
+            corrected, _ = self.spell_check(text)
+            self.correction_cache.put(key, corrected)
+        return corrected, []
+
     def deduplicate_entries(self, entries: List[Any], threshold: float,
-                            skip_condition: Callable[[Any], bool] = None) -> List[Any]:
+                            skip_condition: Callable[[Any], bool] = None,
+                            deduplicator: Optional[BaseDeduplicator] = None,
+                            progress_callback: Optional[Callable[[int, int, str], None]] = None,
+                            stop_check: Optional[Callable[[], bool]] = None) -> Optional[List[Any]]:
         """
-        对条目列表进行滑动窗口去重（窗口大小=5）。
+        对条目列表进行去重。
         :param entries: 条目列表
         :param threshold: 相似度阈值
         :param skip_condition: 函数，接受一个条目，返回 True 表示该条目无条件保留（不参与去重）
-        :return: 去重后的条目列表
+        :param deduplicator: 去重引擎，默认为滑动窗口（窗口大小=5）
+        :param progress_callback: 进度回调 (已处理数, 总数, 状态)
+        :param stop_check: 返回 True 时停止去重
+        :return: 去重后的条目列表；被取消时返回None
         """
-        if skip_condition is None:
-            skip_condition = lambda e: False
-
-        result = []
-        recent_kept = []  # 存放最近保留的、需要参与去重的条目
-
-        for entry in entries:
-            if skip_condition(entry):
-                result.append(entry)
-                continue
-
-            duplicate = False
-            # 与最近最多5个条目比较
-            for kept in recent_kept[-5:]:
-                s = difflib.SequenceMatcher(None, entry.content, kept.content)
-                if s.ratio() >= threshold:
-                    duplicate = True
-                    break
-            if not duplicate:
-                result.append(entry)
-                recent_kept.append(entry)
-
-        # 重新编号
-        for idx, entry in enumerate(result, start=1):
-            entry.id = idx
-        return result
+        if deduplicator is None:
+            deduplicator = WindowDeduplicator(window_size=5)
+        return deduplicator.deduplicate(entries, threshold, skip_condition, progress_callback, stop_check)
 
 
 # ========== 简体中文处理器 ==========
 class ChineseSimplifiedProcessor(BaseTextProcessor):
+    language = 'zh_CN'
+
     def __init__(self, similarity_threshold: float = 0.8):
         super().__init__(similarity_threshold)
+        self.dictionary_files = [ZH_CN_FREQ]
         self.load_dictionary(ZH_CN_FREQ)
         self.load_stopwords(ZH_CN_STOP)
         self.corrector = None
@@ -286,14 +157,20 @@ class ChineseSimplifiedProcessor(BaseTextProcessor):
             print("警告: pycorrector 不可用，简体中文错别字修正跳过")
             return text, []
 
+    def engine_signature(self) -> str:
+        return "pycorrector" if self.corrector else "none"
+
     def correct_symbols(self, text: str) -> Tuple[str, List[dict]]:
         return correct_chinese_symbols(text, 'zh_CN'), []
 
 
 # ========== 繁体中文处理器 ==========
 class ChineseTraditionalProcessor(BaseTextProcessor):
+    language = 'zh_TW'
+
     def __init__(self, similarity_threshold: float = 0.8):
         super().__init__(similarity_threshold)
+        self.dictionary_files = [ZH_TW_FREQ]
         self.load_dictionary(ZH_TW_FREQ)
         self.load_stopwords(ZH_TW_STOP)
         self.corrector = None
@@ -328,55 +205,112 @@ class ChineseTraditionalProcessor(BaseTextProcessor):
             print("警告: pycorrector 不可用，繁体中文错别字修正跳过")
             return text, []
 
+    def engine_signature(self) -> str:
+        return "pycorrector" if self.corrector else "none"
+
     def correct_symbols(self, text: str) -> Tuple[str, List[dict]]:
         return correct_chinese_symbols(text, 'zh_TW'), []
 
 
 # ========== 英文处理器 ==========
+# 英文单词（允许中间有撇号，如 don't）；单词以外的空白、标点、数字原样保留
+_EN_WORD_RE = re.compile(r"[A-Za-z]+(?:'[A-Za-z]+)*")
+
+
+def _match_case(term: str, original: str) -> str:
+    """让修正结果沿用原词的大小写形式（全大写、首字母大写）"""
+    if len(original) > 1 and original.isupper():
+        return term.upper()
+    if original[:1].isupper():
+        return term[:1].upper() + term[1:]
+    return term
+
+
 class EnglishProcessor(BaseTextProcessor):
+    language = 'en'
+    algorithm_version = 2
+
+    # 单词修正结果的缓存上限（超过后清空重建）
+    WORD_MEMO_SIZE = 50000
+
     def __init__(self, similarity_threshold: float = 0.8):
         super().__init__(similarity_threshold)
+        self.dictionary_files = [EN_DICT]
         self.load_dictionary(EN_DICT)
         self.load_stopwords(EN_STOP)
+        # 词典行的第一列为单词（可能带有词频列），统一为小写用于快速判断
+        self.known_words: Set[str] = {line.split()[0].lower() for line in self.dictionary}
+        self._word_memo: Dict[str, str] = {}
         self.sym_spell = None
-        if SymSpell and self.dictionary:
+        if symspellpy and self.dictionary:
             try:
-                self.sym_spell = SymSpell(max_dictionary_edit_distance=2, prefix_length=7)
                 if os.path.exists(EN_DICT):
-                    self.sym_spell.load_dictionary(EN_DICT, term_index=0, count_index=None)
+                    # 删除索引从快照加载，词典文件变化时重新生成
+                    self.sym_spell = load_symspell_snapshot(EN_DICT, max_dictionary_edit_distance=2, prefix_length=7)
                 else:
+                    self.sym_spell = symspellpy.SymSpell(max_dictionary_edit_distance=2, prefix_length=7)
                     print(f"警告: 英文词典文件 {EN_DICT} 不存在")
             except Exception as e:
                 print(f"SymSpell 加载词典失败: {e}")
 
     def spell_check(self, text: str) -> Tuple[str, List[dict]]:
         if self.sym_spell:
-            words = text.split()
-            corrected_words = []
-            for word in words:
-                suggestions = self.sym_spell.lookup(word, symspellpy.Verbosity.CLOSEST, max_edit_distance=2)
-                if suggestions:
-                    corrected_words.append(suggestions[0].term)
-                else:
-                    corrected_words.append(word)
-            return ' '.join(corrected_words), []
+            # 只替换单词本身，空白和标点保持原样
+            return _EN_WORD_RE.sub(self._correct_match, text), []
         else:
             print("警告: SymSpell 不可用，英文错别字修正跳过")
             return text, []
 
+    def _correct_match(self, match) -> str:
+        return self.correct_word(match.group())
+
+    def correct_word(self, word: str) -> str:
+        """修正单个单词，结果按原词缓存"""
+        corrected = self._word_memo.get(word)
+        if corrected is None:
+            corrected = self._lookup_word(word)
+            if len(self._word_memo) >= self.WORD_MEMO_SIZE:
+                self._word_memo.clear()
+            self._word_memo[word] = corrected
+        return corrected
+
+    def _lookup_word(self, word: str) -> str:
+        lower = word.lower()
+        if lower in self.known_words:
+            # 词典中的单词不需要查询 SymSpell
+            return word
+        suggestions = self.sym_spell.lookup(lower, symspellpy.Verbosity.CLOSEST, max_edit_distance=2)
+        if not suggestions:
+            return word
+        return _match_case(suggestions[0].term, word)
+
+    def engine_signature(self) -> str:
+        return "symspell" if self.sym_spell else "none"
+
     def correct_symbols(self, text: str) -> Tuple[str, List[dict]]:
         return correct_english_symbols(text), []
 
 
 # ========== 日文处理器 ==========
 class JapaneseProcessor(BaseTextProcessor):
+    language = 'ja'
+
     def __init__(self, similarity_threshold: float = 0.8):
         super().__init__(similarity_threshold)
+        self.dictionary_files = [JA_DICT]
         self.load_dictionary(JA_DICT)
         self.load_stopwords(JA_STOP)
+        self._fuzzy_index: Optional[FuzzyWordIndex] = None
         if not jieba:
             print("警告: jieba 未安装，日文分词将不可用，纠错功能受限")
 
+    @property
+    def fuzzy_index(self) -> FuzzyWordIndex:
+        """词典的模糊查找索引（第一次纠错时建立）"""
+        if self._fuzzy_index is None:
+            self._fuzzy_index = FuzzyWordIndex(self.dictionary)
+        return self._fuzzy_index
+
     def _word_segment(self, text: str) -> List[str]:
         if jieba:
             return list(jieba.cut(text))
@@ -394,13 +328,16 @@ class JapaneseProcessor(BaseTextProcessor):
             if word in self.dictionary:
                 corrected_words.append(word)
             else:
-                close_matches = difflib.get_close_matches(word, self.dictionary, n=1, cutoff=0.8)
+                close_matches = self.fuzzy_index.get_close_matches(word, n=1, cutoff=0.8)
                 if close_matches:
                     corrected_words.append(close_matches[0])
                 else:
                     corrected_words.append(word)
         return ''.join(corrected_words), []
 
+    def engine_signature(self) -> str:
+        return "jieba" if jieba else "chars"
+
     def correct_symbols(self, text: str) -> Tuple[str, List[dict]]:
         return correct_japanese_symbols(text), []
 
@@ -419,22 +356,191 @@ class TextProcessorFactory:
         return processor_class(similarity_threshold)
 
 
+class ProcessorRegistry:
+    """
+    进程内共享的文本处理器池，按 (语言, 相似度阈值) 缓存，首次使用时才创建。
+    创建处理器要加载词典并初始化纠错库，开销较大；同一键只创建一次，
+    多个线程同时请求同一键时只有一个线程创建，其余线程等待并复用其结果。
+    prewarm 在后台线程中提前创建，之后的 get 直接命中（或等待正在进行的创建完成）。
+    """
+
+    def __init__(self):
+        self._processors: Dict[Tuple[str, float], BaseTextProcessor] = {}
+        self._key_locks: Dict[Tuple[str, float], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, language: str, similarity_threshold: float = 0.8) -> BaseTextProcessor:
+        key = (language, similarity_threshold)
+        processor = self._processors.get(key)
+        if processor is not None:
+            return processor
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            processor = self._processors.get(key)
+            if processor is None:
+                processor = TextProcessorFactory.create_processor(language, similarity_threshold)
+                self._processors[key] = processor
+        return processor
+
+    def is_ready(self, language: str, similarity_threshold: float = 0.8) -> bool:
+        return (language, similarity_threshold) in self._processors
+
+    def prewarm(self, language: str, similarity_threshold: float = 0.8) -> Optional[threading.Thread]:
+        """在后台线程中创建处理器；已创建时返回 None"""
+        if self.is_ready(language, similarity_threshold):
+            return None
+        thread = threading.Thread(target=self._prewarm, args=(language, similarity_threshold), daemon=True)
+        thread.start()
+        return thread
+
+    def _prewarm(self, language: str, similarity_threshold: float):
+        try:
+            self.get(language, similarity_threshold)
+        except Exception as e:
+            print(f"预热文本处理器失败 ({language}): {e}")
+
+    def clear(self):
+        """丢弃所有已创建的处理器（如词典更新后），下次使用时重新创建"""
+        with self._lock:
+            self._processors.clear()
+            self._key_locks.clear()
+
+
+# 进程内唯一的处理器池
+processor_registry = ProcessorRegistry()
+
+
 class TextProcessorManager:
-    def __init__(self, similarity_threshold: float = 0.8):
+    def __init__(self, similarity_threshold: float = 0.8, dedup_engine: str = 'window'):
         self.similarity_threshold = similarity_threshold
         self.current_processor = None
+        self.dedup_engine = dedup_engine
+        self.dedup_options = {}
+        self.last_deduplicator: Optional[BaseDeduplicator] = None    # 最近一次去重所用的引擎（含比较统计）
+        self.language: Optional[str] = None
+        self.spell_check_workers: Optional[int] = None
+        self.spell_check_batch_size = 32
+        self._spell_check_executor: Optional[SpellCheckExecutor] = None
 
     def set_language(self, language: str):
-        self.current_processor = TextProcessorFactory.create_processor(
-            language, self.similarity_threshold
-        )
+        # 处理器从共享的处理器池获取，重新解析等场景重复设置同一语言时不会重新加载词典
+        self.current_processor = processor_registry.get(language, self.similarity_threshold)
+        if self._spell_check_executor and self._spell_check_executor.language != language:
+            self._spell_check_executor.shutdown()
+            self._spell_check_executor = None
+        self.language = language
+
+    def prewarm(self, language: str) -> Optional[threading.Thread]:
+        """在后台提前创建该语言的处理器（如文件刚开始加载、语言已经检测出来时）"""
+        return processor_registry.prewarm(language, self.similarity_threshold)
+
+    def configure_spell_check(self, workers: Optional[int], batch_size: int = 32):
+        """设置多进程错别字修正的进程数（None 为自动）和每批段落数"""
+        self.spell_check_workers = workers
+        self.spell_check_batch_size = batch_size
+        self.shutdown()
+
+    def spell_check_batches(self, paragraphs: List[str],
+                            stop_check: Optional[Callable[[], bool]] = None,
+                            parallel_min_paragraphs: int = 200) -> Iterator[List[Tuple[int, str]]]:
+        """
+        修正一组段落，按完成顺序分批产出 [(下标, 修正结果), ...]。
+        先查修正缓存，命中的段落直接产出；未命中的段落去重后只修正一次，结果写入缓存。
+        需要修正的段落不少于 parallel_min_paragraphs 且可用的工作进程不少于两个时交给工作进程，否则在当前进程中逐段修正。
+        stop_check 返回 True 时提前结束。
+        """
+        processor = self.current_processor
+        if not processor:
+            raise ValueError("未设置文本处理器")
+        cache = processor.correction_cache
+
+        ready = []
+        pending = {}     # 需要修正的段落 -> (缓存键, 下标列表)
+        for index, paragraph in enumerate(paragraphs):
+            if paragraph in pending:
+                pending[paragraph][1].append(index)
+                continue
+            key = processor.cache_key(paragraph)
+            corrected = cache.get(key)
+            if corrected is None:
+                pending[paragraph] = (key, [index])
+            else:
+                ready.append((index, corrected))
+        if ready:
+            yield ready
+
+        unique = list(pending)
+        if not unique:
+            return
+        workers = self.spell_check_workers
+        if workers is None:
+            workers = default_worker_count()
+        if workers > 1 and len(unique) >= parallel_min_paragraphs:
+            if self._spell_check_executor is None:
+                self._spell_check_executor = SpellCheckExecutor(
+                    self.language, self.similarity_threshold,
+                    workers, self.spell_check_batch_size
+                )
+            batches = self._spell_check_executor.map_batches(unique, stop_check)
+        else:
+            batches = self._spell_check_sequential(unique, stop_check)
+
+        for start, results in batches:
+            batch = []
+            for offset, corrected in enumerate(results):
+                key, indices = pending[unique[start + offset]]
+                cache.put(key, corrected)
+                batch.extend((index, corrected) for index in indices)
+            yield batch
+
+    def _spell_check_sequential(self, paragraphs: List[str],
+                                stop_check: Optional[Callable[[], bool]]) -> Iterator[Tuple[int, List[str]]]:
+        for index, paragraph in enumerate(paragraphs):
+            if stop_check and stop_check():
+                return
+            yield index, [self.current_processor.spell_check(paragraph)[0]]
+
+    def correction_cache_stats(self):
+        """修正缓存的命中统计"""
+        return BaseTextProcessor.correction_cache.stats()
+
+    def load_correction_cache(self, path: Optional[str], max_entries: int = 100000):
+        """设置缓存容量并从文件加载修正缓存（path 为 None 时不持久化）"""
+        cache = BaseTextProcessor.correction_cache
+        cache.max_entries = max_entries
+        if path and not len(cache):
+            cache.load(path)
+
+    def save_correction_cache(self, path: Optional[str]):
+        """有新的修正结果时保存到文件；没有新结果时不重写整个缓存"""
+        cache = BaseTextProcessor.correction_cache
+        if path and cache.dirty:
+            cache.save(path)
+
+    def shutdown(self):
+        """关闭错别字修正的工作进程"""
+        if self._spell_check_executor is not None:
+            self._spell_check_executor.shutdown()
+            self._spell_check_executor = None
+
+    def set_dedup_engine(self, engine: str, **options):
+        """设置去重引擎（见 dedup.DEDUP_ENGINES）及其参数"""
+        DeduplicatorFactory.create(engine, **options)   # 提前检查引擎名和参数
+        self.dedup_engine = engine
+        self.dedup_options = options
+
+    def set_dedup_window(self, window_size: Optional[int], time_window: Optional[int] = None):
+        """设置当前去重引擎的窗口：条目数上限和时间范围（秒），None 表示不限"""
+        self.set_dedup_engine(self.dedup_engine, **dict(self.dedup_options, window_size=window_size,
+                                                        time_window=time_window))
 
     def process_text(self, operation: str, text: str) -> Tuple[str, List[dict]]:
         if not self.current_processor:
             raise ValueError("未设置文本处理器")
 
         operations = {
-            'spell_check': self.current_processor.spell_check,
+            'spell_check': self.current_processor.spell_check_cached,
             'correct_symbols': self.current_processor.correct_symbols,
         }
         processor_func = operations.get(operation)
@@ -443,10 +549,15 @@ class TextProcessorManager:
         return processor_func(text)
 
     def deduplicate_entries(self, entries: List[Any], threshold: float,
-                            skip_condition: Callable[[Any], bool] = None) -> List[Any]:
+                            skip_condition: Callable[[Any], bool] = None,
+                            progress_callback: Optional[Callable[[int, int, str], None]] = None,
+                            stop_check: Optional[Callable[[], bool]] = None) -> Optional[List[Any]]:
         if not self.current_processor:
             raise ValueError("未设置文本处理器")
-        return self.current_processor.deduplicate_entries(entries, threshold, skip_condition)
+        deduplicator = DeduplicatorFactory.create(self.dedup_engine, **self.dedup_options)
+        self.last_deduplicator = deduplicator
+        return self.current_processor.deduplicate_entries(entries, threshold, skip_condition, deduplicator,
+                                                          progress_callback, stop_check)
 
     def text_processor(self, text: str) -> Tuple[str, List[dict]]:
         if not self.current_processor:
@@ -1,3 +1,6 @@
+import os
+
+
 class Config:
     # 可配置参数
     SIMILARITY_THRESHOLD = 0.8
@@ -6,6 +9,55 @@ class Config:
         # 可以添加其他时间格式
     ]
 
+    # 去重引擎：'window'（与窗口内的条目逐一比较）或 'minhash'（MinHash/LSH，可在整个日志范围内查找近似重复）
+    DEDUP_ENGINE = 'window'
+    # window_size：参与比较的最近保留条目数（None 为不限）
+    # time_window：只与时间戳在前 time_window 秒以内的条目比较（None 为不限）
+    DEDUP_ENGINE_OPTIONS = {
+        'window': {'window_size': 5, 'time_window': None},
+        'minhash': {'window_size': None, 'time_window': None, 'num_perm': 64, 'shingle_size': 3},
+    }
+
+    # 错别字修正的工作进程数（None 为自动，1 为不使用多进程）、每批段落数，
+    # 以及段落数达到多少时才启用多进程（进程启动和加载纠错模型有固定开销）
+    SPELL_CHECK_WORKERS = None
+    SPELL_CHECK_BATCH_SIZE = 32
+    SPELL_CHECK_PARALLEL_MIN_PARAGRAPHS = 200
+
+    # 错别字修正结果缓存：最多保存的段落数，以及保存位置（None 为不保存到磁盘）
+    CORRECTION_CACHE_SIZE = 100000
+    CORRECTION_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".tprg_tool", "correction_cache.pkl")
+
+    # 开始加载文件、检测出语言后，是否在后台提前创建该语言的文本处理器（与文件解析并行加载词典和纠错库）
+    PREWARM_PROCESSOR = True
+
+    # 主窗口显示后是否在后台导入 pycorrector、symspellpy、jieba（否则在第一次使用时才导入）
+    WARM_UP_LIBRARIES = True
+
+    # 词典快照（预编译的词集合和 SymSpell 索引）的保存目录
+    DICTIONARY_SNAPSHOT_DIR = os.path.join(os.path.expanduser("~"), ".tprg_tool", "dictionary_snapshots")
+
+    # 多进程分段解析的进程数（None 为自动，1 为不使用多进程），以及文本达到多少字符时才分段解析
+    PARSE_WORKERS = None
+    PARALLEL_PARSE_MIN_CHARS = 8 * 1024 * 1024
+
+    # 刷新文本框时只替换与现有内容不同的行：相隔不超过 MERGE_GAP 行的改动合并为一次替换，
+    # 不同的行数（新旧合计）超过总行数的 MAX_CHANGED_RATIO 时整体替换
+    DISPLAY_DIFF_MERGE_GAP = 2
+    DISPLAY_DIFF_MAX_CHANGED_RATIO = 0.5
+
+    # 虚拟显示：条目数达到 MIN_ENTRIES 时文本框中只放 WINDOW_ENTRIES 个条目，
+    # 可见区域进入这一段首尾 EDGE 比例的范围内时换入前后的条目
+    VIRTUAL_DISPLAY_MIN_ENTRIES = 20000
+    VIRTUAL_DISPLAY_WINDOW_ENTRIES = 2000
+    VIRTUAL_DISPLAY_EDGE = 0.2
+
+    # 进度窗口的刷新间隔（毫秒）：后台任务只记录最新进度，主线程按此间隔读取并刷新一次
+    PROGRESS_REFRESH_MS = 50
+
+    # 局部重新解析产生的新正文先单独保存，累计超过该行数时合并回条目存储的文本缓冲区
+    COMPACT_EDITED_ROWS = 4096
+
     # 高亮颜色配置
     HIGHLIGHT_COLORS = {
         'addition': 'lightgreen',
@@ -0,0 +1,174 @@
+"""
+词典快照编译器：把纯文本词典预先编译为二进制快照，处理器启动时直接加载快照。
+  - 词集合（load_word_set 读取的词典、停用词）：frozenset
+  - SymSpell：使用 symspellpy 自带的 save_pickle / load_pickle 保存删除索引
+每个快照记录源文件的大小、修改时间和 blake2b 摘要；源文件变化后自动重新编译。
+pycorrector 的词频文件由 Corrector 自己解析（解析结果还用于其分词器），不在此编译。
+可以直接运行本脚本预先编译 dictionary 目录下的所有词典：python -m utils.dictionary_compiler
+"""
+
+import os
+import pickle
+import hashlib
+from typing import Any, Callable, Dict, FrozenSet, Optional, Set, Tuple
+
+from utils.config import Config
+
+# 快照格式版本，格式变化时递增，旧快照自动作废
+SNAPSHOT_FORMAT = 1
+
+
+def _source_digest(path: str) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def source_signature(path: str) -> Dict[str, Any]:
+    stat = os.stat(path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'digest': _source_digest(path)}
+
+
+def snapshot_path(source: str, kind: str, snapshot_dir: Optional[str] = None) -> str:
+    directory = snapshot_dir or Config.DICTIONARY_SNAPSHOT_DIR
+    return os.path.join(directory, f"{os.path.basename(source)}.{kind}.pkl")
+
+
+def _check_source(meta: Dict[str, Any], source: str) -> Optional[str]:
+    """
+    快照是否仍对应源文件：大小和修改时间都没变返回 'current'；
+    修改时间变了但内容摘要相同返回 'touched'（快照有效，但应更新记录的修改时间）；否则返回 None。
+    """
+    stat = os.stat(source)
+    if meta.get('size') != stat.st_size:
+        return None
+    if meta.get('mtime_ns') == stat.st_mtime_ns:
+        return 'current'
+    return 'touched' if meta.get('digest') == _source_digest(source) else None
+
+
+def _read_snapshot(path: str, source: str, kind: str) -> Tuple[Optional[str], Any]:
+    """返回 (_check_source 的结果, 快照内容)；快照不存在或已失效时结果为 None"""
+    try:
+        with open(path, 'rb') as f:
+            snapshot_format, snapshot_kind, meta, payload = pickle.load(f)
+    except Exception:
+        return None, None
+    if snapshot_format != SNAPSHOT_FORMAT or snapshot_kind != kind:
+        return None, None
+    status = _check_source(meta, source)
+    return status, payload if status else None
+
+
+def _write_snapshot(path: str, source: str, kind: str, payload: Any):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = path + ".tmp"
+        with open(temp_path, 'wb') as f:
+            pickle.dump((SNAPSHOT_FORMAT, kind, source_signature(source), payload), f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+    except Exception as e:
+        print(f"写入词典快照失败 {path}: {e}")
+
+
+def _load_or_compile(source: str, kind: str, compile_func: Callable[[str], Any],
+                     snapshot_dir: Optional[str] = None) -> Any:
+    """读取有效的快照；没有快照或源文件已变化时编译并写入快照"""
+    if not os.path.exists(source):
+        return compile_func(source)
+    path = snapshot_path(source, kind, snapshot_dir)
+    status, payload = _read_snapshot(path, source, kind)
+    if status == 'current':
+        return payload
+    if status is None:
+        payload = compile_func(source)
+    # 新编译的结果，或内容未变只是修改时间变了：写入快照（更新记录的修改时间）
+    _write_snapshot(path, source, kind, payload)
+    return payload
+
+
+# ========== 词集合 ==========
+def load_word_set(filepath: str) -> Set[str]:
+    """从文件加载每行一个词的集合（跳过空行和注释）"""
+    words = set()
+    if not os.path.exists(filepath):
+        print(f"警告: 词典文件不存在 {filepath}")
+        return words
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    words.add(line)
+    except Exception as e:
+        print(f"读取词典文件失败 {filepath}: {e}")
+    return words
+
+
+def compile_word_set(source: str) -> FrozenSet[str]:
+    """与 load_word_set 相同的规则（跳过空行和注释），结果为 frozenset"""
+    return frozenset(load_word_set(source))
+
+
+def load_word_set_snapshot(source: str, snapshot_dir: Optional[str] = None) -> FrozenSet[str]:
+    return _load_or_compile(source, 'words', compile_word_set, snapshot_dir)
+
+
+# ========== SymSpell ==========
+def load_symspell_snapshot(source: str, max_dictionary_edit_distance: int = 2, prefix_length: int = 7,
+                           snapshot_dir: Optional[str] = None):
+    """
+    创建加载了 source 词典的 SymSpell。删除索引通过 symspellpy 的 save_pickle 保存，
+    快照有效时直接 load_pickle，不再重新生成删除索引。symspellpy 未安装时返回 None。
+    """
+    try:
+        from symspellpy import SymSpell
+    except ImportError:
+        return None
+
+    sym_spell = SymSpell(max_dictionary_edit_distance=max_dictionary_edit_distance, prefix_length=prefix_length)
+    kind = f"symspell-{max_dictionary_edit_distance}-{prefix_length}"
+    path = snapshot_path(source, kind, snapshot_dir)
+    meta_path = path + ".meta"
+    status, _ = _read_snapshot(meta_path, source, kind)
+    if status:
+        try:
+            if sym_spell.load_pickle(path) is not False:
+                if status == 'touched':
+                    _write_snapshot(meta_path, source, kind, None)
+                return sym_spell
+        except Exception as e:
+            print(f"读取 SymSpell 快照失败 {path}: {e}")
+        sym_spell = SymSpell(max_dictionary_edit_distance=max_dictionary_edit_distance,
+                             prefix_length=prefix_length)
+
+    sym_spell.load_dictionary(source, term_index=0, count_index=None)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        sym_spell.save_pickle(path)
+        # 索引写完后再写元数据，元数据存在即表示索引完整
+        _write_snapshot(meta_path, source, kind, None)
+    except Exception as e:
+        print(f"写入 SymSpell 快照失败 {path}: {e}")
+    return sym_spell
+
+
+def main():
+    """预先编译 dictionary 目录下的所有词典"""
+    from model import text_processor as tp
+    word_sets = [tp.EN_DICT, tp.EN_STOP, tp.ZH_CN_FREQ, tp.ZH_CN_STOP, tp.ZH_TW_FREQ, tp.ZH_TW_STOP,
+                 tp.JA_DICT, tp.JA_STOP]
+    for source in word_sets:
+        if os.path.exists(source):
+            words = load_word_set_snapshot(source)
+            print(f"{os.path.basename(source)}: {len(words)} 行")
+    if os.path.exists(tp.EN_DICT) and load_symspell_snapshot(tp.EN_DICT) is not None:
+        print(f"{os.path.basename(tp.EN_DICT)}: SymSpell 索引已编译")
+    print(f"快照目录: {Config.DICTIONARY_SNAPSHOT_DIR}")
+
+
+if __name__ == "__main__":
+    main()
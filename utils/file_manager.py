@@ -1,26 +1,36 @@
 import os
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 from docx import Document
 import pythoncom
 import win32com.client
 
+from utils.text_reader import candidate_encodings, normalize_newlines, SAMPLE_BYTES, MappedTextFile
+
 
 class FileManager:
     SUPPORTED_IMPORT_EXTENSIONS = ['.docx', '.doc', '.txt']
     SUPPORTED_EXPORT_EXTENSIONS = ['.docx', '.txt']
+    TXT_CHUNK_SIZE = 1 << 20
 
     def __init__(self, language_manager):
         self.language_manager = language_manager
 
-    def read_file(self, file_path: str, progress_callback=None) -> Tuple[Optional[str], Optional[str]]:
-        """读取文件内容，返回(内容, 错误信息)"""
+    def read_file(self, file_path: str, progress_callback=None,
+                  mmap_mode: bool = False) -> Tuple[Optional[Union[str, MappedTextFile]], Optional[str]]:
+        """
+        读取文件内容，返回(内容, 错误信息)
+        mmap_mode 为 True 时，txt文件以内存映射方式打开，返回 MappedTextFile 而不是字符串，
+        由调用方逐行解析并负责关闭。
+        """
         try:
             if not os.path.exists(file_path):
                 return None, self.language_manager.get_text("file_not_exist")
 
             ext = os.path.splitext(file_path)[1].lower()
 
-            if ext == '.txt':
+            if ext == '.txt' and mmap_mode:
+                return MappedTextFile(file_path), None
+            elif ext == '.txt':
                 return self._read_txt_file(file_path, progress_callback)
             elif ext == '.docx':
                 return self._read_docx_file(file_path, progress_callback)
@@ -33,32 +43,31 @@ class FileManager:
             return None, f"{self.language_manager.get_text('read_file_error')}: {str(e)}"
 
     def _read_txt_file(self, file_path: str, progress_callback=None) -> Tuple[Optional[str], Optional[str]]:
-        """读取txt文件"""
-        # 先获取文件行数来估算进度
-        total_lines = 0
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                total_lines = sum(1 for _ in f)
-        except:
-            pass  # 如果无法用utf-8读取，后面会尝试其他编码
-
-        # 尝试多种编码读取txt文件
-        encodings = ['utf-8', 'gbk', 'gb2312', 'utf-16']
-
-        for encoding in encodings:
+        """读取txt文件：只读取一次，进度按已读字节数计算，编码由开头的字节样本检测"""
+        total_bytes = os.stat(file_path).st_size
+        status = self.language_manager.get_text('reading_file_progress')
+
+        chunks = []
+        bytes_read = 0
+        with open(file_path, 'rb') as f:
+            while True:
+                chunk = f.read(self.TXT_CHUNK_SIZE)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                bytes_read += len(chunk)
+                if progress_callback and total_bytes > 0:
+                    progress_callback(bytes_read, total_bytes, status)
+        data = b''.join(chunks)
+        del chunks
+
+        # 按候选顺序解码整个缓冲区，检测结果错误时无需重新读取文件
+        for encoding in candidate_encodings(data[:SAMPLE_BYTES]):
             try:
-                content_lines = []
-                with open(file_path, 'r', encoding=encoding) as f:
-                    for i, line in enumerate(f):
-                        content_lines.append(line)
-                        if progress_callback and total_lines > 0:
-                            status = f"{self.language_manager.get_text('reading_file_progress')} ({encoding})"
-                            progress_callback(i + 1, total_lines, status)
-
-                content = ''.join(content_lines)
-                return content, None
+                content = data.decode(encoding)
             except UnicodeDecodeError:
                 continue
+            return normalize_newlines(content), None
         return None, self.language_manager.get_text("decode_error")
 
     def _read_docx_file(self, file_path: str, progress_callback=None) -> Tuple[Optional[str], Optional[str]]:
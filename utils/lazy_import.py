@@ -0,0 +1,99 @@
+"""
+延迟导入较重的第三方库（pycorrector、symspellpy、jieba、wordcloud 等）。
+模块在第一次访问其属性或判断是否可用时才真正导入，程序启动时不再为这些库付出导入时间；
+也可以在界面显示后用 warm_up 在后台线程中提前导入。
+"""
+
+import time
+import importlib
+import importlib.util
+import threading
+from typing import Dict, Iterable, Optional
+
+
+class LazyModule:
+    """
+    模块的延迟导入代理。
+      - 访问属性（如 jieba.cut）时导入模块，未安装时抛出 AttributeError
+      - bool(模块) 表示模块是否可用（会触发导入），可以沿用 `if jieba:` 的写法
+      - installed 只检查模块是否已安装，不导入
+    未安装或导入出错时只在第一次导入时打印提示，之后视为不可用。
+    """
+
+    # 模块名 -> 实际导入耗时（秒）
+    import_times: Dict[str, float] = {}
+
+    def __init__(self, name: str, warning: Optional[str] = None):
+        self.module_name = name
+        self._warning = warning
+        self._module = None
+        self._attempted = False
+        self._lock = threading.Lock()
+
+    def load(self):
+        """导入并返回模块，未安装时返回 None；多个线程同时调用时只导入一次"""
+        if self._attempted:
+            return self._module
+        with self._lock:
+            if not self._attempted:
+                start = time.perf_counter()
+                try:
+                    self._module = importlib.import_module(self.module_name)
+                except ImportError:
+                    self._module = None
+                    if self._warning:
+                        print(self._warning)
+                except Exception as e:
+                    # 已安装但导入时出错（如依赖的二进制库不兼容），同样记为不可用，之后不再重复导入
+                    self._module = None
+                    print(f"导入 {self.module_name} 失败: {e}")
+                LazyModule.import_times[self.module_name] = time.perf_counter() - start
+                self._attempted = True
+        return self._module
+
+    @property
+    def loaded(self) -> bool:
+        """是否已经尝试过导入（不会触发导入）"""
+        return self._attempted
+
+    @property
+    def installed(self) -> bool:
+        """模块是否已安装（不会触发导入）"""
+        if self._attempted:
+            return self._module is not None
+        try:
+            return importlib.util.find_spec(self.module_name) is not None
+        except (ImportError, ValueError):
+            return False
+
+    def __bool__(self) -> bool:
+        return self.load() is not None
+
+    def __getattr__(self, item):
+        if item.startswith('_'):
+            # 代理自身的私有属性和 copy/pickle 探测的特殊方法，不触发导入
+            raise AttributeError(item)
+        module = self.load()
+        if module is None:
+            raise AttributeError(f"模块 {self.module_name} 未安装，无法使用 {item}")
+        return getattr(module, item)
+
+    def __repr__(self) -> str:
+        state = "已导入" if self._module is not None else ("未安装" if self._attempted else "未导入")
+        return f"<LazyModule {self.module_name} ({state})>"
+
+
+def warm_up(modules: Iterable[LazyModule]) -> threading.Thread:
+    """在后台线程中依次导入模块（已导入的跳过），返回该线程"""
+    modules = list(modules)
+
+    def run():
+        for module in modules:
+            try:
+                module.load()
+            except Exception as e:
+                print(f"后台导入 {module.module_name} 失败: {e}")
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,128 @@
+from bisect import bisect_left
+from collections import Counter
+from typing import List, Optional, Sequence, Tuple
+
+# 一个替换块：将旧文本的 [old_start, old_stop) 行替换为新文本的 [new_start, new_stop) 行
+DiffBlock = Tuple[int, int, int, int]
+
+# 出现不同的行后，先在其后这么多行内寻找重新对齐的位置，找不到再逐步扩大
+_ANCHOR_WINDOW = 64
+
+
+def _common_prefix(old: Sequence[str], new: Sequence[str], i: int, j: int, limit: int) -> int:
+    """old[i:] 与 new[j:] 相同的开头行数（不超过 limit）；用切片比较倍增后二分，长段相同的行很快跳过"""
+    length, step = 0, 1
+    while length < limit:
+        end = min(length + step, limit)
+        if old[i + length:i + end] != new[j + length:j + end]:
+            break
+        length = end
+        step *= 2
+    else:
+        return length
+    # 第一处不同在 [length, end) 内
+    while end - length > 1:
+        middle = (length + end) // 2
+        if old[i + length:i + middle] == new[j + length:j + middle]:
+            length = middle
+        else:
+            end = middle
+    return length
+
+
+def _common_suffix(old: Sequence[str], new: Sequence[str], old_stop: int, new_stop: int, limit: int) -> int:
+    """old[:old_stop] 与 new[:new_stop] 相同的结尾行数（不超过 limit）"""
+    length, step = 0, 1
+    while length < limit:
+        end = min(length + step, limit)
+        if old[old_stop - end:old_stop - length] != new[new_stop - end:new_stop - length]:
+            break
+        length = end
+        step *= 2
+    else:
+        return length
+    while end - length > 1:
+        middle = (length + end) // 2
+        if old[old_stop - middle:old_stop - length] == new[new_stop - middle:new_stop - length]:
+            length = middle
+        else:
+            end = middle
+    return length
+
+
+def _first_anchor(old: Sequence[str], new: Sequence[str], old_start: int, old_stop: int,
+                  new_start: int, new_stop: int) -> Optional[Tuple[int, int]]:
+    """
+    在两段中各只出现一次的相同行里，取新旧位置同时递增的最长序列（patience diff），返回其第一个锚点。
+    日志的条目首行（玩家名和时间）和正文基本不重复，锚点足以对齐未修改的条目。
+    """
+    old_counts = Counter(old[old_start:old_stop])
+    new_counts = Counter(new[new_start:new_stop])
+    new_positions = {new[j]: j for j in range(new_start, new_stop) if new_counts[new[j]] == 1}
+    pairs = [(i, new_positions[old[i]]) for i in range(old_start, old_stop)
+             if old_counts[old[i]] == 1 and old[i] in new_positions]
+    if not pairs:
+        return None
+
+    # 按新位置求最长递增子序列：tails[k] 为长度 k+1 的递增序列的最小结尾
+    tails: List[int] = []
+    tail_pairs: List[int] = []
+    previous = [-1] * len(pairs)
+    for index, (_, j) in enumerate(pairs):
+        k = bisect_left(tails, j)
+        if k == len(tails):
+            tails.append(j)
+            tail_pairs.append(index)
+        else:
+            tails[k] = j
+            tail_pairs[k] = index
+        previous[index] = tail_pairs[k - 1] if k else -1
+
+    index = tail_pairs[-1]
+    while previous[index] >= 0:
+        index = previous[index]
+    return pairs[index]
+
+
+def diff_lines(old: Sequence[str], new: Sequence[str], merge_gap: int = 0,
+               max_changed: Optional[int] = None) -> Optional[List[DiffBlock]]:
+    """
+    行级差异：返回将 old 变为 new 的替换块，按位置递增，块与块之间的行在新旧文本中相同。
+    从头向后跳过相同的行，遇到不同时在其后的窗口内以唯一行为锚点重新对齐，两者之间即为一个替换块。
+    相邻两块之间相同的行不超过 merge_gap 行时合并为一块，以减少对文本框的操作次数。
+    涉及的行数（新旧合计）超过 max_changed 时放弃，返回None。
+    """
+    suffix = _common_suffix(old, new, len(old), len(new), min(len(old), len(new)))
+    old_stop, new_stop = len(old) - suffix, len(new) - suffix
+
+    blocks: List[DiffBlock] = []
+    changed = 0
+    i = j = 0
+    while True:
+        same = _common_prefix(old, new, i, j, min(old_stop - i, new_stop - j))
+        i += same
+        j += same
+        if i == old_stop and j == new_stop:
+            return blocks
+
+        # 窗口覆盖剩余全部行仍找不到锚点时，剩余部分整体替换
+        window = _ANCHOR_WINDOW
+        while True:
+            window_old, window_new = min(i + window, old_stop), min(j + window, new_stop)
+            anchor = _first_anchor(old, new, i, window_old, j, window_new)
+            if anchor is not None or (window_old == old_stop and window_new == new_stop):
+                break
+            window *= 4
+        anchor_i, anchor_j = anchor or (old_stop, new_stop)
+        # 锚点之前与锚点一起相同的行不计入替换块
+        tail = _common_suffix(old, new, anchor_i, anchor_j, min(anchor_i - i, anchor_j - j))
+        block = (i, anchor_i - tail, j, anchor_j - tail)
+
+        changed += block[1] - block[0] + block[3] - block[2]
+        if max_changed is not None and changed > max_changed:
+            return None
+        if blocks and block[0] - blocks[-1][1] <= merge_gap:
+            blocks[-1] = (blocks[-1][0], block[1], blocks[-1][2], block[3])
+        else:
+            blocks.append(block)
+        i, j = anchor_i, anchor_j
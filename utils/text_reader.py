@@ -0,0 +1,184 @@
+import os
+import mmap
+import codecs
+from typing import Optional, Iterator, Callable, List
+
+# 尝试的编码（按优先级）
+TXT_ENCODINGS = ['utf-8', 'gbk', 'gb2312', 'utf-16']
+
+# 字节顺序标记 -> 编码
+_BOM_ENCODINGS = [
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+# 编码检测使用的样本字节数
+SAMPLE_BYTES = 64 * 1024
+
+# str.splitlines 会识别的所有换行符
+_LINE_BREAKS = frozenset('\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029')
+
+# 语言检测所需的样本长度（与 LanguageDetector 的采样长度一致）
+SAMPLE_CHARS = 2000
+
+
+def candidate_encodings(sample: bytes) -> List[str]:
+    """
+    根据文件开头的字节样本给出候选编码（最可能的排在最前）。
+    有BOM时直接确定编码；否则能无误解码样本的编码排在前面，其余编码作为后备。
+    """
+    for bom, encoding in _BOM_ENCODINGS:
+        if sample.startswith(bom):
+            return [encoding]
+
+    matched = []
+    for encoding in TXT_ENCODINGS:
+        try:
+            # final=False：样本末尾被截断的多字节字符不算错误
+            codecs.getincrementaldecoder(encoding)().decode(sample, False)
+        except UnicodeError:
+            continue
+        matched.append(encoding)
+    return matched + [e for e in TXT_ENCODINGS if e not in matched]
+
+
+def normalize_newlines(text: str) -> str:
+    """与文本模式读取一致，将 \\r\\n 和 \\r 统一为 \\n"""
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+class TextFileReader:
+    """
+    按块读取文本文件并逐行产出，不会把整个文件读成一个字符串。
+    未指定编码时根据第一块的开头自动检测，候选编码保存在 candidates 中。
+    进度以已读取的字节数汇报；文件开头的一段文本保存在 sample 中，供语言检测使用。
+    """
+
+    def __init__(self, file_path: str, encoding: Optional[str] = None, chunk_size: int = 1 << 20):
+        self.file_path = file_path
+        self.encoding = encoding
+        self.candidates: List[str] = [encoding] if encoding else []
+        self.chunk_size = chunk_size
+        self.total_bytes = os.stat(file_path).st_size
+        self.bytes_read = 0
+        self.sample = ""
+
+    def iter_lines(self, progress_callback: Optional[Callable[[int, int, str], None]] = None,
+                   status: str = "", stop_check: Optional[Callable[[], bool]] = None) -> Iterator[str]:
+        """逐行产出文本（不含换行符）；编码不匹配时抛出 UnicodeError；stop_check 返回 True 时提前结束"""
+        decoder = None
+        pending = ""
+        self.bytes_read = 0
+        self.sample = ""
+        with open(self.file_path, 'rb') as f:
+            while True:
+                if stop_check and stop_check():
+                    return
+                chunk = f.read(self.chunk_size)
+                final = not chunk
+                if decoder is None:
+                    if self.encoding is None:
+                        self.candidates = candidate_encodings(chunk[:SAMPLE_BYTES])
+                        self.encoding = self.candidates[0]
+                    decoder = codecs.getincrementaldecoder(self.encoding)()
+
+                decoded = decoder.decode(chunk, final)
+                if len(self.sample) < SAMPLE_CHARS:
+                    self.sample += normalize_newlines(decoded[:SAMPLE_CHARS])
+                    self.sample = self.sample[:SAMPLE_CHARS]
+
+                text = pending + decoded
+                lines = text.splitlines()
+                if not final and lines and text[-1] not in _LINE_BREAKS:
+                    # 最后一行可能不完整，留到下一块
+                    pending = lines.pop()
+                else:
+                    pending = ""
+                yield from lines
+
+                if final:
+                    break
+                self.bytes_read += len(chunk)
+                if progress_callback and self.total_bytes > 0:
+                    progress_callback(self.bytes_read, self.total_bytes, f"{status} ({self.encoding})")
+
+
+class MappedTextFile:
+    """
+    以内存映射方式打开的文本文件。
+    直接在映射的字节缓冲区上查找换行符确定行边界，按段解码，
+    整个文件不会被读成一个 Python 字符串，也不需要额外的读缓冲。
+    这只省去了读取时的一份副本：每一行仍要解码并交给解析器，打开时间和解析结果占用的内存都随文件大小增长。
+    仅支持换行符为单字节且不会出现在多字节字符内部的编码（utf-8、gbk、gb2312），
+    其他编码（如utf-16）的 supports_line_scan 为 False，应改用 TextFileReader。
+    """
+
+    LINE_SCAN_ENCODINGS = ('utf-8', 'utf-8-sig', 'gbk', 'gb2312')
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._file = open(file_path, 'rb')
+        self.total_bytes = os.fstat(self._file.fileno()).st_size
+        self._buffer = None
+        if self.total_bytes > 0:
+            # 空文件无法映射
+            self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.candidates = candidate_encodings(self._buffer[:SAMPLE_BYTES] if self._buffer else b"")
+        self.encoding = self.candidates[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        if self._buffer is not None:
+            self._buffer.close()
+            self._buffer = None
+        self._file.close()
+
+    @property
+    def supports_line_scan(self) -> bool:
+        return self.encoding in self.LINE_SCAN_ENCODINGS
+
+    @property
+    def sample(self) -> str:
+        """文件开头的一段文本，供语言检测使用"""
+        if self._buffer is None:
+            return ""
+        head = self._buffer[:SAMPLE_CHARS * 4]
+        return normalize_newlines(head.decode(self.encoding, errors='ignore'))[:SAMPLE_CHARS]
+
+    def iter_lines(self, progress_callback: Optional[Callable[[int, int, str], None]] = None,
+                   status: str = "", encoding: Optional[str] = None,
+                   block_size: int = 1 << 20, stop_check: Optional[Callable[[], bool]] = None) -> Iterator[str]:
+        """
+        逐行产出解码后的文本（不含换行符）；编码不匹配时抛出 UnicodeError；stop_check 返回 True 时提前结束。
+        每次在缓冲区中向后找到约 block_size 字节处的换行符，只解码这一段再拆分成行，
+        内存占用只与段大小有关。
+        """
+        buffer = self._buffer
+        if buffer is None:
+            return
+        encoding = encoding or self.encoding
+        if encoding == 'utf-8-sig':
+            encoding = 'utf-8'
+        start = len(codecs.BOM_UTF8) if self.encoding == 'utf-8-sig' else 0
+        size = self.total_bytes
+        while start < size:
+            if stop_check and stop_check():
+                return
+            end = buffer.rfind(b'\n', start, start + block_size)
+            if end < 0 or start + block_size >= size:
+                # 段内没有换行（超长行）或已到文件末尾
+                end = buffer.find(b'\n', start + block_size) if start + block_size < size else -1
+                if end < 0:
+                    end = size
+            yield from buffer[start:end].decode(encoding).splitlines()
+            start = end + 1
+            if progress_callback:
+                progress_callback(min(start, size), size, f"{status} ({encoding})")
@@ -4,15 +4,13 @@ import re
 from collections import Counter
 import os
 
-# 尝试导入词云相关库
-try:
-    import jieba
-    from wordcloud import WordCloud
-    from PIL import Image, ImageTk
-    WORDCLOUD_AVAILABLE = True
-except ImportError:
-    WORDCLOUD_AVAILABLE = False
-    jieba = None
+from utils.lazy_import import LazyModule
+
+# 词云相关库延迟到生成词云时才导入，这里只检查是否已安装
+jieba = LazyModule('jieba')
+wordcloud = LazyModule('wordcloud')
+ImageTk = LazyModule('PIL.ImageTk')
+WORDCLOUD_AVAILABLE = jieba.installed and wordcloud.installed and ImageTk.installed
 
 # 词典文件路径
 DICTIONARY_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "dictionary")
@@ -81,9 +79,9 @@ class AnalysisWindow:
 
         # 从模型中获取所有 LogEntry（用于后续统计）
         model = self.controller.model
-        self.entries = model.entries if hasattr(model, 'entries') else []
+        self.entries = model.entries
         # 完整内容（用于字数统计和标点统计，包含所有条目）
-        self.full_content = "\n".join([entry.content for entry in self.entries if entry.content.strip()])
+        self.full_content = "\n".join([content for content in self.entries.iter_contents() if content.strip()])
 
         # 文档语言（由模型检测）
         self.detected_language = getattr(model, 'detected_language', 'zh_CN')
@@ -296,10 +294,9 @@ class AnalysisWindow:
 
         # 从模型获取最新条目，并过滤出 KP 和 PL 的发言
         model = self.controller.model
-        entries = model.entries if hasattr(model, 'entries') else []
         filtered_content = "\n".join([
-            entry.content for entry in entries
-            if entry.entry_type in ('KP', 'PL') and entry.content.strip()
+            content for content in model.entries.iter_contents(('KP', 'PL'))
+            if content.strip()
         ])
 
         if not filtered_content.strip():
@@ -357,7 +354,7 @@ class AnalysisWindow:
             return
 
         # 生成词云
-        wc = WordCloud(
+        wc = wordcloud.WordCloud(
             font_path="simhei.ttf",
             width=canvas_width,
             height=canvas_height,
@@ -1,7 +1,11 @@
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
+from utils.config import Config
+from utils.line_diff import diff_lines
+from view.virtual_display import VirtualDisplay
 
 if TYPE_CHECKING:
     from model.document_model import DocumentModel
@@ -167,12 +171,12 @@ class MainWindow(Observer):
             text_container,
             wrap=tk.WORD,
             font=self.text_font,
-            yscrollcommand=v_scrollbar.set,
             undo=True,
             maxundo=-1
         )
 
-        v_scrollbar.config(command=self.text_display.yview)
+        # 负责连接文本框与滚动条，条目很多时只在文本框中放一段条目
+        self.virtual_display = VirtualDisplay(self.text_display, v_scrollbar, self.controller)
         self.text_display.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
         # 绑定文本修改事件
@@ -203,13 +207,17 @@ class MainWindow(Observer):
 
     def on_model_updated(self, model: "DocumentModel", event_type: str):
         """观察者模式：当模型更新时调用"""
+        if threading.current_thread() is not threading.main_thread():
+            # 模型可能在后台线程中更新（如流式加载），界面刷新转交给Tk主线程
+            self.root.after(0, self.on_model_updated, model, event_type)
+            return
         if event_type in ("file_loaded", "content_modified", "entries_updated"):
             # 更新文件路径显示（仅在文件加载时）
             if event_type == "file_loaded":
                 self.current_file_path = model.file_path
                 self.update_file_path_display()
-            # 显示模型生成的文本
-            self.display_file_content(model.get_display_text())
+            # 显示模型生成的文本，新加载的文件从开头显示
+            self.show_model_text(model, keep_position=event_type != "file_loaded")
             # 通知控制器更新按钮状态（虽然按钮始终启用，但仍保留调用以兼容其他逻辑）
             self.controller.update_button_states()
 
@@ -240,16 +248,74 @@ class MainWindow(Observer):
 
         return lines
 
+    def show_model_text(self, model: "DocumentModel", keep_position: bool = True):
+        """
+        显示模型生成的文本。条目数达到 Config.VIRTUAL_DISPLAY_MIN_ENTRIES 时使用虚拟显示，
+        文本框中只放当前位置附近的一段条目，否则显示全文。
+        """
+        if not hasattr(self, 'text_display'):
+            return
+        if len(model.entries) >= Config.VIRTUAL_DISPLAY_MIN_ENTRIES:
+            self.virtual_display.show(model, self.virtual_display.top_line() if keep_position else 0)
+        else:
+            self.virtual_display.deactivate()
+            self.display_file_content(model.get_display_text())
+
     def display_file_content(self, content: str):
-        """显示文件内容"""
+        """
+        显示文件内容：与文本框现有内容逐行比较，只替换不同的行，滚动位置、光标和标记保持不变；
+        不同的行太多（如排序打乱了顺序）时整体替换。
+        """
         if hasattr(self, 'text_display'):
-            current_position = self.text_display.index(tk.INSERT)
-            self.text_display.delete(1.0, tk.END)
-            if content:
-                self.text_display.insert(1.0, content)
-            self.text_display.mark_set(tk.INSERT, current_position)
-            self.text_display.see(current_position)
+            old_lines = self.text_display.get("1.0", "end-1c").split('\n')
+            new_lines = content.split('\n')
+            max_changed = int((len(old_lines) + len(new_lines)) * Config.DISPLAY_DIFF_MAX_CHANGED_RATIO)
+            blocks = diff_lines(old_lines, new_lines, Config.DISPLAY_DIFF_MERGE_GAP, max_changed)
+            if blocks is None:
+                current_position = self.text_display.index(tk.INSERT)
+                self.text_display.delete(1.0, tk.END)
+                if content:
+                    self.text_display.insert(1.0, content)
+                self.text_display.mark_set(tk.INSERT, current_position)
+                self.text_display.see(current_position)
+            else:
+                # 从后往前替换，前面各块的行号不受影响
+                for old_start, old_stop, new_start, new_stop in reversed(blocks):
+                    self._replace_text_lines(old_start, old_stop, new_lines[new_start:new_stop])
             self.text_display.update_idletasks()
+            self.controller.on_display_refreshed()
+
+    def replace_display_lines(self, start: int, stop: int, lines: list):
+        """
+        将显示文本的 [start, stop) 行（从0开始）替换为 lines（见 DocumentModel.reparse_display_lines）。
+        虚拟显示时换算为文本框中的行；修改并入了窗口之前的条目时从该条目起重新放入条目。
+        """
+        virtual_display = self.virtual_display
+        if not virtual_display.active:
+            self._replace_text_lines(start, stop, lines)
+        elif start < virtual_display.base_line:
+            virtual_display.show(virtual_display.model, start)
+        else:
+            self._replace_text_lines(start - virtual_display.base_line, stop - virtual_display.base_line, lines)
+            virtual_display.entries_spliced()
+
+    def _replace_text_lines(self, start: int, stop: int, lines: list):
+        """将文本框中 [start, stop) 行（从0开始）替换为 lines，其余内容和光标位置不变"""
+        text_display = self.text_display
+        last_line = int(text_display.index("end-1c").split('.')[0])
+        if stop >= last_line and start > 0:
+            # 替换到文本末尾：从上一行行尾开始删除，不留下多余的空行
+            text_display.delete(f"{start}.end", "end-1c")
+            if lines:
+                text_display.insert(f"{start}.end", '\n' + '\n'.join(lines))
+        elif stop >= last_line:
+            text_display.delete("1.0", "end-1c")
+            text_display.insert("1.0", '\n'.join(lines))
+        else:
+            if stop > start:
+                text_display.delete(f"{start + 1}.0", f"{stop + 1}.0")
+            if lines:
+                text_display.insert(f"{start + 1}.0", '\n'.join(lines) + '\n')
 
     def update_ui_text(self):
         """更新UI文本"""
@@ -1,9 +1,12 @@
 import tkinter as tk
 from tkinter import ttk
+from typing import Optional, Tuple
+
+from utils.config import Config
 
 
 class ProgressWindow:
-    def __init__(self, parent, language_manager, title: str, total_steps: int = 100):
+    def __init__(self, parent, language_manager, title: str, total_steps: int = 100, status: str = ""):
         self.window = tk.Toplevel(parent)
         self.language_manager = language_manager
         self.total_steps = total_steps
@@ -11,22 +14,35 @@ class ProgressWindow:
         self._updating = False
         self.running = True
         self.cancel_callback = None
+        self.wait_for_task = False
+        self.cancelling = False
 
-        self.setup_ui(title)
+        self.setup_ui(title, status)
         self.center_on_parent(parent)
         self.window.protocol("WM_DELETE_WINDOW", self._on_close)
 
-    def set_cancel_callback(self, callback):
-        """设置取消回调函数，当用户关闭窗口时调用"""
+    def set_cancel_callback(self, callback, wait_for_task: bool = False):
+        """
+        设置取消回调函数，当用户关闭窗口时调用。
+        wait_for_task 为 True 时关闭窗口只发出取消请求，窗口显示"正在取消"并保持模态，
+        由任务结束后的 complete 或 close 关闭。
+        """
         self.cancel_callback = callback
+        self.wait_for_task = wait_for_task
 
     def _on_close(self):
         """窗口关闭时的处理"""
+        if self.cancelling:
+            return
         if self.cancel_callback:
             self.cancel_callback()
+            if self.wait_for_task:
+                self.cancelling = True
+                self.status_label.config(text=self.language_manager.get_text("cancelling"))
+                return
         self.close()
 
-    def setup_ui(self, title: str):
+    def setup_ui(self, title: str, status: str = ""):
         self.window.title(title)
         self.window.geometry("400x120")
         self.window.resizable(False, False)
@@ -37,7 +53,7 @@ class ProgressWindow:
         main_frame = ttk.Frame(self.window, padding=20)
         main_frame.pack(fill=tk.BOTH, expand=True)
 
-        self.status_label = ttk.Label(main_frame, text=self.language_manager.get_text("reading_file"),
+        self.status_label = ttk.Label(main_frame, text=status or self.language_manager.get_text("reading_file"),
                                       font=("Microsoft YaHei", 10))
         self.status_label.pack(pady=(0, 10))
 
@@ -72,7 +88,7 @@ class ProgressWindow:
         self.window.geometry(f"+{x}+{y}")
 
     def update_progress(self, current: int, total: int, status: str = ""):
-        if not self.running or self._updating:
+        if not self.running or self._updating or self.cancelling:
             return
         self._updating = True
         try:
@@ -94,7 +110,8 @@ class ProgressWindow:
                 processing_text = self.language_manager.get_text("processing")
                 self.status_label.config(text=f"{processing_text}: {current}/{total}")
 
-            self.window.update()
+            # 由主线程的事件循环调用，只需重绘，不必再处理其他事件
+            self.window.update_idletasks()
         finally:
             self._updating = False
 
@@ -118,3 +135,59 @@ class ProgressWindow:
         if self.window.winfo_exists():
             self.window.grab_release()
             self.window.destroy()
+
+
+class ProgressReporter:
+    """
+    合并后台任务的进度汇报，按固定间隔刷新进度窗口。
+    后台线程调用 report（可直接作为 progress_callback 传入），只记录最新的进度，不访问 Tk；
+    主线程中的一个 after 定时器每 Config.PROGRESS_REFRESH_MS 毫秒读取一次，有变化时才刷新窗口。
+    """
+
+    def __init__(self, root, progress_window: Optional[ProgressWindow] = None):
+        self.root = root
+        self.progress_window: Optional[ProgressWindow] = None
+        # 最新进度 (current, total, status)：整体替换元组，后台线程写、主线程读无需加锁
+        self._latest: Optional[Tuple[int, int, str]] = None
+        self._shown: Optional[Tuple[int, int, str]] = None
+        self._timer = None
+        if progress_window is not None:
+            self.attach(progress_window)
+
+    def report(self, current: int, total: int, status: str = ""):
+        """记录最新进度（可在任意线程中调用）"""
+        self._latest = (current, total, status)
+
+    def attach(self, progress_window: ProgressWindow):
+        """开始刷新进度窗口（在主线程中调用）；窗口创建之前汇报的进度会在第一次刷新时显示"""
+        self.progress_window = progress_window
+        if self._timer is None:
+            self._timer = self.root.after(Config.PROGRESS_REFRESH_MS, self._poll)
+
+    def stop(self):
+        """停止定时器，并把最后一次汇报的进度刷新到窗口（在主线程中调用）"""
+        if self._timer is not None:
+            self.root.after_cancel(self._timer)
+            self._timer = None
+        self._flush()
+
+    def _window_alive(self) -> bool:
+        window = self.progress_window
+        try:
+            return window is not None and window.running and bool(window.window.winfo_exists())
+        except tk.TclError:
+            return False
+
+    def _flush(self):
+        latest = self._latest
+        if latest is not None and latest != self._shown and self._window_alive():
+            self._shown = latest
+            self.progress_window.update_progress(*latest)
+
+    def _poll(self):
+        if not self._window_alive():
+            # 窗口已关闭，不再刷新
+            self._timer = None
+            return
+        self._flush()
+        self._timer = self.root.after(Config.PROGRESS_REFRESH_MS, self._poll)
@@ -0,0 +1,145 @@
+import tkinter as tk
+from typing import Optional, TYPE_CHECKING
+
+from utils.config import Config
+
+if TYPE_CHECKING:
+    from model.document_model import DocumentModel
+
+
+class VirtualDisplay:
+    """
+    虚拟显示：条目很多时文本框只放当前位置附近的一段条目 [start, stop)，
+    滚动到接近这一段的边缘时把修改同步到模型，再从模型换入前后的条目；
+    滚动条按整篇显示文本的行位置显示和跳转。文本框第 1 行对应显示文本的第 base_line 行（从0开始）。
+    未启用时只把文本框和滚动条原样连接起来。
+    """
+
+    def __init__(self, text_widget: tk.Text, scrollbar, controller):
+        self.text = text_widget
+        self.scrollbar = scrollbar
+        self.controller = controller
+        self.model: Optional["DocumentModel"] = None
+        self.active = False
+        self.start = 0
+        self.stop = 0
+        self.entry_count = 0
+        self.base_line = 0
+        self.line_count = 0
+        self._shift_pending = False
+
+        text_widget.configure(yscrollcommand=self._on_text_scrolled)
+        scrollbar.configure(command=self._on_scrollbar)
+
+    def show(self, model: "DocumentModel", top_line: int = 0):
+        """启用虚拟显示，放入显示文本第 top_line 行附近的条目，并让该行位于顶部"""
+        self.model = model
+        self.active = True
+        self._render_around(top_line)
+
+    def deactivate(self):
+        self.active = False
+        self.start = self.stop = self.entry_count = 0
+        self.base_line = self.line_count = 0
+
+    def top_line(self) -> int:
+        """文本框顶部可见的行在显示文本中的行号"""
+        return self.base_line + self._widget_line("@0,0")
+
+    def entries_spliced(self):
+        """文本框中的条目被局部重新解析后调用（见 DocumentModel.reparse_display_lines），更新窗口的条目和行数"""
+        count = len(self.model.entries)
+        self.stop = min(max(self.stop + count - self.entry_count, self.start), count)
+        self.entry_count = count
+        if self.stop == self.start and count:
+            # 窗口中的条目全部被删除
+            self._render_around(self.base_line)
+            return
+        self.line_count = self._window_line_count()
+        self._update_scrollbar()
+
+    # ---------- 内部实现 ----------
+    def _widget_line(self, index: str) -> int:
+        """文本框索引所在的行（从0开始）"""
+        return int(self.text.index(index).split('.')[0]) - 1
+
+    def _window_line_count(self) -> int:
+        if self.stop < self.entry_count:
+            return self.model.display_line_offset(self.stop) - self.base_line
+        return self.model.display_line_count() - self.base_line
+
+    def _render_around(self, top_line: int):
+        """以显示文本第 top_line 行所在的条目为中心重新放入一段条目，保持该行在顶部、光标位置不变"""
+        model = self.model
+        count = len(model.entries)
+        cursor_line = self.base_line + self._widget_line(tk.INSERT)
+        cursor_column = self.text.index(tk.INSERT).split('.')[1]
+
+        top_line = min(max(top_line, 0), max(model.display_line_count() - 1, 0))
+        self.start, self.stop = self._window_around(top_line)
+        self.entry_count = count
+        self.base_line = model.display_line_offset(self.start) if count else 0
+        self.line_count = self._window_line_count() if count else 0
+
+        self.text.delete("1.0", tk.END)
+        self.text.insert("1.0", model.get_display_window(self.start, self.stop))
+        # 撤销记录中的位置属于换出之前的文本
+        self.text.edit_reset()
+        self.text.yview(f"{top_line - self.base_line + 1}.0")
+        if self.base_line <= cursor_line < self.base_line + self.line_count:
+            self.text.mark_set(tk.INSERT, f"{cursor_line - self.base_line + 1}.{cursor_column}")
+        else:
+            self.text.mark_set(tk.INSERT, f"{top_line - self.base_line + 1}.0")
+        self.controller.on_display_refreshed()
+        self._update_scrollbar()
+
+    def _window_around(self, line: int):
+        """以显示文本第 line 行所在的条目为中心的一段条目 [start, stop)"""
+        count = len(self.model.entries)
+        if not count:
+            return 0, 0
+        size = Config.VIRTUAL_DISPLAY_WINDOW_ENTRIES
+        start = max(0, min(self.model.entry_at_display_line(line) - size // 2, count - size))
+        return start, min(count, start + size)
+
+    def _update_scrollbar(self):
+        total = max(self.model.display_line_count(), 1)
+        top = self.top_line()
+        bottom = self.base_line + self._widget_line(f"@0,{self.text.winfo_height()}") + 1
+        self.scrollbar.set(top / total, min(bottom, total) / total)
+
+    def _near_edge(self, first: float, last: float) -> bool:
+        edge = Config.VIRTUAL_DISPLAY_EDGE
+        return (first < edge and self.start > 0) or (last > 1 - edge and self.stop < self.entry_count)
+
+    def _on_text_scrolled(self, first, last):
+        if not self.active:
+            self.scrollbar.set(first, last)
+            return
+        self._update_scrollbar()
+        if not self._shift_pending and self._near_edge(float(first), float(last)):
+            self._shift_pending = True
+            self.text.after_idle(self._shift_window)
+
+    def _shift_window(self):
+        self._shift_pending = False
+        if not self.active or not self._near_edge(*map(float, self.text.yview())):
+            return
+        # 换出之前先把文本框中的修改同步到模型；可见区域比整段条目还大时窗口不再移动
+        self.controller.sync_model_with_editor_if_needed()
+        if self.active and self._window_around(self.top_line()) != (self.start, self.stop):
+            self._render_around(self.top_line())
+
+    def _on_scrollbar(self, *args):
+        if not self.active:
+            self.text.yview(*args)
+            return
+        if args and args[0] == tk.MOVETO:
+            target = int(float(args[1]) * self.model.display_line_count())
+            if self.base_line <= target < self.base_line + self.line_count:
+                self.text.yview(f"{target - self.base_line + 1}.0")
+            else:
+                self.controller.sync_model_with_editor_if_needed()
+                self._render_around(target)
+        else:
+            self.text.yview(*args)